@@ -35,6 +35,8 @@ class Measurable(ABC):
         - OCP: 扩展通过继承实现，不修改本类
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __repr__(self) -> str:
         """
@@ -63,6 +65,8 @@ class Measurable1D(Measurable, ABC):
         - Curve: 一维曲线元素
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def length(self) -> float:
         """
@@ -94,6 +98,8 @@ class Measurable2D(Measurable1D, ABC):
         - Surface: 曲面/平面图形
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def area(self) -> float:
         """
@@ -144,6 +150,8 @@ class Curve(Measurable1D, ABC):
         - ISP: 只暴露曲线相关接口
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __repr__(self) -> str:
         pass
@@ -165,6 +173,8 @@ class Surface(Measurable2D, ABC):
         - ISP: 只暴露曲面相关接口
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def area(self) -> float:
         pass
@@ -23,9 +23,17 @@ planar_geometry/point.py
 """
 
 import math
+import weakref
+from typing import Tuple, Type
 
 from planar_geometry.abstracts import Measurable1D
 
+# 驻留表的键：(x, y, type(x), type(y), x 的符号, y 的符号)
+_InternKey = Tuple[float, float, Type[float], Type[float], float, float]
+
+# 点驻留表：(坐标, 类型, 符号) -> Point2D，弱引用，不阻止点被回收
+_POINT_CACHE: "weakref.WeakValueDictionary[_InternKey, Point2D]" = weakref.WeakValueDictionary()
+
 
 class Point2D(Measurable1D):
     """
@@ -43,12 +51,16 @@ class Point2D(Measurable1D):
     设计原则:
         - 数据结构简单，直接暴露属性便于Cython优化
         - 实现Measurable1D接口，length()返回0
+        - 使用 __slots__ 只存两个坐标（另留 __weakref__ 供 intern() 的弱引用驻留表使用），
+          不为每个点分配实例字典
 
     使用示例:
         p = Point2D(1.0, 2.0)
         print(p.x, p.y)
     """
 
+    __slots__ = ("x", "y", "__weakref__")
+
     def __init__(self, x: float, y: float) -> None:
         """
         初始化二维点
@@ -213,6 +225,40 @@ class Point2D(Measurable1D):
         """
         return Point2D(data[0], data[1])
 
+    @staticmethod
+    def intern(x: float, y: float) -> "Point2D":
+        """
+        获取坐标为 (x, y) 的驻留点（工厂方法）
+
+        说明:
+            - 相同坐标返回同一个 Point2D 实例，减少共享顶点场景（网格、拼接）的重复分配
+            - 驻留表使用弱引用，没有外部引用的点会被正常回收
+            - 以精确坐标为键，不做舍入；键中包含坐标类型与符号位，
+              1 与 1.0、0.0 与 -0.0 各自驻留，返回点的坐标与输入完全一致
+            - 驻留点会被多个图形共享，不应修改其 x、y
+
+        Args:
+            x: float - 横坐标
+            y: float - 纵坐标
+
+        返回:
+            Point2D: 驻留的点实例
+
+        复杂度:
+            O(1)
+
+        使用示例:
+            p1 = Point2D.intern(1.0, 2.0)
+            p2 = Point2D.intern(1.0, 2.0)
+            assert p1 is p2
+        """
+        key = (x, y, type(x), type(y), math.copysign(1.0, x), math.copysign(1.0, y))
+        point = _POINT_CACHE.get(key)
+        if point is None:
+            point = Point2D(x, y)
+            _POINT_CACHE[key] = point
+        return point
+
     @staticmethod
     def origin() -> "Point2D":
         """
@@ -44,6 +44,8 @@ class Circle(Surface):
         print(circle.area())  # 78.54
     """
 
+    __slots__ = ("center", "_radius", "_r_sq", "_r_tol_sq")
+
     TOLERANCE: float = 1e-6
 
     def __init__(self, center: "Point2D", radius: float) -> None:
@@ -57,11 +59,35 @@ class Circle(Surface):
         异常:
             ValueError: 半径为负数
         """
-        if radius < 0:
-            raise ValueError("半径不能为负数")
         self.center = center
         self.radius = radius
 
+    @property
+    def radius(self) -> float:
+        """
+        半径
+
+        说明:
+            - 赋值时同步刷新缓存的 r² 与 (r + TOLERANCE)²
+            - 初始化与重新赋值都会校验半径非负
+
+        返回:
+            float: 半径
+
+        异常:
+            ValueError: 赋值为负数
+        """
+        return self._radius
+
+    @radius.setter
+    def radius(self, radius: float) -> None:
+        if radius < 0:
+            raise ValueError("半径不能为负数")
+        self._radius = radius
+        self._r_sq = radius * radius
+        r_tol = radius + self.TOLERANCE
+        self._r_tol_sq = r_tol * r_tol
+
     @staticmethod
     def from_diameter(p1: "Point2D", p2: "Point2D") -> "Circle":
         """
@@ -115,7 +141,7 @@ class Circle(Surface):
             circle2 = Circle(Point2D(0, 0), 5.0)
             assert abs(circle2.area() - 25 * math.pi) < 1e-9
         """
-        return math.pi * self.radius * self.radius
+        return math.pi * self._r_sq
 
     def perimeter(self) -> float:
         """
@@ -202,6 +228,12 @@ class Circle(Surface):
 
                 |P - C| \\leq r + \\text{tolerance}
 
+            两边平方后比较，无需开方（(r + tolerance)² 在半径赋值时缓存）：
+
+            .. math::
+
+                (x - c_x)^2 + (y - c_y)^2 \\leq (r + \\text{tolerance})^2
+
         判定规则:
             - 距离 < r：点在圆内部
             - 距离 = r（容差内）：点在圆周上
@@ -240,8 +272,29 @@ class Circle(Surface):
             # 圆外的点 (6, 0)
             assert not circle.contains_point(Point2D(6, 0))
         """
-        distance = point.distance_to(self.center)
-        return distance <= self.radius + self.TOLERANCE
+        dx = point.x - self.center.x
+        dy = point.y - self.center.y
+        return dx * dx + dy * dy <= self._r_tol_sq
+
+    def contains_xy(self, x: float, y: float) -> bool:
+        """
+        判断坐标 (x, y) 是否在圆内或圆上
+
+        说明:
+            - 与 contains_point() 判定完全相同，但直接接收浮点坐标，
+              调用方无需为每个查询点创建 Point2D
+            - 参数与缓存量均为纯浮点，可直接对应到编译扩展中的 double 签名
+
+        Args:
+            x: float - 横坐标
+            y: float - 纵坐标
+
+        返回:
+            bool: True 表示点在圆内或圆上
+        """
+        dx = x - self.center.x
+        dy = y - self.center.y
+        return dx * dx + dy * dy <= self._r_tol_sq
 
     def get_circumference(self) -> float:
         """
@@ -26,6 +26,9 @@ from planar_geometry.point import Point2D
 if TYPE_CHECKING:
     from planar_geometry.curve import Vector2D
 
+# 旋转角为 0°、90°、180°、270° 时精确的 (cos, sin)
+_QUADRANT_COS_SIN = ((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0))
+
 
 class Ellipse(Surface):
     """
@@ -46,7 +49,38 @@ class Ellipse(Surface):
         print(ellipse.area())  # 47.12
     """
 
+    __slots__ = (
+        "center",
+        "_semi_major",
+        "_semi_minor",
+        "_rotation",
+        "_cos_r",
+        "_sin_r",
+        "_inv_a2",
+        "_inv_b2",
+        "_focal",
+        "_ecc",
+        "_perimeter",
+        "_area",
+        "_reject",
+    )
+
+    # 由旋转角与轴长派生的缓存，赋值时同步刷新
+    _cos_r: float
+    _sin_r: float
+    _inv_a2: float
+    _inv_b2: float
+    # _from_raw() 创建的椭圆只存 cos/sin，角度延迟计算
+    _rotation: Optional[float]
+    # 由轴长与旋转角派生的缓存，重新赋值时清空为 None，首次使用时计算
+    _focal: Optional[float]
+    _ecc: Optional[float]
+    _perimeter: Optional[float]
+    _area: Optional[float]
+    _reject: Optional[Tuple[float, float]]
+
     TOLERANCE: float = 1e-6
+    TOLERANCE_SQ: float = TOLERANCE * TOLERANCE
 
     def __init__(
         self,
@@ -78,6 +112,113 @@ class Ellipse(Surface):
         self.semi_minor = semi_minor
         self.rotation = rotation
 
+    @property
+    def semi_major(self) -> float:
+        """
+        半长轴长度
+
+        说明:
+            - 赋值时同步刷新缓存的 1/a²，并清空焦距、离心率、周长、面积与包围盒缓存
+
+        返回:
+            float: 半长轴长度
+        """
+        return self._semi_major
+
+    @semi_major.setter
+    def semi_major(self, semi_major: float) -> None:
+        self._semi_major = semi_major
+        sq = semi_major * semi_major
+        self._inv_a2 = 1.0 / sq if sq else math.inf
+        self._focal = None
+        self._ecc = None
+        self._perimeter = None
+        self._area = None
+        self._reject = None
+
+    @property
+    def semi_minor(self) -> float:
+        """
+        半短轴长度
+
+        说明:
+            - 赋值时同步刷新缓存的 1/b²，并清空焦距、离心率、周长、面积与包围盒缓存
+
+        返回:
+            float: 半短轴长度
+        """
+        return self._semi_minor
+
+    @semi_minor.setter
+    def semi_minor(self, semi_minor: float) -> None:
+        self._semi_minor = semi_minor
+        sq = semi_minor * semi_minor
+        self._inv_b2 = 1.0 / sq if sq else math.inf
+        self._focal = None
+        self._ecc = None
+        self._perimeter = None
+        self._area = None
+        self._reject = None
+
+    @property
+    def rotation(self) -> float:
+        """
+        旋转角度（度）
+
+        说明:
+            - 赋值时同步刷新缓存的 cos/sin，各查询方法不再重复做三角运算；并清空包含判定的包围盒缓存
+            - 由 _from_raw() 创建的椭圆只存 cos/sin，角度在首次读取时才计算
+
+        返回:
+            float: 旋转角度（度）
+        """
+        rotation = self._rotation
+        if rotation is None:
+            rotation = self._rotation = math.degrees(math.atan2(self._sin_r, self._cos_r))
+        return rotation
+
+    @rotation.setter
+    def rotation(self, rotation: float) -> None:
+        self._rotation = rotation
+        if rotation % 90 == 0:
+            # 0°/90°/180°/270° 的整数倍直接取精确的 ±1/0，不做三角运算
+            self._cos_r, self._sin_r = _QUADRANT_COS_SIN[int(rotation // 90) % 4]
+        else:
+            rotation_rad = math.radians(rotation)
+            self._cos_r = math.cos(rotation_rad)
+            self._sin_r = math.sin(rotation_rad)
+        self._reject = None
+
+    @staticmethod
+    def _from_raw(
+        center: "Point2D", semi_major: float, semi_minor: float, cos_r: float, sin_r: float
+    ) -> "Ellipse":
+        """
+        由旋转方向的 cos/sin 直接创建椭圆（内部工厂方法）
+
+        说明:
+            - 跳过 角度 → 弧度 → cos/sin 的往返换算，rotation 延迟到首次读取时由 atan2 求出
+            - 不做参数校验，调用方需保证 semi_major >= semi_minor >= 0 且 (cos_r, sin_r) 为单位向量
+
+        Args:
+            center: Point2D - 椭圆中心
+            semi_major: float - 半长轴长度
+            semi_minor: float - 半短轴长度
+            cos_r: float - 长轴方向的余弦
+            sin_r: float - 长轴方向的正弦
+
+        返回:
+            Ellipse: 新椭圆实例
+        """
+        ellipse = Ellipse.__new__(Ellipse)
+        ellipse.center = center
+        ellipse.semi_major = semi_major
+        ellipse.semi_minor = semi_minor
+        ellipse._rotation = None
+        ellipse._cos_r = cos_r
+        ellipse._sin_r = sin_r
+        return ellipse
+
     @staticmethod
     def from_center_and_axes(
         center: "Point2D", major_axis: float, minor_axis: float, rotation: float = 0.0
@@ -103,6 +244,10 @@ class Ellipse(Surface):
         """
         从两个焦点和椭圆上一点创建椭圆（工厂方法）
 
+        说明:
+            - 焦距 2c 与长轴 2a = |PF1| + |PF2| 各用 math.hypot 直接从坐标求出，
+              焦点方向复用同一个焦距归一化，全程三次 hypot 加一次 sqrt
+
         Args:
             focus1: Point2D - 第一个焦点
             focus2: Point2D - 第二个焦点
@@ -111,29 +256,43 @@ class Ellipse(Surface):
         返回:
             Ellipse: 新椭圆实例
         """
-        center = focus1.midpoint_to(focus2)
-        c = focus1.distance_to(center)
-        d = point.distance_to(focus1) + point.distance_to(focus2)
-        major_axis = d
+        f1x, f1y = focus1.x, focus1.y
+        f2x, f2y = focus2.x, focus2.y
+        dx = f2x - f1x
+        dy = f2y - f1y
+        focal_span = math.hypot(dx, dy)
+
+        px, py = point.x, point.y
+        major_axis = math.hypot(px - f1x, py - f1y) + math.hypot(px - f2x, py - f2y)
 
-        if major_axis < 2 * c + Ellipse.TOLERANCE:
+        if major_axis < focal_span + Ellipse.TOLERANCE:
             raise ValueError("焦点间距不能大于等于2a")
 
-        semi_major = major_axis / 2
+        center = Point2D((f1x + f2x) * 0.5, (f1y + f2y) * 0.5)
+        semi_major = major_axis * 0.5
+        c = focal_span * 0.5
         semi_minor = math.sqrt(semi_major * semi_major - c * c)
 
-        rotation = math.degrees(math.atan2(focus2.y - focus1.y, focus2.x - focus1.x))
+        if focal_span == 0.0:
+            return Ellipse._from_raw(center, semi_major, semi_minor, 1.0, 0.0)
 
-        return Ellipse(center, semi_major, semi_minor, rotation)
+        inv_span = 1.0 / focal_span
+        return Ellipse._from_raw(center, semi_major, semi_minor, dx * inv_span, dy * inv_span)
 
     def area(self) -> float:
         """
         计算椭圆面积
 
+        说明:
+            - 结果在首次计算后缓存，轴长重新赋值后失效
+
         返回:
             float: 面积值 (π * a * b)
         """
-        return math.pi * self.semi_major * self.semi_minor
+        area = self._area
+        if area is None:
+            area = self._area = math.pi * self._semi_major * self._semi_minor
+        return area
 
     def perimeter(self) -> float:
         """
@@ -142,94 +301,187 @@ class Ellipse(Surface):
         说明:
             - 使用 Ramanujan 近似公式
             - 较高精度且计算高效
+            - 结果在首次计算后缓存，轴长重新赋值后失效
 
         返回:
             float: 周长近似值
         """
-        a = self.semi_major
-        b = self.semi_minor
+        perimeter = self._perimeter
+        if perimeter is None:
+            perimeter = self._perimeter = _ramanujan_perimeter(self._semi_major, self._semi_minor)
+        return perimeter
+
+    @staticmethod
+    def perimeters(semi_majors: List[float], semi_minors: List[float]) -> List[float]:
+        """
+        批量计算多个椭圆的周长
+
+        说明:
+            - 与逐个调用 perimeter() 使用同一 Ramanujan 公式，无需先创建 Ellipse 实例
 
-        h = ((a - b) * (a - b)) / ((a + b) * (a + b))
+        Args:
+            semi_majors: List[float] - 半长轴长度列表
+            semi_minors: List[float] - 半短轴长度列表（与 semi_majors 一一对应）
 
-        return math.pi * (a + b) * (1 + (3 * h) / (10 + math.sqrt(4 - 3 * h)))
+        返回:
+            List[float]: 周长近似值列表
+
+        复杂度:
+            O(m) - m 为椭圆个数
+        """
+        return list(map(_ramanujan_perimeter, semi_majors, semi_minors))
 
     def eccentricity(self) -> float:
         """
         获取离心率
 
+        说明:
+            - e = c / a，与 sqrt(1 - b²/a²) 等价，复用缓存的焦距
+            - 结果在首次计算后缓存，轴长重新赋值后失效
+
         返回:
             float: 离心率 e = sqrt(1 - b²/a²)
         """
-        if self.semi_major < self.TOLERANCE:
-            return 0.0
-
-        return math.sqrt(
-            1
-            - (self.semi_minor * self.semi_minor) / (self.semi_major * self.semi_major)
-        )
+        ecc = self._ecc
+        if ecc is None:
+            a = self._semi_major
+            ecc = self._ecc = 0.0 if a < self.TOLERANCE else self.focal_distance() / a
+        return ecc
 
     def focal_distance(self) -> float:
         """
         获取焦距（两焦点间距的一半）
 
+        说明:
+            - 结果在首次计算后缓存，轴长重新赋值后失效
+
         返回:
             float: 焦距 c = sqrt(a² - b²)
         """
-        return math.sqrt(
-            self.semi_major * self.semi_major - self.semi_minor * self.semi_minor
-        )
+        focal = self._focal
+        if focal is None:
+            a = self._semi_major
+            b = self._semi_minor
+            focal = self._focal = math.sqrt(max(a * a - b * b, 0.0))
+        return focal
 
     def foci(self) -> Tuple["Point2D", "Point2D"]:
         """
         获取两个焦点
 
+        说明:
+            - 坐标由 foci_xy() 计算，此处仅包装为 Point2D
+
         返回:
             Tuple[Point2D, Point2D]: (focus1, focus2)
         """
-        c = self.focal_distance()
-        rotation_rad = math.radians(self.rotation)
+        x1, y1, x2, y2 = self.foci_xy()
+        return (Point2D(x1, y1), Point2D(x2, y2))
+
+    def foci_xy(self) -> Tuple[float, float, float, float]:
+        """
+        获取两个焦点的坐标
+
+        说明:
+            - 直接返回浮点坐标，不创建 Point2D，适用于只需要数值的调用方
+
+        返回:
+            Tuple[float, float, float, float]: (x1, y1, x2, y2)
+        """
+        return self._axis_xy(self.focal_distance(), self._cos_r, self._sin_r)
+
+    @staticmethod
+    def foci_array(
+        params: List[Tuple[float, float, float, float]],
+    ) -> List[Tuple[float, float, float, float]]:
+        """
+        批量计算多个椭圆的焦点坐标（不创建 Ellipse 与 Point2D）
+
+        说明:
+            - 每行参数为 (cx, cy, c, rotation_rad)，旋转角直接以弧度给出，省去逐行的角度换算
+            - 已有 Ellipse 实例时，使用 foci_xy() 可直接复用缓存的 cos/sin
+
+        Args:
+            params: List[Tuple[float, float, float, float]] - (中心 x, 中心 y, 焦距 c, 旋转弧度)
+
+        返回:
+            List[Tuple[float, float, float, float]]: 每个椭圆的 (x1, y1, x2, y2)
 
-        dx = c * math.cos(rotation_rad)
-        dy = c * math.sin(rotation_rad)
+        复杂度:
+            O(m) - m 为椭圆个数
+        """
+        cos, sin = math.cos, math.sin
+        result = []
+        for cx, cy, c, rotation_rad in params:
+            dx = c * cos(rotation_rad)
+            dy = c * sin(rotation_rad)
+            result.append((cx - dx, cy - dy, cx + dx, cy + dy))
+        return result
+
+    def _axis_xy(
+        self, length: float, cos_d: float, sin_d: float
+    ) -> Tuple[float, float, float, float]:
+        """
+        沿方向 (cos_d, sin_d) 距中心 length 的两个对称点坐标
 
-        focus1 = Point2D(self.center.x - dx, self.center.y - dy)
-        focus2 = Point2D(self.center.x + dx, self.center.y + dy)
+        Args:
+            length: float - 到中心的距离
+            cos_d: float - 方向余弦
+            sin_d: float - 方向正弦
 
-        return (focus1, focus2)
+        返回:
+            Tuple[float, float, float, float]: (x1, y1, x2, y2)，先负方向后正方向
+        """
+        cx, cy = self.center.x, self.center.y
+        dx = length * cos_d
+        dy = length * sin_d
+        return (cx - dx, cy - dy, cx + dx, cy + dy)
 
     def get_bounds(self) -> tuple:
         """
         获取轴对齐边界框 (AABB)
 
+        说明:
+            - 返回紧致包围盒：旋转椭圆在 x、y 方向上的真实半宽/半高为
+
+            .. math::
+
+                w = \\sqrt{a^2 \\cos^2 r + b^2 \\sin^2 r}, \\quad
+                h = \\sqrt{a^2 \\sin^2 r + b^2 \\cos^2 r}
+
+            - 旋转角接近 180° 的整数倍（sin² r < TOLERANCE²，含 -180°、360°）时省去开方，
+              返回外扩后的 (a + b|sin r|, b + a|sin r|)，仍保证包含整个椭圆
+            - 旋转角接近 90°、270° 等（cos² r < TOLERANCE²）时长短轴互换，
+              同样返回外扩后的 (b + a|cos r|, a + b|cos r|)
+
         返回:
             tuple: (x_min, y_min, x_max, y_max)
         """
-        a = self.semi_major
-        b = self.semi_minor
+        a = self._semi_major
+        b = self._semi_minor
+        cx, cy = self.center.x, self.center.y
 
-        if (
-            abs(self.rotation) < self.TOLERANCE
-            or abs(self.rotation - 180) < self.TOLERANCE
-        ):
-            return (
-                self.center.x - a,
-                self.center.y - b,
-                self.center.x + a,
-                self.center.y + b,
-            )
+        sin_sq = self._sin_r * self._sin_r
+        if sin_sq < self.TOLERANCE_SQ:
+            sin_abs = abs(self._sin_r)
+            half_width = a + b * sin_abs
+            half_height = b + a * sin_abs
+            return (cx - half_width, cy - half_height, cx + half_width, cy + half_height)
 
-        cos_r = abs(math.cos(math.radians(self.rotation)))
-        sin_r = abs(math.sin(math.radians(self.rotation)))
+        cos_sq = self._cos_r * self._cos_r
+        if cos_sq < self.TOLERANCE_SQ:
+            cos_abs = abs(self._cos_r)
+            half_width = b + a * cos_abs
+            half_height = a + b * cos_abs
+            return (cx - half_width, cy - half_height, cx + half_width, cy + half_height)
 
-        half_width = a * cos_r + b * sin_r
-        half_height = a * sin_r + b * cos_r
+        a2 = a * a
+        b2 = b * b
 
-        return (
-            self.center.x - half_width,
-            self.center.y - half_height,
-            self.center.x + half_width,
-            self.center.y + half_height,
-        )
+        half_width = math.sqrt(a2 * cos_sq + b2 * sin_sq)
+        half_height = math.sqrt(a2 * sin_sq + b2 * cos_sq)
+
+        return (cx - half_width, cy - half_height, cx + half_width, cy + half_height)
 
     def get_center(self) -> "Point2D":
         """
@@ -240,13 +492,41 @@ class Ellipse(Surface):
         """
         return self.center
 
+    def _get_reject(self) -> Tuple[float, float]:
+        """
+        获取包含判定用的快速排除半宽/半高
+
+        说明:
+            - 椭圆方程容差 1 + TOLERANCE 下可接受的点位于按 sqrt(1 + TOLERANCE) 放大的椭圆内，
+              其包围盒半宽/半高不超过精确值乘以 1 + TOLERANCE，超出即可直接排除
+            - 始终使用精确的 sqrt 公式（不走 get_bounds() 的轴对齐近似），保证不误排除
+            - 首次调用时计算，轴长或旋转角重新赋值后失效；与中心无关，移动中心无需刷新
+
+        返回:
+            Tuple[float, float]: (半宽上界, 半高上界)
+        """
+        reject = self._reject
+        if reject is None:
+            a2 = self._semi_major * self._semi_major
+            b2 = self._semi_minor * self._semi_minor
+            cos_sq = self._cos_r * self._cos_r
+            sin_sq = self._sin_r * self._sin_r
+            pad = 1.0 + self.TOLERANCE
+            reject = self._reject = (
+                math.sqrt(a2 * cos_sq + b2 * sin_sq) * pad,
+                math.sqrt(a2 * sin_sq + b2 * cos_sq) * pad,
+            )
+        return reject
+
     def contains_point(self, point: "Point2D") -> bool:
         """
         判断点是否在椭圆内或边界上
 
         说明:
             - 使用椭圆方程判断
-            - 考虑旋转角度
+            - 考虑旋转角度（使用缓存的 cos/sin 与 1/a²、1/b²）
+            - 退化椭圆（轴长为 0）不包含任何点
+            - 先用缓存的包围盒半宽/半高做 4 次比较的快速排除，远处的点无需代入椭圆方程
 
         Args:
             point: Point2D - 待检测点
@@ -256,21 +536,90 @@ class Ellipse(Surface):
         """
         dx = point.x - self.center.x
         dy = point.y - self.center.y
+        reject_x, reject_y = self._get_reject()
+        if dx > reject_x or dx < -reject_x or dy > reject_y or dy < -reject_y:
+            return False
 
-        rotation_rad = math.radians(self.rotation)
-        cos_r = math.cos(rotation_rad)
-        sin_r = math.sin(rotation_rad)
+        cos_r = self._cos_r
+        sin_r = self._sin_r
 
         x_rot = dx * cos_r + dy * sin_r
         y_rot = -dx * sin_r + dy * cos_r
 
-        a = self.semi_major
-        b = self.semi_minor
+        value = (x_rot * x_rot) * self._inv_a2 + (y_rot * y_rot) * self._inv_b2
+
+        return value <= 1.0 + self.TOLERANCE
+
+    def contains_xy(self, x: float, y: float) -> bool:
+        """
+        判断坐标 (x, y) 是否在椭圆内或边界上
+
+        说明:
+            - 与 contains_point() 判定完全相同，但直接接收浮点坐标，
+              调用方无需为每个查询点创建 Point2D
+            - 参数与缓存量均为纯浮点，可直接对应到编译扩展中的 double 签名
+
+        Args:
+            x: float - 横坐标
+            y: float - 纵坐标
 
-        value = (x_rot * x_rot) / (a * a) + (y_rot * y_rot) / (b * b)
+        返回:
+            bool: True 表示点在椭圆内或边界上
+        """
+        dx = x - self.center.x
+        dy = y - self.center.y
+        reject_x, reject_y = self._get_reject()
+        if dx > reject_x or dx < -reject_x or dy > reject_y or dy < -reject_y:
+            return False
+
+        cos_r = self._cos_r
+        sin_r = self._sin_r
+
+        x_rot = dx * cos_r + dy * sin_r
+        y_rot = -dx * sin_r + dy * cos_r
+
+        value = (x_rot * x_rot) * self._inv_a2 + (y_rot * y_rot) * self._inv_b2
 
         return value <= 1.0 + self.TOLERANCE
 
+    def contains_points(self, points: List["Point2D"]) -> List[bool]:
+        """
+        批量判断多个点是否在椭圆内或边界上
+
+        说明:
+            - 结果与逐点调用 contains_point() 一致
+            - 缓存的旋转角 cos/sin 与 1/a²、1/b² 只读取一次，由所有查询点共享
+            - 包围盒外的点经 4 次比较即被排除
+
+        Args:
+            points: List[Point2D] - 待检测点列表
+
+        返回:
+            List[bool]: 与 points 一一对应的判断结果
+
+        复杂度:
+            O(m) - m 为查询点数
+        """
+        cx, cy = self.center.x, self.center.y
+        cos_r = self._cos_r
+        sin_r = self._sin_r
+        inv_a2 = self._inv_a2
+        inv_b2 = self._inv_b2
+        limit = 1.0 + self.TOLERANCE
+        reject_x, reject_y = self._get_reject()
+
+        result = []
+        for point in points:
+            dx = point.x - cx
+            dy = point.y - cy
+            if dx > reject_x or dx < -reject_x or dy > reject_y or dy < -reject_y:
+                result.append(False)
+                continue
+            x_rot = dx * cos_r + dy * sin_r
+            y_rot = -dx * sin_r + dy * cos_r
+            result.append((x_rot * x_rot) * inv_a2 + (y_rot * y_rot) * inv_b2 <= limit)
+        return result
+
     def get_major_axis_endpoints(self) -> Tuple["Point2D", "Point2D"]:
         """
         获取长轴的两个端点
@@ -278,17 +627,17 @@ class Ellipse(Surface):
         返回:
             Tuple[Point2D, Point2D]: (end1, end2)
         """
-        rotation_rad = math.radians(self.rotation)
-        cos_r = math.cos(rotation_rad)
-        sin_r = math.sin(rotation_rad)
+        x1, y1, x2, y2 = self.major_axis_xy()
+        return (Point2D(x1, y1), Point2D(x2, y2))
 
-        dx = self.semi_major * cos_r
-        dy = self.semi_major * sin_r
-
-        end1 = Point2D(self.center.x - dx, self.center.y - dy)
-        end2 = Point2D(self.center.x + dx, self.center.y + dy)
+    def major_axis_xy(self) -> Tuple[float, float, float, float]:
+        """
+        获取长轴两个端点的坐标（不创建 Point2D）
 
-        return (end1, end2)
+        返回:
+            Tuple[float, float, float, float]: (x1, y1, x2, y2)
+        """
+        return self._axis_xy(self._semi_major, self._cos_r, self._sin_r)
 
     def get_minor_axis_endpoints(self) -> Tuple["Point2D", "Point2D"]:
         """
@@ -297,17 +646,20 @@ class Ellipse(Surface):
         返回:
             Tuple[Point2D, Point2D]: (end1, end2)
         """
-        rotation_rad = math.radians(self.rotation + 90)
-        cos_r = math.cos(rotation_rad)
-        sin_r = math.sin(rotation_rad)
+        x1, y1, x2, y2 = self.minor_axis_xy()
+        return (Point2D(x1, y1), Point2D(x2, y2))
 
-        dx = self.semi_minor * cos_r
-        dy = self.semi_minor * sin_r
+    def minor_axis_xy(self) -> Tuple[float, float, float, float]:
+        """
+        获取短轴两个端点的坐标（不创建 Point2D）
 
-        end1 = Point2D(self.center.x - dx, self.center.y - dy)
-        end2 = Point2D(self.center.x + dx, self.center.y + dy)
+        说明:
+            - 短轴方向为旋转角 + 90°：cos(r + 90°) = -sin r，sin(r + 90°) = cos r
 
-        return (end1, end2)
+        返回:
+            Tuple[float, float, float, float]: (x1, y1, x2, y2)
+        """
+        return self._axis_xy(self._semi_minor, -self._sin_r, self._cos_r)
 
     def equals(self, other: object, tolerance: float = 1e-6) -> bool:
         """
@@ -323,13 +675,54 @@ class Ellipse(Surface):
         if not isinstance(other, Ellipse):
             return False
 
+        center = self.center
+        other_center = other.center
         return (
-            self.center.equals(other.center, tolerance)
+            abs(center.x - other_center.x) < tolerance
+            and abs(center.y - other_center.y) < tolerance
             and abs(self.semi_major - other.semi_major) < tolerance
             and abs(self.semi_minor - other.semi_minor) < tolerance
             and abs(self.rotation - other.rotation) < tolerance
         )
 
+    def equals_batch(self, others: List[object], tolerance: float = 1e-6) -> List[bool]:
+        """
+        批量判断与多个对象是否相等
+
+        说明:
+            - 结果与逐个调用 equals() 一致
+            - 本椭圆的五个参数只读取一次，由所有比较共享，适用于批量去重
+
+        Args:
+            others: List[object] - 比较对象列表
+            tolerance: float - 容差
+
+        返回:
+            List[bool]: 与 others 一一对应的判断结果
+
+        复杂度:
+            O(m) - m 为比较对象个数
+        """
+        cx, cy = self.center.x, self.center.y
+        a = self.semi_major
+        b = self.semi_minor
+        rotation = self.rotation
+
+        result = []
+        for other in others:
+            if not isinstance(other, Ellipse):
+                result.append(False)
+                continue
+            other_center = other.center
+            result.append(
+                abs(cx - other_center.x) < tolerance
+                and abs(cy - other_center.y) < tolerance
+                and abs(a - other.semi_major) < tolerance
+                and abs(b - other.semi_minor) < tolerance
+                and abs(rotation - other.rotation) < tolerance
+            )
+        return result
+
     def __eq__(self, other: object) -> bool:
         return self.equals(other)
 
@@ -342,6 +735,33 @@ class Ellipse(Surface):
         )
 
 
+def _ramanujan_perimeter(a: float, b: float) -> float:
+    """
+    Ramanujan 第二近似公式求椭圆周长（纯浮点运算）
+
+    .. math::
+
+        h = \\left( \\frac{a - b}{a + b} \\right)^2, \\quad
+        L \\approx \\pi (a + b) \\left( 1 + \\frac{3h}{10 + \\sqrt{4 - 3h}} \\right)
+
+    说明:
+        - 3h 只计算一次，同时用于分子与根号内，依赖链为一次除法、一次开方
+
+    Args:
+        a: float - 半长轴长度
+        b: float - 半短轴长度
+
+    返回:
+        float: 周长近似值；a + b 为 0 时返回 0
+    """
+    s = a + b
+    if s == 0.0:
+        return 0.0
+    t = (a - b) / s
+    h3 = 3.0 * (t * t)
+    return math.pi * s * (1.0 + h3 / (10.0 + math.sqrt(4.0 - h3)))
+
+
 from planar_geometry.point import Point2D
 from planar_geometry.curve import Vector2D, LineSegment
 from planar_geometry.utils import line_segment_intersection
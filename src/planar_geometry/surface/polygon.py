@@ -12,21 +12,33 @@ planar_geometry/surface/polygon.py
     - planar_geometry.point: Point2D类
     - planar_geometry.curve: 曲线类
     - math: 数学模块
+    - itertools: 迭代工具
+    - operator: 函数式运算符
 
 使用示例:
     from planar_geometry import Polygon
 """
 
 import math
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from itertools import islice
+from operator import itemgetter
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Tuple, Union
 
 from planar_geometry.abstracts import Surface
 from planar_geometry.point import Point2D
-from planar_geometry.curve import LineSegment
 
 if TYPE_CHECKING:
     from planar_geometry.curve import Vector2D
 
+# 凸包计算启用内部点预过滤的最少点数；点数较少时过滤本身的开销大于收益
+_HULL_FILTER_MIN = 32
+
+# 非凸多边形点包含启用水平分带边索引的最少顶点数
+_SLAB_MIN = 32
+
+# 分带边索引 (y_lo, inv_h, last, buckets)，buckets[k] 为第 k 个分带内的 (x1, y1, x2, y2) 边元组
+_Slabs = Tuple[float, float, int, Tuple[Tuple[Tuple[float, float, float, float], ...], ...]]
+
 
 class Polygon(Surface):
     """
@@ -60,6 +72,38 @@ class Polygon(Surface):
         print(quad.area())  # 12.0
     """
 
+    __slots__ = (
+        "_vertices",
+        "_xy",
+        "_xs_ys",
+        "_halfplanes",
+        "_area",
+        "_perimeter",
+        "_convex",
+        "_strict_convex",
+        "_simple",
+        "_bounds",
+        "_slabs",
+        "_edge_boxes",
+        "_regular",
+        "_center",
+    )
+
+    # 由顶点派生的缓存，_invalidate_cache() 重置为 None，首次使用时计算
+    _xy: Optional[Tuple[Tuple[float, float], ...]]
+    _xs_ys: Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]]
+    _halfplanes: Optional[Tuple[Tuple[float, float, float, float], ...]]
+    _area: Optional[float]
+    _perimeter: Optional[float]
+    _convex: Optional[bool]
+    _strict_convex: Optional[bool]
+    _simple: Optional[bool]
+    _bounds: Optional[Tuple[float, float, float, float]]
+    _center: Optional[Tuple[float, float]]
+    _edge_boxes: Optional[Tuple[Tuple[float, float, float, float], ...]]
+    _slabs: Optional[Union[_Slabs, Tuple[()]]]
+    _regular: Optional[bool]
+
     TOLERANCE: float = 1e-6
 
     def __init__(self, vertices: List["Point2D"]) -> None:
@@ -80,6 +124,88 @@ class Polygon(Surface):
             raise ValueError("多边形至少有3个顶点")
         self.vertices = vertices
 
+    @property
+    def vertices(self) -> List["Point2D"]:
+        """
+        顶点列表
+
+        说明:
+            - 重新赋值时清空由顶点派生的缓存
+            - 原地修改列表元素不会清空缓存，应整体重新赋值
+
+        返回:
+            List[Point2D]: 顶点列表（逆时针）
+        """
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices: List["Point2D"]) -> None:
+        self._vertices = vertices
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """
+        清空由顶点派生的缓存
+
+        说明:
+            - 顶点重新赋值时调用
+            - 子类缓存派生量时应覆盖此方法并调用 super()
+        """
+        self._xy = None
+        self._xs_ys = None
+        self._halfplanes = None
+        self._area = None
+        self._perimeter = None
+        self._convex = None
+        self._strict_convex = None
+        self._simple = None
+        self._bounds = None
+        self._slabs = None
+        self._edge_boxes = None
+        self._regular = None
+        self._center = None
+
+    def _get_xy(self) -> Tuple[Tuple[float, float], ...]:
+        """
+        获取缓存的顶点坐标
+
+        说明:
+            - 首次调用时从顶点提取，顶点重新赋值后失效
+            - 纯浮点元组，面积、周长等循环不再逐个访问 Point2D 属性
+
+        返回:
+            tuple: ((x0, y0), (x1, y1), ...)
+        """
+        xy = self._xy
+        if xy is None:
+            xy = tuple([(p.x, p.y) for p in self.vertices])
+            self._xy = xy
+        return xy
+
+    def _get_xs_ys(self) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        """
+        获取缓存的顶点坐标（按分量分开存放）
+
+        说明:
+            - 供 area()、get_center()、_is_convex 等按分量访问的浮点内核使用
+            - 已有 _xy 缓存时直接转置；否则直接从顶点提取两个分量，
+              避免只需分量时还要先构建一遍点对元组
+
+        返回:
+            tuple: (xs, ys)，分别为全部顶点的 x、y 坐标元组
+        """
+        xs_ys = self._xs_ys
+        if xs_ys is None:
+            xy = self._xy
+            if xy is not None:
+                xs, ys = zip(*xy, strict=True)
+                xs_ys = (xs, ys)
+            else:
+                vertices = self.vertices
+                xs_ys = (tuple([p.x for p in vertices]), tuple([p.y for p in vertices]))
+            self._xs_ys = xs_ys
+        return xs_ys
+
     @staticmethod
     def from_points(points: List["Point2D"]) -> "Polygon":
         """
@@ -94,15 +220,60 @@ class Polygon(Surface):
         return Polygon(points)
 
     @staticmethod
-    def regular(n: int, center: "Point2D", radius: float, rotation: float = 0.0) -> "Polygon":
+    def from_coords(xs: Sequence[float], ys: Sequence[float], intern: bool = False) -> "Polygon":
+        """
+        从分量坐标序列创建多边形（工厂方法）
+
+        说明:
+            - 适用于坐标已按分量存放（如从文件或其他库批量读入）的场景
+            - 直接用输入坐标预填 _xy 与 _xs_ys 缓存，面积、包含判断等首次调用时
+              无需再从 Point2D 顶点逐个提取坐标
+            - intern=True 时相邻多边形的公共顶点共享同一 Point2D 实例（适合网格）
+
+        Args:
+            xs: Sequence[float] - 顶点 x 坐标
+            ys: Sequence[float] - 顶点 y 坐标（与 xs 一一对应）
+            intern: bool - 是否使用 Point2D.intern 共享相同坐标的顶点
+
+        返回:
+            Polygon: 新多边形实例
+
+        异常:
+            ValueError: xs 与 ys 长度不同，或顶点数少于3
+
+        使用示例::
+
+            square = Polygon.from_coords([0, 1, 1, 0], [0, 0, 1, 1])
+            assert square.area() == 1.0
+        """
+        xs = tuple(xs)
+        ys = tuple(ys)
+        if len(xs) != len(ys):
+            raise ValueError("x、y 坐标数量必须相同")
+        make = Point2D.intern if intern else Point2D
+        polygon = Polygon(list(map(make, xs, ys)))
+        polygon._xy = tuple(zip(xs, ys, strict=True))
+        polygon._xs_ys = (xs, ys)
+        return polygon
+
+    @staticmethod
+    def regular(
+        n: int, center: "Point2D", radius: float, rotation: float = 0.0, intern: bool = False
+    ) -> "Polygon":
         """
         创建正多边形（工厂方法）
 
+        说明:
+            - 先生成全部角度，再一次性推导顶点坐标，循环内不做属性查找
+            - 坐标已是浮点数，直接预填 _xy / _xs_ys 缓存，后续面积、周长、包含判定
+              无需再从 Point2D 逐个提取
+
         Args:
             n: int - 边数
             center: Point2D - 中心点
             radius: float - 外接圆半径
             rotation: float - 旋转角度（度）
+            intern: bool - 是否使用 Point2D.intern 共享相同坐标的顶点
 
         返回:
             Polygon: 正多边形实例
@@ -113,17 +284,16 @@ class Polygon(Surface):
         if n < 3:
             raise ValueError("正多边形至少有3边")
 
-        vertices = []
         angle_step = 2.0 * math.pi / n
         rotation_rad = math.radians(rotation)
+        cx, cy = center.x, center.y
+        cos, sin = math.cos, math.sin
 
-        for i in range(n):
-            angle = i * angle_step + rotation_rad
-            x = center.x + radius * math.cos(angle)
-            y = center.y + radius * math.sin(angle)
-            vertices.append(Point2D(x, y))
+        angles = [i * angle_step + rotation_rad for i in range(n)]
+        xs = tuple([cx + radius * cos(a) for a in angles])
+        ys = tuple([cy + radius * sin(a) for a in angles])
 
-        return Polygon(vertices)
+        return Polygon.from_coords(xs, ys, intern)
 
     @staticmethod
     def triangle(p1: "Point2D", p2: "Point2D", p3: "Point2D") -> "Polygon":
@@ -181,6 +351,7 @@ class Polygon(Surface):
             - 时间复杂度线性于顶点数 O(n)
             - 对于凸多边形和凹多边形都适用
             - 顶点顺序（顺时针或逆时针）不影响面积大小
+            - 结果在首次计算后缓存，顶点重新赋值后失效
 
         返回:
             float: 多边形的面积（非负）
@@ -204,13 +375,11 @@ class Polygon(Surface):
             tri = Polygon([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
             assert abs(tri.area() - 6.0) < 1e-9
         """
-        n = len(self.vertices)
-        area_sum = 0.0
-        for i in range(n):
-            x1, y1 = self.vertices[i].x, self.vertices[i].y
-            x2, y2 = self.vertices[(i + 1) % n].x, self.vertices[(i + 1) % n].y
-            area_sum += x1 * y2 - x2 * y1
-        return abs(area_sum) / 2.0
+        area = self._area
+        if area is None:
+            xs, ys = self._get_xs_ys()
+            area = self._area = _shoelace(xs, ys)
+        return area
 
     def test_simple_math(self) -> float:
         """
@@ -232,6 +401,10 @@ class Polygon(Surface):
 
             其中 :math:`|P_{i} P_{i+1}|` 表示相邻两个顶点之间的欧氏距离。
 
+        说明:
+            - 在缓存的坐标元组上用 map(math.dist, ...) 求和，循环在 C 层完成
+            - 结果在首次计算后缓存，顶点重新赋值后失效
+
         返回:
             float: 多边形的周长
 
@@ -254,22 +427,38 @@ class Polygon(Surface):
             tri = Polygon([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
             assert abs(tri.perimeter() - 12.0) < 1e-9
         """
-        n = len(self.vertices)
-        perimeter_sum = 0.0
-        for i in range(n):
-            perimeter_sum += self.vertices[i].distance_to(self.vertices[(i + 1) % n])
-        return perimeter_sum
+        perimeter = self._perimeter
+        if perimeter is None:
+            perimeter = self._perimeter = _closed_length(self._get_xy())
+        return perimeter
 
     def get_bounds(self) -> tuple:
         """
         获取轴对齐边界框 (AABB)
 
+        说明:
+            - 在缓存的坐标对上单次遍历同时求 x、y 的最值，
+              比对 xs、ys 分别调用 min()/max() 的四次遍历更快
+            - 结果在首次计算后缓存，顶点重新赋值后失效
+
         返回:
             tuple: (x_min, y_min, x_max, y_max)
         """
-        x_vals = [p.x for p in self.vertices]
-        y_vals = [p.y for p in self.vertices]
-        return (min(x_vals), min(y_vals), max(x_vals), max(y_vals))
+        bounds = self._bounds
+        if bounds is None:
+            xy = self._get_xy()
+            x_min, y_min = x_max, y_max = xy[0]
+            for x, y in xy:
+                if x < x_min:
+                    x_min = x
+                elif x > x_max:
+                    x_max = x
+                if y < y_min:
+                    y_min = y
+                elif y > y_max:
+                    y_max = y
+            bounds = self._bounds = (x_min, y_min, x_max, y_max)
+        return bounds
 
     def get_center(self) -> "Point2D":
         """
@@ -278,14 +467,18 @@ class Polygon(Surface):
         说明:
             - 计算所有顶点的平均值
             - 对于简单多边形是合理的近似
+            - 坐标在首次计算后缓存，顶点重新赋值后失效；每次返回新的 Point2D，
+              调用方修改返回值不会影响缓存
 
         返回:
             Point2D: 中心坐标
         """
-        n = len(self.vertices)
-        x = sum(p.x for p in self.vertices) / n
-        y = sum(p.y for p in self.vertices) / n
-        return Point2D(x, y)
+        center = self._center
+        if center is None:
+            xs, ys = self._get_xs_ys()
+            n = len(xs)
+            center = self._center = (sum(xs) / n, sum(ys) / n)
+        return Point2D(center[0], center[1])
 
     def centroid(self) -> "Point2D":
         """
@@ -304,11 +497,64 @@ class Polygon(Surface):
         """
         获取所有边
 
+        说明:
+            - 把顶点列表与错位一格的闭合副本直接 zip，边的配对在 C 层完成，无需取模
+
         返回:
             List[Tuple[Point2D, Point2D]]: 边列表
         """
-        n = len(self.vertices)
-        return [(self.vertices[i], self.vertices[(i + 1) % n]) for i in range(n)]
+        vertices = self.vertices
+        return list(zip(vertices, vertices[1:] + vertices[:1], strict=True))
+
+    def iter_edges(self) -> Iterator[Tuple["Point2D", "Point2D"]]:
+        """
+        逐条迭代所有边（生成器）
+
+        说明:
+            - 顺序与 get_edges() 相同：(P0, P1), (P1, P2), ..., (Pn-1, P0)
+            - 不构造完整的边列表，适合只需遍历一次的场景
+
+        返回:
+            Iterator[Tuple[Point2D, Point2D]]: 边迭代器
+        """
+        vertices = iter(self.vertices)
+        first = prev = next(vertices)
+        for cur in vertices:
+            yield (prev, cur)
+            prev = cur
+        yield (prev, first)
+
+    def _get_edge_boxes(self) -> Tuple[Tuple[float, float, float, float], ...]:
+        """
+        获取缓存的各边包围盒
+
+        说明:
+            - 首次调用时计算，顶点重新赋值后失效
+            - 顺序与 get_edges() 相同；每个包围盒按 TOLERANCE · (1 + |dx| + |dy|) 外扩，
+              远大于 line_segment_intersection 的参数容差，包围盒不重叠的两条边不可能被判为相交
+            - 供 is_simple() 的扫描与 polygon_intersection_points() 的边对剪枝共用
+
+        返回:
+            tuple: 每条边的 (x_lo, x_hi, y_lo, y_hi)
+        """
+        boxes = self._edge_boxes
+        if boxes is None:
+            xy = self._get_xy()
+            tol = self.TOLERANCE
+            box_list = []
+            for (x1, y1), (x2, y2) in zip(xy, xy[1:] + xy[:1], strict=True):
+                pad = tol * (1.0 + abs(x2 - x1) + abs(y2 - y1))
+                if x1 < x2:
+                    x_lo, x_hi = x1 - pad, x2 + pad
+                else:
+                    x_lo, x_hi = x2 - pad, x1 + pad
+                if y1 < y2:
+                    y_lo, y_hi = y1 - pad, y2 + pad
+                else:
+                    y_lo, y_hi = y2 - pad, y1 + pad
+                box_list.append((x_lo, x_hi, y_lo, y_hi))
+            boxes = self._edge_boxes = tuple(box_list)
+        return boxes
 
     def get_edge_count(self) -> int:
         """
@@ -333,28 +579,33 @@ class Polygon(Surface):
         获取指定索引的顶点
 
         Args:
-            index: int - 索引（支持负数）
+            index: int - 索引（支持负数，超出范围时按顶点数循环）
 
         返回:
             Point2D: 顶点坐标
         """
-        n = len(self.vertices)
-        idx = index % n
-        return self.vertices[idx]
+        vertices = self.vertices
+        n = len(vertices)
+        if 0 <= index < n:
+            return vertices[index]
+        return vertices[index % n]
 
     def get_edge(self, index: int) -> tuple:
         """
         获取指定索引的边
 
         Args:
-            index: int - 边索引
+            index: int - 边索引（支持负数，超出范围时按边数循环）
 
         返回:
             Tuple[Point2D, Point2D]: 边
         """
-        n = len(self.vertices)
-        idx = index % n
-        return (self.vertices[idx], self.vertices[(idx + 1) % n])
+        vertices = self.vertices
+        n = len(vertices)
+        if not 0 <= index < n:
+            index %= n
+        # 只有最后一条边需要回绕到首顶点
+        return (vertices[index], vertices[index + 1] if index + 1 < n else vertices[0])
 
     def contains_point(self, point: "Point2D") -> bool:
         """
@@ -370,6 +621,9 @@ class Polygon(Surface):
             - 交点数为偶数：点在多边形外部
             - 点在边界或顶点上：特殊判断
 
+            非凸多边形先用缓存的包围盒排除远处的点，再在同一次遍历中做射线投射与边界检查；
+            凸多边形直接使用缓存的半平面方程判定。
+
             算法步骤：
 
             1. 初始化计数器为 0
@@ -409,31 +663,251 @@ class Polygon(Surface):
             # 边界上的点
             assert square.contains_point(Point2D(0.5, 0))
         """
+        halfplanes = self._get_halfplanes()
+        if halfplanes:
+            return self._contains_convex(point, halfplanes)
+
+        # 包围盒外扩 2 倍容差之外的点无需射线投射与边界检查
         x, y = point.x, point.y
-        n = len(self.vertices)
-        inside = False
+        pad = 2.0 * self.TOLERANCE
+        x_min, y_min, x_max, y_max = self.get_bounds()
+        if x < x_min - pad or x > x_max + pad or y < y_min - pad or y > y_max + pad:
+            return False
 
-        j = n - 1
-        for i in range(n):
-            xi, yi = self.vertices[i].x, self.vertices[i].y
-            xj, yj = self.vertices[j].x, self.vertices[j].y
+        slabs = self._get_slabs()
+        if slabs:
+            return _slab_contains(slabs, x, y, self.TOLERANCE)
 
-            if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
-                inside = not inside
+        return _ray_cast(self._get_xy(), x, y, self.TOLERANCE)
 
-            j = i
+    def contains_points(self, points: List["Point2D"]) -> List[bool]:
+        """
+        批量判断多个点是否在多边形内或边界上
 
-        if inside:
-            return True
+        说明:
+            - 结果与逐点调用 contains_point() 一致
+            - 顶点坐标只提取一次，由所有查询点共享，
+              适用于命中测试、栅格化等一次查询大量点的场景
+            - 凸多边形使用缓存的半平面方程逐点判定
+            - 非凸多边形先用缓存的包围盒排除远处的点，
+              这些点无需射线投射，也无需再逐边做边界检查
+            - 顶点较多的非凸多边形按 y 分带索引各边，每个点只检查所在分带内的边
 
-        for i in range(n):
-            edge = self.get_edge(i)
-            if edge[0].equals(point, self.TOLERANCE) or edge[1].equals(point, self.TOLERANCE):
-                return True
-            segment = LineSegment(edge[0], edge[1])
-            if segment.contains_point(point, self.TOLERANCE):
+        Args:
+            points: List[Point2D] - 待检测点列表
+
+        返回:
+            List[bool]: 与 points 一一对应的判断结果
+
+        复杂度:
+            O(m * n) - m 为查询点数，n 为顶点数
+
+        使用示例::
+
+            square = Polygon([Point2D(0, 0), Point2D(1, 0),
+                            Point2D(1, 1), Point2D(0, 1)])
+            square.contains_points([Point2D(0.5, 0.5), Point2D(2, 2)])
+            # [True, False]
+        """
+        halfplanes = self._get_halfplanes()
+        if halfplanes:
+            contains = self._contains_convex
+            return [contains(point, halfplanes) for point in points]
+
+        xy = self._get_xy()
+        slabs = self._get_slabs()
+        tol = self.TOLERANCE
+        # 包围盒外扩 2 倍容差之外的点既不在内部也不可能在边界容差内
+        pad = 2.0 * tol
+        x_min, y_min, x_max, y_max = self.get_bounds()
+        x_min -= pad
+        y_min -= pad
+        x_max += pad
+        y_max += pad
+
+        result = []
+        for point in points:
+            x, y = point.x, point.y
+            if x < x_min or x > x_max or y < y_min or y > y_max:
+                result.append(False)
+            elif slabs:
+                result.append(_slab_contains(slabs, x, y, tol))
+            else:
+                result.append(_ray_cast(xy, x, y, tol))
+        return result
+
+    def _get_slabs(self) -> Union[_Slabs, Tuple[()]]:
+        """
+        获取缓存的水平分带边索引
+
+        说明:
+            - 首次调用时构建，顶点重新赋值后失效
+            - 仅在非凸多边形的点包含判断中使用；顶点数少于 _SLAB_MIN 时
+              逐边扫描更快，缓存为空元组
+
+        返回:
+            tuple: _build_slabs() 的结果；空元组表示不使用分带索引
+        """
+        slabs = self._slabs
+        if slabs is None:
+            xy = self._get_xy()
+            if len(xy) >= _SLAB_MIN:
+                slabs = _build_slabs(xy, 2.0 * self.TOLERANCE)
+            else:
+                slabs = ()
+            self._slabs = slabs
+        return slabs
+
+    @staticmethod
+    def point_in_polygons(polygons: List["Polygon"], point: "Point2D") -> List[bool]:
+        """
+        批量判断同一个点是否在多个多边形内或边界上
+
+        说明:
+            - 结果与逐个调用 polygon.contains_point(point) 一致
+            - 适用于场景中大量多边形对同一点的粗筛（如碰撞检测的 broad phase）
+            - 先用各多边形缓存的包围盒排除，只有包围盒（外扩 2 倍容差）覆盖该点的多边形
+              才进入射线投射或半平面判定
+
+        Args:
+            polygons: List[Polygon] - 多边形列表
+            point: Point2D - 待检测点
+
+        返回:
+            List[bool]: 与 polygons 一一对应的判断结果
+
+        复杂度:
+            O(m + k * n) - m 为多边形个数，k 为包围盒覆盖该点的多边形个数，n 为其顶点数
+
+        使用示例::
+
+            squares = [Polygon.regular(4, Point2D(i, 0), 1.0) for i in range(3)]
+            Polygon.point_in_polygons(squares, Point2D(0.2, 0))
+            # [True, True, False]
+        """
+        x, y = point.x, point.y
+        result = []
+        for polygon in polygons:
+            pad = 2.0 * polygon.TOLERANCE
+            x_min, y_min, x_max, y_max = polygon.get_bounds()
+            if x < x_min - pad or x > x_max + pad or y < y_min - pad or y > y_max + pad:
+                result.append(False)
+            else:
+                result.append(polygon.contains_point(point))
+        return result
+
+    def _get_halfplanes(self) -> Tuple[Tuple[float, float, float, float], ...]:
+        """
+        获取缓存的边半平面方程
+
+        说明:
+            - 首次调用时计算，顶点重新赋值后失效
+            - 仅对凸的简单多边形有效；否则缓存为空元组，调用方回退到射线投射
+            - 凸性由 _is_strictly_convex() 判定，不复用 is_convex() 的容差结果
+
+        返回:
+            tuple: 每条边的 (a, b, c, slack)；空元组表示不适用
+        """
+        halfplanes = self._halfplanes
+        if halfplanes is None:
+            if self._is_strictly_convex():
+                xs, ys = self._get_xs_ys()
+                halfplanes = _convex_halfplanes(xs, ys, self.TOLERANCE)
+            else:
+                halfplanes = ()
+            self._halfplanes = halfplanes
+        return halfplanes
+
+    def _is_strictly_convex(self) -> bool:
+        """
+        按零容差判断凸性（结果缓存）
+
+        说明:
+            - 所有非零转向叉积同号才返回 True
+            - is_convex() 回答"容差内是否为凸"，会忽略叉积小于绝对容差的转向，
+              小尺度或短边多边形的凹顶点因此可能被当作共线；点包含的半平面路径
+              需要精确凸性，两者分开缓存
+            - 首次调用时计算，顶点重新赋值后失效
+
+        返回:
+            bool: 是否严格为凸多边形
+        """
+        strict = self._strict_convex
+        if strict is None:
+            xs, ys = self._get_xs_ys()
+            strict = _is_convex(xs, ys, 0.0)
+            self._strict_convex = strict
+        return strict
+
+    def _contains_convex(
+        self, point: "Point2D", halfplanes: Tuple[Tuple[float, float, float, float], ...]
+    ) -> bool:
+        """
+        用半平面方程判断点是否在凸多边形内或边界上
+
+        说明:
+            - 内部点满足所有 a·x + b·y - c ≥ 0
+            - 某条边越界超过 slack 时点到多边形距离必大于容差，直接返回 False
+            - 只越界不足 slack 的点交给 _on_boundary() 精确判定，结果与射线投射一致
+
+        Args:
+            point: Point2D - 待检测点
+            halfplanes: tuple - _get_halfplanes() 的结果
+
+        返回:
+            bool: True 表示点在多边形内或在边界上
+        """
+        x, y = point.x, point.y
+        near_edge = False
+        for a, b, c, slack in halfplanes:
+            d = a * x + b * y - c
+            if d < 0.0:
+                if d < -slack:
+                    return False
+                near_edge = True
+
+        if near_edge:
+            return self._on_boundary(point)
+        return True
+
+    def _on_boundary(self, point: "Point2D") -> bool:
+        """
+        判断点是否在多边形边界上（容差 TOLERANCE）
+
+        说明:
+            - 直接在坐标上计算，不为每条边构造 LineSegment
+            - 投影参数 t ∈ [0, 1] 等价于 0 ≤ (P - A)·(B - A) ≤ |B - A|²
+            - 点到直线距离 < tol 等价于 cross² < tol² · |B - A|²，无需开方
+
+        Args:
+            point: Point2D - 待检测点
+
+        返回:
+            bool: True 表示点在某条边或顶点上
+        """
+        x, y = point.x, point.y
+        tol = self.TOLERANCE
+        tol_sq = tol * tol
+
+        xy = self._get_xy()
+        x1, y1 = xy[-1]
+        for x2, y2 in xy:
+            ex = x - x1
+            ey = y - y1
+            if abs(ex) < tol and abs(ey) < tol:
                 return True
 
+            dx = x2 - x1
+            dy = y2 - y1
+            len_sq = dx * dx + dy * dy
+            if len_sq >= 1e-15:
+                dot = ex * dx + ey * dy
+                if 0.0 <= dot <= len_sq:
+                    cross = dx * ey - dy * ex
+                    if cross * cross < tol_sq * len_sq:
+                        return True
+            x1, y1 = x2, y2
+
         return False
 
     def is_convex(self) -> bool:
@@ -469,6 +943,7 @@ class Polygon(Surface):
             - 三角形总是凸多边形
             - 凸多边形是凸集（任意两点连线在集合内）
             - 凸多边形的面积和周长计算更高效
+            - 判定结果在首次计算后缓存，顶点重新赋值后失效
 
         返回:
             bool: 是否为凸多边形
@@ -494,28 +969,15 @@ class Polygon(Surface):
                           Point2D(0.5, -0.5)])
             assert not star.is_convex()
         """
-        n = len(self.vertices)
-        if n < 4:
-            return True
-
-        sign = 0
-        for i in range(n):
-            p0 = self.vertices[i]
-            p1 = self.vertices[(i + 1) % n]
-            p2 = self.vertices[(i + 2) % n]
-
-            v1 = (p1.x - p0.x, p1.y - p0.y)
-            v2 = (p2.x - p1.x, p2.y - p1.y)
-
-            cross = v1[0] * v2[1] - v1[1] * v2[0]
-
-            if abs(cross) > self.TOLERANCE:
-                if sign == 0:
-                    sign = 1 if cross > 0 else -1
-                elif (cross > 0 and sign < 0) or (cross < 0 and sign > 0):
-                    return False
-
-        return True
+        convex = self._convex
+        if convex is None:
+            if len(self.vertices) < 4:
+                convex = True
+            else:
+                xs, ys = self._get_xs_ys()
+                convex = _is_convex(xs, ys, self.TOLERANCE)
+            self._convex = convex
+        return convex
 
     def is_simple(self) -> bool:
         """
@@ -541,7 +1003,8 @@ class Polygon(Surface):
             bool: 是否为简单多边形（不自交）
 
         复杂度:
-            O(n^2) - 需要检查所有边对的相交情况
+            O(n log n + k) - 按 x 扫描只精确检查包围盒重叠的 k 对边，最坏情况 O(n^2)；
+            结果缓存，顶点重新赋值后失效
 
         应用场景:
             - 多边形有效性验证
@@ -559,25 +1022,71 @@ class Polygon(Surface):
             # butterfly = Polygon([...])  # 某些配置会产生自交
             # assert not butterfly.is_simple()
         """
-        from planar_geometry.utils import line_segment_intersection
+        simple = self._simple
+        if simple is None:
+            simple = self._simple = self._check_simple()
+        return simple
 
-        n = len(self.vertices)
-        edges = self.get_edges()
+    def _check_simple(self) -> bool:
+        """
+        检查非相邻边是否相交（is_simple() 的未缓存实现）
 
-        for i in range(n):
-            for j in range(i + 2, n):
-                if j == i or (i == 0 and j == n - 1):
-                    continue
+        说明:
+            - 按 x 方向扫描（sort and sweep）：各边按包围盒左端排序，
+              只与 x 区间仍重叠的活动边比较，y 区间也重叠时才做精确相交计算
+            - 活动表只在扫描线越过其中最小的 x 右端时才整体重建，
+              其余时候已结束的边在比较时按 x 右端跳过
+            - 包围盒取自 _get_edge_boxes() 的缓存，被剪枝的边对不可能被判为相交，
+              结果与逐对检查一致
+            - 精确判定直接在坐标上展开 line_segment_intersection 的参数方程（默认容差 1e-9），
+              总以编号较小的边为第一条线段，不再为每条边构造 LineSegment，也不创建交点对象
 
-                edge1 = edges[i]
-                edge2 = edges[j]
+        返回:
+            bool: 是否为简单多边形
 
-                intersection = line_segment_intersection(
-                    LineSegment(edge1[0], edge1[1]), LineSegment(edge2[0], edge2[1])
-                )
+        复杂度:
+            O(n log n + k) - k 为包围盒重叠的边对数，最坏情况仍为 O(n^2)
+        """
+        n = len(self.vertices)
+        if n < 4:
+            return True
 
-                if intersection is not None:
+        xy = self._get_xy()
+        eps = 1e-9
+        upper = 1.0 + eps
+        edges = list(zip(xy, xy[1:] + xy[:1], strict=True))
+        boxes = sorted([box + (i,) for i, box in enumerate(self._get_edge_boxes())])
+
+        last = n - 1
+        active: List[Tuple[float, float, float, float, int]] = []
+        # 活动边中最小的 x 右端；扫描线越过它之前活动表无需重建
+        prune_at = math.inf
+        for box in boxes:
+            x_lo, x_hi, y_lo, y_hi, i = box
+            if prune_at < x_lo:
+                active = [other for other in active if other[1] >= x_lo]
+                prune_at = min([other[1] for other in active], default=math.inf)
+            for _, other_x_hi, other_y_lo, other_y_hi, j in active:
+                if other_y_hi < y_lo or other_y_lo > y_hi or other_x_hi < x_lo:
+                    continue
+                lo, hi = (i, j) if i < j else (j, i)
+                # 相邻边（含首边与末边）共享顶点，跳过
+                if hi - lo < 2 or (lo == 0 and hi == last):
+                    continue
+                (x1, y1), (x2, y2) = edges[lo]
+                (x3, y3), (x4, y4) = edges[hi]
+                denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+                if abs(denom) < eps:
+                    continue
+                t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
+                if not -eps <= t <= upper:
+                    continue
+                s = ((x1 - x3) * (y1 - y2) - (y1 - y3) * (x1 - x2)) / denom
+                if -eps <= s <= upper:
                     return False
+            active.append(box)
+            if x_hi < prune_at:
+                prune_at = x_hi
 
         return True
 
@@ -606,12 +1115,27 @@ class Polygon(Surface):
 
                    \\angle P_{i-1} P_i P_{i+1} = \\theta, \\quad \\forall i
 
-            采用标准差方法判定相等性，允许浮点误差。
+            边长相等时，顶点 P_i 处的内角由跨一个顶点的弦长唯一确定（余弦定理）：
+
+            .. math::
+
+                |P_{i-1} P_{i+1}|^2 = 2L^2 (1 - \\cos \\theta_i)
+
+            因此条件 2 等价于所有弦长相等，无需反余弦。
 
         计算方法:
-            1. 计算所有边长，检查标准差是否小于容差 TOLERANCE
-            2. 计算所有内角（使用向量点积和反余弦），检查标准差是否小于容差
-            3. 两个条件都满足则为正多边形
+            1. 以第一条边的平方长度为基准，逐条比较边长平方，
+               任一边长与基准相差超过容差 TOLERANCE 即提前返回 False：
+
+               .. math::
+
+                   |L_i - L| > \\epsilon \\iff |L_i^2 - L^2| > \\epsilon (L_i + L)
+                   \\Leftarrow |L_i^2 - L^2| > \\epsilon (2L + \\epsilon)
+
+            2. 同样以平方距离比较所有弦长 |P_{i-1} P_{i+1}|，方法同上
+            3. 边长与弦长在同一次遍历中比较，任一不满足即返回 False；
+               两个条件都满足则为正多边形，全程只需两次开方
+            4. 结果在首次计算后缓存，顶点重新赋值后失效
 
         返回:
             bool: 是否为正多边形
@@ -639,44 +1163,50 @@ class Polygon(Surface):
                           Point2D(2, 1), Point2D(0, 1)])
             assert not rect.is_regular()
         """
-        n = len(self.vertices)
-        if n < 3:
-            return False
+        regular = self._regular
+        if regular is None:
+            regular = self._regular = self._check_regular()
+        return regular
 
-        edge_lengths = []
-        for i in range(n):
-            length = self.vertices[i].distance_to(self.vertices[(i + 1) % n])
-            edge_lengths.append(length)
+    def _check_regular(self) -> bool:
+        """
+        比较各边长与各弦长（is_regular() 的未缓存实现）
 
-        length_std = math.sqrt(sum((l - sum(edge_lengths) / n) ** 2 for l in edge_lengths) / n)
-        if length_std > self.TOLERANCE:
+        返回:
+            bool: 是否为正多边形
+        """
+        xy = self._get_xy()
+        if len(xy) < 3:
             return False
 
-        angles = []
-        for i in range(n):
-            p0 = self.vertices[(i - 1) % n]
-            p1 = self.vertices[i]
-            p2 = self.vertices[(i + 1) % n]
-
-            v1 = (p0.x - p1.x, p0.y - p1.y)
-            v2 = (p2.x - p1.x, p2.y - p1.y)
-
-            dot = v1[0] * v2[0] + v1[1] * v2[1]
-            len1 = math.sqrt(v1[0] ** 2 + v1[1] ** 2)
-            len2 = math.sqrt(v2[0] ** 2 + v2[1] ** 2)
-
-            if len1 > 0 and len2 > 0:
-                cos_angle = dot / (len1 * len2)
-                cos_angle = max(-1.0, min(1.0, cos_angle))
-                angle = math.degrees(math.acos(cos_angle))
-                angles.append(angle)
+        tol = self.TOLERANCE
+        x0, y0 = xy[0]
+        xa, ya = xy[-2]
+        xb, yb = xy[-1]
+
+        dx = x0 - xb
+        dy = y0 - yb
+        edge_ref = dx * dx + dy * dy
+        edge_slack = tol * (2.0 * math.sqrt(edge_ref) + tol)
+        # 隔一个顶点的弦长（与相邻两边夹角一一对应）
+        dx = x0 - xa
+        dy = y0 - ya
+        chord_ref = dx * dx + dy * dy
+        chord_slack = tol * (2.0 * math.sqrt(chord_ref) + tol)
+
+        for x2, y2 in xy:
+            dx = x2 - xb
+            dy = y2 - yb
+            if abs(dx * dx + dy * dy - edge_ref) > edge_slack:
+                return False
+            dx = x2 - xa
+            dy = y2 - ya
+            if abs(dx * dx + dy * dy - chord_ref) > chord_slack:
+                return False
+            xa, ya = xb, yb
+            xb, yb = x2, y2
 
-        angle_std = 0.0
-        if angles:
-            angle_mean = sum(angles) / len(angles)
-            angle_std = math.sqrt(sum((a - angle_mean) ** 2 for a in angles) / len(angles))
-
-        return angle_std < self.TOLERANCE
+        return True
 
     def get_convex_hull(self) -> "Polygon":
         """
@@ -686,7 +1216,7 @@ class Polygon(Surface):
             凸包（Convex Hull）是包含所有给定点的最小凸多边形。
 
         计算方法:
-            使用 Graham Scan（格雷厄姆扫描）算法，时间复杂度 O(n log n)：
+            使用 Andrew 单调链（Monotone Chain，Graham Scan 的变体）算法，时间复杂度 O(n log n)：
 
             1. **排序**：按 x 坐标（主）和 y 坐标（次）升序排列所有点
             2. **下链**：从左到右扫描，构建下凸包
@@ -723,38 +1253,419 @@ class Polygon(Surface):
             # 凸包应该只有外面的三个顶点
             assert hull.get_vertex_count() == 3
         """
-        points = sorted(self.vertices, key=lambda p: (p.x, p.y))
-
-        if len(points) <= 2:
-            return Polygon(points)
-
-        def cross(o: "Point2D", a: "Point2D", b: "Point2D") -> float:
-            return (a.x - o.x) * (b.y - o.y) - (a.y - o.y) * (b.x - o.x)
+        vertices = self.vertices
+        xy = self._get_xy()
+        indices = _monotone_chain(xy, self.TOLERANCE)
 
-        lower = []
-        for p in points:
-            while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= self.TOLERANCE:
-                lower.pop()
-            lower.append(p)
-
-        upper = []
-        for p in reversed(points):
-            while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= self.TOLERANCE:
-                upper.pop()
-            upper.append(p)
-
-        hull = lower[:-1] + upper[:-1]
-        return Polygon(hull)
+        hull = Polygon([vertices[i] for i in indices])
+        hull._xy = tuple([xy[i] for i in indices])
+        return hull
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Polygon):
             return NotImplemented
         if len(self.vertices) != len(other.vertices):
             return False
-        return all(
-            self.vertices[i].equals(other.vertices[i], self.TOLERANCE)
-            for i in range(len(self.vertices))
-        )
+        # 在缓存的浮点坐标上逐顶点比较，坐标完全相同时由元组比较在 C 层直接完成
+        xy = self._get_xy()
+        other_xy = other._get_xy()
+        if xy == other_xy:
+            return True
+        tol = self.TOLERANCE
+        for (x1, y1), (x2, y2) in zip(xy, other_xy, strict=True):
+            if not (abs(x1 - x2) < tol and abs(y1 - y2) < tol):
+                return False
+        return True
 
     def __repr__(self) -> str:
         return f"Polygon({self.vertices})"
+
+
+def _shoelace(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """
+    鞋带公式面积内核（纯浮点运算）
+
+    说明:
+        - 只操作坐标序列，不访问 Point2D 对象，便于后续 Cython 编译
+        - 使用展开形式 :math:`\\sum x_i (y_{i+1} - y_{i-1})`：每个顶点一次乘法，
+          且先对相邻 y 作差，远离原点的多边形不会因两大数相减而损失精度
+        - 用 islice 错位遍历 ys，首尾相接的一项在循环外单独累加，不复制坐标序列
+        - 三角形与四边形（网格中最常见）直接使用展开后的闭式：
+          三角形为两条边向量叉积的一半，四边形为两条对角线叉积的一半，没有循环开销
+
+    Args:
+        xs: Sequence[float] - 顶点 x 坐标
+        ys: Sequence[float] - 顶点 y 坐标
+
+    返回:
+        float: 多边形面积（非负）
+    """
+    n = len(xs)
+    if n == 3:
+        x0, x1, x2 = xs
+        y0, y1, y2 = ys
+        return abs((x1 - x0) * (y2 - y0) - (x2 - x0) * (y1 - y0)) * 0.5
+    if n == 4:
+        x0, x1, x2, x3 = xs
+        y0, y1, y2, y3 = ys
+        return abs((x2 - x0) * (y3 - y1) - (x3 - x1) * (y2 - y0)) * 0.5
+
+    area_sum = 0.0
+    y_prev = ys[-1]
+    y_cur = ys[0]
+    for x, y_next in zip(xs, islice(ys, 1, None), strict=False):
+        area_sum += x * (y_next - y_prev)
+        y_prev = y_cur
+        y_cur = y_next
+    area_sum += xs[-1] * (ys[0] - y_prev)
+    return abs(area_sum) * 0.5
+
+
+def _closed_length(xy: Tuple[Tuple[float, float], ...]) -> float:
+    """
+    闭合折线长度内核（纯浮点运算）
+
+    说明:
+        - 相邻顶点两两交给 map(math.dist, ...)，循环在 C 层完成
+        - 首尾相接的边作为 sum() 的初值，只需一次切片，无需拼接出整体错位的副本；
+          累加顺序与先闭合边、再依次各边一致
+
+    Args:
+        xy: tuple - 顶点坐标 ((x0, y0), (x1, y1), ...)
+
+    返回:
+        float: 首尾相连的折线总长
+    """
+    return sum(map(math.dist, xy, xy[1:]), math.dist(xy[-1], xy[0]))
+
+
+def _is_convex(xs: Sequence[float], ys: Sequence[float], tolerance: float) -> bool:
+    """
+    凸性判断内核（纯浮点运算）
+
+    说明:
+        - 只操作坐标序列，不访问 Point2D 对象，便于后续 Cython 编译
+        - 所有超过容差的转向叉积同号即为凸多边形
+        - 分别记录"出现左转" / "出现右转"两个标志，出现与已有标志相反的转向即提前返回
+        - 上一条边的向量随循环滚动复用，每个顶点只做一次边向量减法
+
+    Args:
+        xs: Sequence[float] - 顶点 x 坐标
+        ys: Sequence[float] - 顶点 y 坐标
+        tolerance: float - 共线容差
+
+    返回:
+        bool: 是否为凸多边形
+    """
+    neg_tol = -tolerance
+    pos = False
+    neg = False
+    x1, y1 = xs[-1], ys[-1]
+    ex = x1 - xs[-2]
+    ey = y1 - ys[-2]
+    for x2, y2 in zip(xs, ys, strict=True):
+        fx = x2 - x1
+        fy = y2 - y1
+        cross = ex * fy - ey * fx
+
+        if cross > tolerance:
+            if neg:
+                return False
+            pos = True
+        elif cross < neg_tol:
+            if pos:
+                return False
+            neg = True
+
+        x1, y1 = x2, y2
+        ex, ey = fx, fy
+
+    return True
+
+
+def _convex_halfplanes(
+    xs: Sequence[float], ys: Sequence[float], tolerance: float
+) -> Tuple[Tuple[float, float, float, float], ...]:
+    """
+    计算凸多边形各边的半平面方程（纯浮点运算）
+
+    说明:
+        - 边 (x1, y1) → (x2, y2) 的内侧为 a·x + b·y - c ≥ 0，
+          其中 a = -dy, b = dx, c = dx·y1 - dy·x1（逆时针）；顺时针时整体取反
+        - slack = 2 · tolerance · |edge|，越界超过它的点与边界的距离必大于容差
+        - 调用方需先确认所有非零转向同号（零容差的 _is_convex）；这里只检查边向量
+          dx、dy 各自（循环）最多变号两次，以排除五角星这类转向一致但自交的多边形
+
+    Args:
+        xs: Sequence[float] - 顶点 x 坐标
+        ys: Sequence[float] - 顶点 y 坐标
+        tolerance: float - 容差
+
+    返回:
+        tuple: 每条边的 (a, b, c, slack)；自交或退化时返回空元组
+    """
+    edges = []
+    area2 = 0.0
+    flips_x = flips_y = 0
+    first_sx = first_sy = last_sx = last_sy = 0
+    x1, y1 = xs[-1], ys[-1]
+    for x2, y2 in zip(xs, ys, strict=True):
+        dx = x2 - x1
+        dy = y2 - y1
+        area2 += x1 * y2 - x2 * y1
+
+        sx = (dx > 0.0) - (dx < 0.0)
+        if sx:
+            if last_sx and sx != last_sx:
+                flips_x += 1
+            if not first_sx:
+                first_sx = sx
+            last_sx = sx
+        sy = (dy > 0.0) - (dy < 0.0)
+        if sy:
+            if last_sy and sy != last_sy:
+                flips_y += 1
+            if not first_sy:
+                first_sy = sy
+            last_sy = sy
+
+        edges.append((-dy, dx, dx * y1 - dy * x1, 2.0 * tolerance * math.hypot(dx, dy)))
+        x1, y1 = x2, y2
+
+    flips_x += first_sx != last_sx
+    flips_y += first_sy != last_sy
+    if flips_x > 2 or flips_y > 2 or abs(area2) <= tolerance:
+        return ()
+
+    if area2 < 0.0:
+        return tuple((-a, -b, -c, slack) for a, b, c, slack in edges)
+    return tuple(edges)
+
+
+def _ray_cast(xy: Sequence[Tuple[float, float]], x: float, y: float, tolerance: float) -> bool:
+    """
+    射线投射与边界判定融合的点包含内核（纯浮点运算）
+
+    说明:
+        - 只遍历缓存的浮点坐标元组，循环内没有属性访问
+        - 水平边 (y1 == y2) 不满足跨越条件，被直接跳过，不会出现除零
+        - 同一次遍历中顺带做边界判定：只有 y 范围与查询点相距不超过 2 倍容差的边
+          才计算投影与叉积，公式与 Polygon._on_boundary() 相同，命中即返回 True
+        - 结果与"射线投射为奇数，或点在边界上"逐次判断一致，但只需遍历一次各边
+
+    Args:
+        xy: Sequence[Tuple[float, float]] - 顶点坐标序列
+        x: float - 查询点 x 坐标
+        y: float - 查询点 y 坐标
+        tolerance: float - 边界容差
+
+    返回:
+        bool: 点在多边形内部（交点数为奇数）或在边界上时为 True
+
+    复杂度:
+        O(n) - n 为顶点数
+    """
+    tol_sq = tolerance * tolerance
+    y_lo = y - 2.0 * tolerance
+    y_hi = y + 2.0 * tolerance
+    inside = False
+    x1, y1 = xy[-1]
+    for x2, y2 in xy:
+        if (y1 > y) != (y2 > y) and x < (x1 - x2) * (y - y2) / (y1 - y2) + x2:
+            inside = not inside
+        if (y1 > y_lo or y2 > y_lo) and (y1 < y_hi or y2 < y_hi):
+            ex = x - x1
+            ey = y - y1
+            if abs(ex) < tolerance and abs(ey) < tolerance:
+                return True
+            dx = x2 - x1
+            dy = y2 - y1
+            len_sq = dx * dx + dy * dy
+            if len_sq >= 1e-15:
+                dot = ex * dx + ey * dy
+                if 0.0 <= dot <= len_sq:
+                    cross = dx * ey - dy * ex
+                    if cross * cross < tol_sq * len_sq:
+                        return True
+        x1, y1 = x2, y2
+    return inside
+
+
+def _monotone_chain(xy: Sequence[Tuple[float, float]], tolerance: float) -> List[int]:
+    """
+    Andrew 单调链凸包内核（纯浮点运算）
+
+    说明:
+        - 对 (x, y, 索引) 三元组排序，比较在 C 层完成；坐标相同的点按原顺序排列
+        - 下链、上链共用同一段循环，叉积直接在浮点坐标上计算，不访问 Point2D 属性
+        - 转向叉积不大于 tolerance 的点（右转或近似共线）被弹出
+        - 点数较多时先用 _discard_interior() 剔除明显位于内部的点，缩小排序规模
+
+    Args:
+        xy: Sequence[Tuple[float, float]] - 顶点坐标序列
+        tolerance: float - 共线容差
+
+    返回:
+        List[int]: 凸包顶点在 xy 中的索引，逆时针排列
+
+    复杂度:
+        O(n log n) - 主要由排序阶段决定
+    """
+    points = [(x, y, i) for i, (x, y) in enumerate(xy)]
+    if len(points) >= _HULL_FILTER_MIN:
+        points = _discard_interior(points, tolerance)
+    points.sort()
+
+    hull: List[int] = []
+    for ordered in (points, points[::-1]):
+        chain: List[Tuple[float, float, int]] = []
+        for p in ordered:
+            bx, by, _ = p
+            while len(chain) >= 2:
+                ox, oy, _ = chain[-2]
+                ax, ay, _ = chain[-1]
+                if (ax - ox) * (by - oy) - (ay - oy) * (bx - ox) > tolerance:
+                    break
+                chain.pop()
+            chain.append(p)
+        hull.extend([p[2] for p in chain[:-1]])
+    return hull
+
+
+def _discard_interior(
+    points: List[Tuple[float, float, int]], tolerance: float
+) -> List[Tuple[float, float, int]]:
+    """
+    Akl-Toussaint 预过滤：剔除位于四个极值点所围四边形内部的点
+
+    说明:
+        - 最左、最下、最右、最上四个点都在凸包边界上，它们围成的四边形内部的点不可能是凸包顶点
+        - 只剔除到四条边的叉积都大于 tolerance 的点，贴近边界（可能被判为共线）的点全部保留，
+          单调链的结果不变
+        - 四边形退化（极值点重合）时对应叉积为 0，不剔除任何点
+        - 随机点集通常可剔除大部分点，排序与链构建只处理剩余点
+
+    Args:
+        points: List[Tuple[float, float, int]] - (x, y, 索引) 三元组
+        tolerance: float - 共线容差
+
+    返回:
+        List[Tuple[float, float, int]]: 保留下来的三元组，保持原顺序
+
+    复杂度:
+        O(n)
+    """
+    lx, ly, _ = min(points)
+    rx, ry, _ = max(points)
+    bx, by, _ = min(points, key=itemgetter(1))
+    tx, ty, _ = max(points, key=itemgetter(1))
+
+    # 逆时针四边形 L -> B -> R -> T 的边向量
+    lbx, lby = bx - lx, by - ly
+    brx, bry = rx - bx, ry - by
+    rtx, rty = tx - rx, ty - ry
+    tlx, tly = lx - tx, ly - ty
+
+    kept: List[Tuple[float, float, int]] = []
+    for p in points:
+        x, y, _ = p
+        if (
+            lbx * (y - ly) - lby * (x - lx) > tolerance
+            and brx * (y - by) - bry * (x - bx) > tolerance
+            and rtx * (y - ry) - rty * (x - rx) > tolerance
+            and tlx * (y - ty) - tly * (x - tx) > tolerance
+        ):
+            continue
+        kept.append(p)
+    return kept
+
+
+def _build_slabs(xy: Tuple[Tuple[float, float], ...], pad: float) -> _Slabs:
+    """
+    构建水平分带边索引（纯浮点运算）
+
+    说明:
+        - 把包围盒的 y 范围等分为 m 个分带，每条边登记到其 y 范围（外扩 pad）覆盖的所有分带
+        - 射线投射只统计跨越查询点 y 坐标的边，边界判定只关心 y 距离不超过容差的边，
+          只要 pad 不小于容差，它们都在查询点所在的分带内
+        - m 按边的 y 跨度总和选取，使登记总数约为 4n，锯齿形等长边较多的多边形也不会膨胀到 O(n^2)
+        - 边按 (x1, y1, x2, y2) 存放，方向与 _ray_cast 的滚动遍历相同
+
+    Args:
+        xy: Tuple[Tuple[float, float], ...] - 顶点坐标元组
+        pad: float - 分带登记时的外扩量，需不小于容差
+
+    返回:
+        tuple: (y_lo, inv_h, last, buckets)，buckets[k] 为第 k 个分带内的边元组
+
+    复杂度:
+        O(n) - 登记总数约为 4n
+    """
+    n = len(xy)
+    edges = [(x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(xy[-1:] + xy[:-1], xy, strict=True)]
+    y_lo = min([e[3] for e in edges]) - pad
+    height = max([e[3] for e in edges]) + pad - y_lo
+    span = 2.0 * pad * n
+    for _, y1, _, y2 in edges:
+        span += abs(y2 - y1)
+    m = max(1, min(n, int(3.0 * n * height / span)))
+    inv_h = m / height
+    last = m - 1
+
+    buckets: List[List[Tuple[float, float, float, float]]] = [[] for _ in range(m)]
+    for edge in edges:
+        _, y1, _, y2 = edge
+        lo, hi = (y1, y2) if y1 < y2 else (y2, y1)
+        first = max(0, int((lo - pad - y_lo) * inv_h))
+        end = min(last, int((hi + pad - y_lo) * inv_h))
+        for k in range(first, end + 1):
+            buckets[k].append(edge)
+    return (y_lo, inv_h, last, tuple([tuple(bucket) for bucket in buckets]))
+
+
+def _slab_contains(slabs: _Slabs, x: float, y: float, tolerance: float) -> bool:
+    """
+    在分带索引上判断点是否在多边形内或边界上
+
+    说明:
+        - 只遍历查询点所在分带内的边
+        - 逐边公式与 _ray_cast 相同，射线投射与边界判定在同一次遍历中完成，结果一致
+
+    Args:
+        slabs: tuple - _build_slabs() 的结果
+        x: float - 查询点 x 坐标
+        y: float - 查询点 y 坐标
+        tolerance: float - 边界容差
+
+    返回:
+        bool: True 表示点在多边形内或在边界上
+
+    复杂度:
+        O(k) - k 为分带内的边数，平均为常数
+    """
+    slab_lo, inv_h, last, buckets = slabs
+    k = int((y - slab_lo) * inv_h)
+    edges = buckets[0 if k < 0 else last if k > last else k]
+
+    tol_sq = tolerance * tolerance
+    y_lo = y - 2.0 * tolerance
+    y_hi = y + 2.0 * tolerance
+    inside = False
+    for x1, y1, x2, y2 in edges:
+        if (y1 > y) != (y2 > y) and x < (x1 - x2) * (y - y2) / (y1 - y2) + x2:
+            inside = not inside
+        if (y1 > y_lo or y2 > y_lo) and (y1 < y_hi or y2 < y_hi):
+            ex = x - x1
+            ey = y - y1
+            if abs(ex) < tolerance and abs(ey) < tolerance:
+                return True
+            dx = x2 - x1
+            dy = y2 - y1
+            len_sq = dx * dx + dy * dy
+            if len_sq >= 1e-15:
+                dot = ex * dx + ey * dy
+                if 0.0 <= dot <= len_sq:
+                    cross = dx * ey - dy * ex
+                    if cross * cross < tol_sq * len_sq:
+                        return True
+    return inside
@@ -18,7 +18,7 @@ planar_geometry/surface/rectangle.py
 """
 
 import math
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
 from planar_geometry.abstracts import Surface
 from planar_geometry.point import Point2D
@@ -58,6 +58,8 @@ class Rectangle(Surface):
         print(rect.perimeter())
     """
 
+    __slots__ = ("_vertices", "_bbox", "_obb", "_width", "_height", "_area")
+
     TOLERANCE: float = 1e-6
 
     def __init__(self, vertices: List["Point2D"]) -> None:
@@ -78,88 +80,195 @@ class Rectangle(Surface):
             raise ValueError("矩形必须有4个顶点")
         self.vertices = vertices
 
+    @property
+    def vertices(self) -> List["Point2D"]:
+        """
+        顶点列表
+
+        说明:
+            - 重新赋值时同步刷新缓存的边界框
+            - 原地修改列表元素不会刷新缓存，应整体重新赋值
+
+        返回:
+            List[Point2D]: 4个顶点（逆时针顺序）
+        """
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices: List["Point2D"]) -> None:
+        v0, v1, v2, v3 = vertices
+        self._vertices = vertices
+        x0, y0 = v0.x, v0.y
+        x1, y1 = v1.x, v1.y
+        x2, y2 = v2.x, v2.y
+        x3, y3 = v3.x, v3.y
+        # 边界框：两两比较展开，避免 4 次多参数 min/max 调用
+        if x0 < x1:
+            xa, xb = x0, x1
+        else:
+            xa, xb = x1, x0
+        if x2 < x3:
+            xc, xd = x2, x3
+        else:
+            xc, xd = x3, x2
+        if y0 < y1:
+            ya, yb = y0, y1
+        else:
+            ya, yb = y1, y0
+        if y2 < y3:
+            yc, yd = y2, y3
+        else:
+            yc, yd = y3, y2
+        self._bbox = (
+            xa if xa < xc else xc,
+            ya if ya < yc else yc,
+            xb if xb > xd else xd,
+            yb if yb > yd else yd,
+        )
+        # OBB: 中心、两条边的单位方向及（含容差的）半边长；退化边取另一边的法向
+        ux, uy = x1 - x0, y1 - y0
+        vx, vy = x3 - x0, y3 - y0
+        if uy == 0.0 and vx == 0.0 and ux != 0.0 and vy != 0.0:
+            # 轴对齐（如 from_bounds 构造）：边长即坐标差，单位方向为 ±1，无需开方与除法
+            len_u = abs(ux)
+            len_v = abs(vy)
+            self._area = len_u * len_v
+            ux = 1.0 if ux > 0.0 else -1.0
+            vy = 1.0 if vy > 0.0 else -1.0
+        else:
+            len_u = math.hypot(ux, uy)
+            len_v = math.hypot(vx, vy)
+            self._area = abs(ux * vy - uy * vx)
+            if len_u > 0.0:
+                ux, uy = ux / len_u, uy / len_u
+            elif len_v > 0.0:
+                ux, uy = vy / len_v, -vx / len_v
+            else:
+                ux, uy = 1.0, 0.0
+            if len_v > 0.0:
+                vx, vy = vx / len_v, vy / len_v
+            else:
+                vx, vy = -uy, ux
+        self._width = len_u
+        self._height = len_v
+        tol = self.TOLERANCE
+        self._obb = (
+            (x0 + x2) * 0.5,
+            (y0 + y2) * 0.5,
+            ux,
+            uy,
+            len_u * 0.5 + tol,
+            vx,
+            vy,
+            len_v * 0.5 + tol,
+        )
+
     @staticmethod
-    def from_center_and_size(center: "Point2D", size: float, direction: "Vector2D") -> "Rectangle":
+    def from_center_and_size(
+        center: "Point2D", size: float, direction: "Vector2D", intern: bool = False
+    ) -> "Rectangle":
         """
         从中心点、尺寸和方向构造矩形（工厂方法）
 
         说明:
             - 用于动态创建矩形
-            - direction 沿矩形长边方向
+            - direction 沿矩形长边方向，内部会先归一化，只取其方向
+            - 直接以浮点数计算四个顶点，不创建中间元组或 Vector2D
 
         Args:
             center: Point2D - 中心点
             size: float - 矩形边长（正方形）
-            direction: Vector2D - 方向向量（沿长边）
+            direction: Vector2D - 方向向量（沿长边，不要求单位长度）
+            intern: bool - 是否使用 Point2D.intern 共享相同坐标的顶点
 
         返回:
             Rectangle: 新矩形实例
-        """
-        half = size / 2.0
-        normal = Vector2D(-direction.y, direction.x).normalized()
-
-        c_dir = (direction.x * half, direction.y * half)
-        c_norm = (normal.x * half, normal.y * half)
 
-        v0 = Point2D(center.x - c_dir[0] - c_norm[0], center.y - c_dir[1] - c_norm[1])
-        v1 = Point2D(center.x + c_dir[0] - c_norm[0], center.y + c_dir[1] - c_norm[1])
-        v2 = Point2D(center.x + c_dir[0] + c_norm[0], center.y + c_dir[1] + c_norm[1])
-        v3 = Point2D(center.x - c_dir[0] + c_norm[0], center.y - c_dir[1] + c_norm[1])
+        异常:
+            ValueError: direction 为零向量
+        """
+        dx = direction.x
+        dy = direction.y
+        length = math.hypot(dx, dy)
+        if length == 0.0:
+            raise ValueError("方向向量不能为零向量")
+        scale = size * 0.5 / length
+        ux = dx * scale
+        uy = dy * scale
+        cx = center.x
+        cy = center.y
+
+        make = Point2D.intern if intern else Point2D
+        v0 = make(cx - ux + uy, cy - uy - ux)
+        v1 = make(cx + ux + uy, cy + uy - ux)
+        v2 = make(cx + ux - uy, cy + uy + ux)
+        v3 = make(cx - ux - uy, cy - uy + ux)
 
         return Rectangle([v0, v1, v2, v3])
 
     @staticmethod
-    def from_bounds(x_min: float, y_min: float, x_max: float, y_max: float) -> "Rectangle":
+    def from_bounds(
+        x_min: float, y_min: float, x_max: float, y_max: float, intern: bool = False
+    ) -> "Rectangle":
         """
         从边界框创建矩形（工厂方法）
 
+        说明:
+            - intern=True 时相邻矩形的公共角点共享同一 Point2D 实例（适合网格）
+
         Args:
             x_min: float - 最小x
             y_min: float - 最小y
             x_max: float - 最大x
             y_max: float - 最大y
+            intern: bool - 是否使用 Point2D.intern 共享相同坐标的顶点
 
         返回:
             Rectangle: 新矩形实例
         """
-        v0 = Point2D(x_min, y_min)
-        v1 = Point2D(x_max, y_min)
-        v2 = Point2D(x_max, y_max)
-        v3 = Point2D(x_min, y_max)
+        make = Point2D.intern if intern else Point2D
+        v0 = make(x_min, y_min)
+        v1 = make(x_max, y_min)
+        v2 = make(x_max, y_max)
+        v3 = make(x_min, y_max)
         return Rectangle([v0, v1, v2, v3])
 
     def area(self) -> float:
         """
         计算矩形面积
 
+        说明:
+            - 取两条相邻边向量 v0→v1、v0→v3 叉积的绝对值，无需开方
+            - 在设置顶点时预先计算，此处直接返回缓存值
+
         返回:
             float: 面积值
         """
-        width = self.vertices[0].distance_to(self.vertices[1])
-        height = self.vertices[0].distance_to(self.vertices[3])
-        return width * height
+        return self._area
 
     def perimeter(self) -> float:
         """
         计算矩形周长
 
+        说明:
+            - 使用设置顶点时缓存的边长 |v0v1|、|v0v3|
+
         返回:
             float: 周长值
         """
-        width = self.vertices[0].distance_to(self.vertices[1])
-        height = self.vertices[0].distance_to(self.vertices[3])
-        return 2.0 * (width + height)
+        return 2.0 * (self._width + self._height)
 
     def get_bounds(self) -> tuple:
         """
         获取轴对齐边界框 (AABB)
 
+        说明:
+            - 边界框在设置顶点时预先计算，此处直接返回缓存值
+
         返回:
             tuple: (x_min, y_min, x_max, y_max)
         """
-        x_vals = [p.x for p in self.vertices]
-        y_vals = [p.y for p in self.vertices]
-        return (min(x_vals), min(y_vals), max(x_vals), max(y_vals))
+        return self._bbox
 
     def get_edges(self) -> List[tuple]:
         """
@@ -168,7 +277,24 @@ class Rectangle(Surface):
         返回:
             List[Tuple[Point2D, Point2D]]: [(v0,v1), (v1,v2), (v2,v3), (v3,v0)]
         """
-        return [(self.vertices[i], self.vertices[(i + 1) % 4]) for i in range(4)]
+        v0, v1, v2, v3 = self.vertices
+        return [(v0, v1), (v1, v2), (v2, v3), (v3, v0)]
+
+    def iter_edges(self) -> Iterator[Tuple["Point2D", "Point2D"]]:
+        """
+        逐条迭代4条边（生成器）
+
+        说明:
+            - 顺序与 get_edges() 相同，不构造边列表
+
+        返回:
+            Iterator[Tuple[Point2D, Point2D]]: 边迭代器
+        """
+        v0, v1, v2, v3 = self.vertices
+        yield (v0, v1)
+        yield (v1, v2)
+        yield (v2, v3)
+        yield (v3, v0)
 
     def get_edge_count(self) -> int:
         """
@@ -195,9 +321,8 @@ class Rectangle(Surface):
         返回:
             Point2D: 中心坐标
         """
-        x = sum(p.x for p in self.vertices) / 4.0
-        y = sum(p.y for p in self.vertices) / 4.0
-        return Point2D(x, y)
+        v0, v1, v2, v3 = self.vertices
+        return Point2D((v0.x + v1.x + v2.x + v3.x) * 0.25, (v0.y + v1.y + v2.y + v3.y) * 0.25)
 
     def contains_point(self, point: "Point2D") -> bool:
         """
@@ -205,37 +330,89 @@ class Rectangle(Surface):
 
         说明:
             - 支持旋转矩形
-            - 使用AABB快速检测
+            - 把 P - 中心 投影到两条边的单位方向 u、v 上，与半边长比较（OBB）：
+
+            .. math::
+
+                |(P - C) \\cdot \\hat{u}| \\le \\frac{w}{2}, \\quad
+                |(P - C) \\cdot \\hat{v}| \\le \\frac{h}{2}
+
+            - 中心、单位方向与半边长在顶点赋值时缓存，半边长已含容差 TOLERANCE
 
         Args:
             point: Point2D - 待检测点
 
         返回:
             bool: True 表示点在矩形内或在边界上
+
+        复杂度:
+            O(1)
+        """
+        cx, cy, ux, uy, half_w, vx, vy, half_h = self._obb
+        dx = point.x - cx
+        dy = point.y - cy
+        return abs(dx * ux + dy * uy) <= half_w and abs(dx * vx + dy * vy) <= half_h
+
+    def contains_xy(self, x: float, y: float) -> bool:
+        """
+        判断坐标 (x, y) 是否在矩形内或边界上
+
+        说明:
+            - 与 contains_point() 判定完全相同，但直接接收浮点坐标，
+              调用方无需为每个查询点创建 Point2D
+            - 参数与缓存量均为纯浮点，可直接对应到编译扩展中的 double 签名
+
+        Args:
+            x: float - 横坐标
+            y: float - 纵坐标
+
+        返回:
+            bool: True 表示点在矩形内或边界上
         """
-        x, y = point.x, point.y
-        x_min, y_min, x_max, y_max = self.get_bounds()
+        cx, cy, ux, uy, half_w, vx, vy, half_h = self._obb
+        dx = x - cx
+        dy = y - cy
+        return abs(dx * ux + dy * uy) <= half_w and abs(dx * vx + dy * vy) <= half_h
 
-        if x < x_min - self.TOLERANCE or x > x_max + self.TOLERANCE:
-            return False
-        if y < y_min - self.TOLERANCE or y > y_max + self.TOLERANCE:
-            return False
+    def contains_points(self, points: List["Point2D"]) -> List[bool]:
+        """
+        批量判断多个点是否在矩形内或边界上
 
-        return True
+        说明:
+            - 结果与逐点调用 contains_point() 一致
+            - 缓存的 OBB 参数只解包一次，由所有查询点共享
+
+        Args:
+            points: List[Point2D] - 待检测点列表
+
+        返回:
+            List[bool]: 与 points 一一对应的判断结果
+
+        复杂度:
+            O(m) - m 为查询点数
+        """
+        cx, cy, ux, uy, half_w, vx, vy, half_h = self._obb
+        result = []
+        for point in points:
+            dx = point.x - cx
+            dy = point.y - cy
+            result.append(abs(dx * ux + dy * uy) <= half_w and abs(dx * vx + dy * vy) <= half_h)
+        return result
 
     def is_square(self, tolerance: float = 1e-6) -> bool:
         """
         判断是否为正方形
 
+        说明:
+            - 比较设置顶点时缓存的边长 |v0v1|、|v0v3|
+
         Args:
             tolerance: float - 容差
 
         返回:
             bool: 是否为正方形
         """
-        width = self.vertices[0].distance_to(self.vertices[1])
-        height = self.vertices[0].distance_to(self.vertices[3])
-        return abs(width - height) < tolerance
+        return abs(self._width - self._height) < tolerance
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Rectangle):
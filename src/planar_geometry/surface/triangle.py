@@ -18,7 +18,7 @@ planar_geometry/surface/triangle.py
 """
 
 import math
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
 from planar_geometry.abstracts import Surface
 from planar_geometry.surface.polygon import Polygon
@@ -37,6 +37,8 @@ class Triangle(Polygon):
         - 继承自Polygon，特殊的三边多边形
         - 提供三角形特有的几何计算
         - 工厂方法：from_points(), from_sides()
+        - 边长、内角与各个心的缓存放在 __slots__ 中，实例不带 __dict__，
+          不能在实例上动态添加属性
 
     属性:
         vertices: List[Point2D] - 3个顶点
@@ -55,6 +57,25 @@ class Triangle(Polygon):
         tri = Triangle.from_sides(3.0, 4.0, 5.0)
     """
 
+    __slots__ = (
+        "_cross",
+        "_side_squares",
+        "_sides",
+        "_angles",
+        "_circumcenter",
+        "_incenter",
+        "_orthocenter",
+    )
+
+    # 由顶点派生的缓存，_invalidate_cache() 重置为 None，首次使用时计算
+    _cross: Optional[float]
+    _sides: Optional[Tuple[float, float, float]]
+    _angles: Optional[Tuple[float, float, float]]
+    _side_squares: Optional[Tuple[float, float, float]]
+    _circumcenter: Optional[Tuple[float, float]]
+    _incenter: Optional[Tuple[float, float]]
+    _orthocenter: Optional[Tuple[float, float]]
+
     def __init__(self, vertices: List["Point2D"]) -> None:
         """
         初始化三角形
@@ -73,6 +94,24 @@ class Triangle(Polygon):
             raise ValueError("三角形必须有3个顶点")
         super().__init__(vertices)
 
+    def _invalidate_cache(self) -> None:
+        """
+        清空缓存的边长、内角与各个心
+
+        说明:
+            - 顶点重新赋值时由 Polygon.vertices 调用
+            - 面积缓存 _area 由 Polygon 负责清空
+            - 外心、内心、垂心以坐标元组缓存，与 Polygon 的 _center 相同
+        """
+        super()._invalidate_cache()
+        self._cross = None
+        self._side_squares = None
+        self._sides = None
+        self._angles = None
+        self._circumcenter = None
+        self._incenter = None
+        self._orthocenter = None
+
     @staticmethod
     def from_points(points: List["Point2D"]) -> "Triangle":
         """
@@ -100,7 +139,22 @@ class Triangle(Polygon):
 
                 A = \\sqrt{s(s-a)(s-b)(s-c)}
 
-            随后通过三角形的高度公式构造具体的顶点坐标。
+            实际计算使用 Kahan 的数值稳定形式（先将三边排序为 :math:`a \\ge b \\ge c`）：
+
+            .. math::
+
+                A = \\frac{1}{4} \\sqrt{(a+(b+c))(c-(a-b))(c+(a-b))(a+(b-c))}
+
+            与半周长形式代数等价，但针状三角形不会因 :math:`s - a` 相消而丢失精度。
+            随后构造顶点：P1 = (0, 0)，P2 = (a, 0)，第三个顶点 P3 的横坐标由余弦定理、
+            纵坐标由高度公式直接给出（取正值，使顶点按逆时针排列）：
+
+            .. math::
+
+                x_3 = \\frac{a^2 + c^2 - b^2}{2a}, \\quad y_3 = \\frac{2A}{a}
+
+            从而 :math:`|P_1P_2| = a`，:math:`|P_2P_3| = b`，:math:`|P_3P_1| = c`，
+            与 get_side_lengths() 的顺序一致。
 
         三角形不等式条件：
             三条边长必须满足：
@@ -144,38 +198,123 @@ class Triangle(Polygon):
         if a + b <= c or a + c <= b or b + c <= a:
             raise ValueError("边长不满足三角形不等式")
 
-        s = (a + b + c) / 2.0
-        area = math.sqrt(max(s * (s - a) * (s - b) * (s - c), 0))
+        area = _kahan_triangle_area(a, b, c)
 
         p1 = Point2D(0, 0)
         p2 = Point2D(a, 0)
+        x3 = (a * a + c * c - b * b) / (2 * a)
 
         if area < Triangle.TOLERANCE:
-            return Triangle([p1, p2, Point2D(a / 2, 0)])
+            return Triangle([p1, p2, Point2D(x3, 0)])
 
-        height = 2 * area / a
-        mid_x = a / 2
+        return Triangle([p1, p2, Point2D(x3, 2 * area / a)])
 
-        if abs(b * b - (mid_x * mid_x + height * height)) < abs(
-            c * c - (mid_x * mid_x + height * height)
-        ):
-            p3 = Point2D(mid_x, height)
-        else:
-            p3 = Point2D(mid_x, -height)
+    def area(self) -> float:
+        """
+        计算三角形面积
+
+        说明:
+            - 鞋带公式在 n = 3 时的闭式展开，即两条边向量叉积的一半：
+
+            .. math::
+
+                A = \\frac{1}{2} |(x_2 - x_1)(y_3 - y_1) - (x_3 - x_1)(y_2 - y_1)|
+
+            - 与 Polygon.area() 结果一致，但无循环与取模开销
+            - 首次调用后缓存结果，供 circumradius()、inradius() 复用
 
-        return Triangle([p1, p2, p3])
+        返回:
+            float: 面积值（非负）
+
+        复杂度:
+            O(1)
+        """
+        if self._area is None:
+            self._area = 0.5 * abs(self._get_cross())
+        return self._area
+
+    def _get_cross(self) -> float:
+        """
+        获取缓存的有向二倍面积
+
+        说明:
+            - 两条边向量 P1P2、P1P3 的叉积，逆时针为正
+            - area()、get_angles() 与外心共用这一次叉积：面积取其绝对值的一半，
+              外心行列式即其 2 倍，不再各自重新计算
+
+        返回:
+            float: 有向二倍面积
+        """
+        cross = self._cross
+        if cross is None:
+            cross = self._cross = _signed_double_area(self._get_xy())
+        return cross
+
+    def perimeter(self) -> float:
+        """
+        计算三角形周长
+
+        说明:
+            - 三条边长之和，直接复用 get_side_lengths() 的缓存边长
+            - 首次调用后缓存结果，顶点重新赋值后失效
+
+        返回:
+            float: 周长值
+
+        复杂度:
+            O(1)
+        """
+        if self._perimeter is None:
+            a, b, c = self.get_side_lengths()
+            self._perimeter = a + b + c
+        return self._perimeter
 
     def get_side_lengths(self) -> Tuple[float, float, float]:
         """
         获取三条边的长度
 
+        说明:
+            - 首次调用后缓存结果，外接圆、内切圆、内角及形状判断共用同一份边长
+            - 顶点重新赋值时缓存自动失效
+
         返回:
             Tuple[float, float, float]: (a, b, c) 三边长度
         """
-        a = self.vertices[0].distance_to(self.vertices[1])
-        b = self.vertices[1].distance_to(self.vertices[2])
-        c = self.vertices[2].distance_to(self.vertices[0])
-        return (a, b, c)
+        sides = self._sides
+        if sides is None:
+            sqrt = math.sqrt
+            a2, b2, c2 = self.get_side_lengths_sq()
+            sides = self._sides = (sqrt(a2), sqrt(b2), sqrt(c2))
+        return sides
+
+    def get_side_lengths_sq(self) -> Tuple[float, float, float]:
+        """
+        获取三条边长的平方
+
+        说明:
+            - 在缓存的浮点坐标上直接计算，不经过 Point2D.distance_to，顺序与
+              get_side_lengths() 一致
+            - 内角与直角判断直接使用平方值，省去开方后再平方；比较边长大小时也可
+              直接比较平方值
+            - 首次调用后缓存结果，顶点重新赋值时缓存自动失效
+
+        返回:
+            Tuple[float, float, float]: (a², b², c²)
+
+        复杂度:
+            O(1)
+        """
+        squares = self._side_squares
+        if squares is None:
+            (x1, y1), (x2, y2), (x3, y3) = self._get_xy()
+            dx, dy = x1 - x2, y1 - y2
+            a2 = dx * dx + dy * dy
+            dx, dy = x2 - x3, y2 - y3
+            b2 = dx * dx + dy * dy
+            dx, dy = x3 - x1, y3 - y1
+            c2 = dx * dx + dy * dy
+            squares = self._side_squares = (a2, b2, c2)
+        return squares
 
     def get_angles(self) -> Tuple[float, float, float]:
         """
@@ -193,16 +332,21 @@ class Triangle(Polygon):
 
                 \\cos(C) = \\frac{a^2 + b^2 - c^2}{2ab}
 
-            随后通过反余弦函数得到角度：
+            结合面积公式 :math:`S = \\frac{1}{2}bc\\sin(A)` 得
+            :math:`\\tan(A) = \\frac{4S}{b^2 + c^2 - a^2}`，故用 atan2 求角：
 
             .. math::
 
-                A = \\arccos(\\cos(A)), \\quad B = \\arccos(\\cos(B)), \\quad C = \\arccos(\\cos(C))
+                A = \\operatorname{atan2}(4S, b^2 + c^2 - a^2)
+
+            B、C 同理，其中 :math:`4S = 2|\\vec{e_1} \\times \\vec{e_2}|` 由两条边向量的叉积一次求得
 
         说明:
             - 返回值为度数 (degree)
             - 三个内角之和恒为 180°
-            - 计算过程中会对 cos 值进行 clamp 处理以处理浮点误差
+            - atan2 在整个 [0°, 180°] 上都是良态的，不需要对 cos 值做 clamp，
+              接近 0° 或 180° 的角也不会像 arccos 那样放大误差
+            - 首次调用后缓存结果，顶点重新赋值时缓存自动失效
 
         返回:
             Tuple[float, float, float]: 三个内角，单位为度 (A, B, C)
@@ -228,21 +372,44 @@ class Triangle(Polygon):
             angles_eq = tri_eq.get_angles()
             assert all(abs(angle - 60.0) < 1e-6 for angle in angles_eq)
         """
-        a, b, c = self.get_side_lengths()
+        angles = self._angles
+        if angles is None:
+            angles = self._angles = _angles_xy(self.get_side_lengths_sq(), self._get_cross())
+        return angles
 
-        cos_A = (b * b + c * c - a * a) / (2 * b * c)
-        cos_B = (a * a + c * c - b * b) / (2 * a * c)
-        cos_C = (a * a + b * b - c * c) / (2 * a * b)
+    @staticmethod
+    def angles_of(triangles: Sequence["Triangle"]) -> List[Tuple[float, float, float]]:
+        """
+        批量计算多个三角形的内角
 
-        cos_A = max(-1.0, min(1.0, cos_A))
-        cos_B = max(-1.0, min(1.0, cos_B))
-        cos_C = max(-1.0, min(1.0, cos_C))
+        说明:
+            - 结果与逐个调用 triangle.get_angles() 一致
+            - 适用于网格质量统计（如最小角直方图）等一次处理大量三角形的场景
+            - 直接在各三角形缓存的浮点坐标上运行内角内核，已缓存内角的三角形直接复用
 
-        A = math.degrees(math.acos(cos_A))
-        B = math.degrees(math.acos(cos_B))
-        C = math.degrees(math.acos(cos_C))
+        Args:
+            triangles: Sequence[Triangle] - 三角形序列
 
-        return (A, B, C)
+        返回:
+            List[Tuple[float, float, float]]: 与 triangles 一一对应的内角（度）
+
+        复杂度:
+            O(m) - m 为三角形个数
+
+        使用示例::
+
+            tris = [Triangle.from_sides(3.0, 4.0, 5.0), Triangle.from_sides(1.0, 1.0, 1.0)]
+            min_angles = [min(angles) for angles in Triangle.angles_of(tris)]
+        """
+        result: List[Tuple[float, float, float]] = []
+        for triangle in triangles:
+            angles = triangle._angles
+            if angles is None:
+                angles = triangle._angles = _angles_xy(
+                    triangle.get_side_lengths_sq(), triangle._get_cross()
+                )
+            result.append(angles)
+        return result
 
     def circumcenter(self) -> "Point2D":
         """
@@ -298,26 +465,115 @@ class Triangle(Polygon):
             assert abs(d1 - d2) < 1e-9
             assert abs(d2 - d3) < 1e-9
         """
-        p1, p2, p3 = self.vertices
+        center = self._get_circumcenter_xy()
+        return Point2D(center[0], center[1])
 
-        d = 2 * (p1.x * (p2.y - p3.y) + p2.x * (p3.y - p1.y) + p3.x * (p1.y - p2.y))
+    def _get_circumcenter_xy(self) -> Tuple[float, float]:
+        """
+        获取缓存的外心坐标
+
+        说明:
+            - circumcenter() 与 orthocenter() 共用，三点共线时为重心坐标
 
-        if abs(d) < self.TOLERANCE:
-            return self.get_center()
+        返回:
+            Tuple[float, float]: 外心坐标 (x, y)
+        """
+        center = self._circumcenter
+        if center is None:
+            center = _circumcenter_xy(self._get_xy(), self._get_cross(), self.TOLERANCE)
+            if center is None:
+                p = self.get_center()
+                center = (p.x, p.y)
+            self._circumcenter = center
+        return center
 
-        ux = (
-            (p1.x * p1.x + p1.y * p1.y) * (p2.y - p3.y)
-            + (p2.x * p2.x + p2.y * p2.y) * (p3.y - p1.y)
-            + (p3.x * p3.x + p3.y * p3.y) * (p1.y - p2.y)
-        ) / d
+    @staticmethod
+    def circumcenters_of(triangles: Sequence["Triangle"]) -> List["Point2D"]:
+        """
+        批量计算多个三角形的外心
+
+        说明:
+            - 结果与逐个调用 triangle.circumcenter() 一致（三点共线时同样返回三角形中心）
+            - 适用于网格、Delaunay 三角剖分等一次处理大量三角形的场景
+            - 直接在各三角形缓存的浮点坐标上运行外心内核，省去逐个方法调用与
+              Point2D 属性访问，只为结果创建 Point2D
+
+        Args:
+            triangles: Sequence[Triangle] - 三角形序列
+
+        返回:
+            List[Point2D]: 与 triangles 一一对应的外心
+
+        复杂度:
+            O(m) - m 为三角形个数
+
+        使用示例::
+
+            tris = [Triangle.from_sides(3.0, 4.0, 5.0), Triangle.from_sides(1.0, 1.0, 1.0)]
+            centers = Triangle.circumcenters_of(tris)
+        """
+        result = []
+        for triangle in triangles:
+            center = _circumcenter_xy(triangle._get_xy(), triangle._get_cross(), triangle.TOLERANCE)
+            if center is None:
+                result.append(triangle.get_center())
+            else:
+                result.append(Point2D(center[0], center[1]))
+        return result
+
+    @staticmethod
+    def circumcenters_from_coords(
+        triangles_xy: Sequence[Sequence[Tuple[float, float]]],
+    ) -> List[Tuple[float, float]]:
+        """
+        直接从坐标批量计算外心（不创建 Triangle 与 Point2D）
+
+        说明:
+            - 适用于百万级网格：输入为每个三角形的三个顶点坐标，输出为外心坐标元组，
+              整个过程不构造任何几何对象
+            - 与 Triangle(...).circumcenter() 的坐标一致；三点共线时返回三个顶点的平均坐标
+            - 共线判定使用 Triangle.TOLERANCE
+            - 外心内核在循环体内展开（与 _circumcenter_xy 逐项相同），每个三角形不再有
+              额外的函数调用
+
+        Args:
+            triangles_xy: Sequence[Sequence[Tuple[float, float]]] -
+                每个元素为 ((x1, y1), (x2, y2), (x3, y3))
+
+        返回:
+            List[Tuple[float, float]]: 与输入一一对应的外心坐标 (x, y)
+
+        复杂度:
+            O(m) - m 为三角形个数
 
-        uy = (
-            (p1.x * p1.x + p1.y * p1.y) * (p3.x - p2.x)
-            + (p2.x * p2.x + p2.y * p2.y) * (p1.x - p3.x)
-            + (p3.x * p3.x + p3.y * p3.y) * (p2.x - p1.x)
-        ) / d
+        使用示例::
 
-        return Point2D(ux, uy)
+            mesh = [((0, 0), (3, 0), (0, 4)), ((0, 0), (1, 0), (0, 1))]
+            Triangle.circumcenters_from_coords(mesh)
+            # [(1.5, 2.0), (0.5, 0.5)]
+        """
+        tolerance = Triangle.TOLERANCE
+        result: List[Tuple[float, float]] = []
+        append = result.append
+        for (x1, y1), (x2, y2), (x3, y3) in triangles_xy:
+            # 与 _signed_double_area + _circumcenter_xy 逐项相同，内联以省去每个三角形两次函数调用
+            d = 2 * ((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1))
+            if abs(d) < tolerance:
+                append(((x1 + x2 + x3) / 3, (y1 + y2 + y3) / 3))
+                continue
+            dy23 = y2 - y3
+            dy31 = y3 - y1
+            dy12 = y1 - y2
+            sq1 = x1 * x1 + y1 * y1
+            sq2 = x2 * x2 + y2 * y2
+            sq3 = x3 * x3 + y3 * y3
+            append(
+                (
+                    (sq1 * dy23 + sq2 * dy31 + sq3 * dy12) / d,
+                    (sq1 * (x3 - x2) + sq2 * (x1 - x3) + sq3 * (x2 - x1)) / d,
+                )
+            )
+        return result
 
     def incenter(self) -> "Point2D":
         """
@@ -368,18 +624,13 @@ class Triangle(Polygon):
             # 内心应该在三角形内部
             assert tri.contains_point(incenter)
         """
-        a, b, c = self.get_side_lengths()
-        perimeter = a + b + c
-
-        if perimeter < self.TOLERANCE:
-            return self.get_center()
-
-        p1, p2, p3 = self.vertices
-
-        ux = (a * p1.x + b * p2.x + c * p3.x) / perimeter
-        uy = (a * p1.y + b * p2.y + c * p3.y) / perimeter
-
-        return Point2D(ux, uy)
+        center = self._incenter
+        if center is None:
+            center = _incenter_xy(self.get_side_lengths(), self._get_xy(), self.TOLERANCE)
+            if center is None:
+                return self.get_center()
+            self._incenter = center
+        return Point2D(center[0], center[1])
 
     def orthocenter(self) -> "Point2D":
         """
@@ -394,26 +645,16 @@ class Triangle(Polygon):
             - 钝角三角形的垂心在三角形外部
 
         计算方法:
-            使用行列式法。设三个顶点为 P1 = (x1, y1), P2 = (x2, y2), P3 = (x3, y3)，
-            定义向量 P1P2 = (A, B) 和 P1P3 = (C, D)，则垂心坐标为：
+            利用欧拉线关系：垂心 H、重心 G、外心 O 共线且 :math:`\\vec{H} = 3\\vec{G} - 2\\vec{O}`，
+            而 :math:`3\\vec{G} = P_1 + P_2 + P_3`，故：
 
             .. math::
 
-                A = x_2 - x_1, \\quad B = y_2 - y_1
+                H_x = x_1 + x_2 + x_3 - 2 O_x
 
-                C = x_3 - x_1, \\quad D = y_3 - y_1
+                H_y = y_1 + y_2 + y_3 - 2 O_y
 
-                E = A(x_1 + x_2) + B(y_1 + y_2)
-
-                F = C(x_1 + x_3) + D(y_1 + y_3)
-
-                G = 2(A(x_2 - x_3) + B(y_2 - y_3))
-
-                H_x = \\frac{DE - BF}{G}
-
-                H_y = \\frac{AF - CE}{G}
-
-            其中 :math:`G` 为行列式，当 :math:`G \\approx 0` 时三点共线
+            外心 O 复用 circumcenter() 的缓存，不再单独求解两条高的交点
 
         返回:
             Point2D: 垂心坐标；若三点共线，返回三角形中心
@@ -438,24 +679,12 @@ class Triangle(Polygon):
             centroid_eq = tri_eq.centroid()
             # assert orthocenter_eq 接近 centroid_eq
         """
-        p1, p2, p3 = self.vertices
-
-        A = p2.x - p1.x
-        B = p2.y - p1.y
-        C = p3.x - p1.x
-        D = p3.y - p1.y
-
-        E = A * (p1.x + p2.x) + B * (p1.y + p2.y)
-        F = C * (p1.x + p3.x) + D * (p1.y + p3.y)
-        G = 2.0 * (A * (p2.x - p3.x) + B * (p2.y - p3.y))
-
-        if abs(G) < self.TOLERANCE:
-            return self.get_center()
-
-        ix = (D * E - B * F) / G
-        iy = (A * F - C * E) / G
-
-        return Point2D(ix, iy)
+        center = self._orthocenter
+        if center is None:
+            (x1, y1), (x2, y2), (x3, y3) = self._get_xy()
+            ox, oy = self._get_circumcenter_xy()
+            center = self._orthocenter = (x1 + x2 + x3 - 2.0 * ox, y1 + y2 + y3 - 2.0 * oy)
+        return Point2D(center[0], center[1])
 
     def centroid(self) -> "Point2D":
         """
@@ -469,6 +698,40 @@ class Triangle(Polygon):
         """
         return self.get_center()
 
+    def compute_all_centers(
+        self,
+    ) -> Tuple["Point2D", "Point2D", "Point2D", "Point2D", float, float]:
+        """
+        一次获取重心、外心、垂心、内心及外接圆、内切圆半径
+
+        说明:
+            - 绘制欧拉线、九点圆等场景通常连续调用上述各方法，这里一次返回全部结果
+            - 共享同一份坐标、边长、面积与外心缓存：垂心由欧拉线关系从外心和重心得到，
+              两个半径复用缓存的边长与面积，不重复计算行列式
+            - 结果与逐个调用对应方法一致
+
+        返回:
+            Tuple[Point2D, Point2D, Point2D, Point2D, float, float]:
+                (重心, 外心, 垂心, 内心, 外接圆半径, 内切圆半径)
+
+        复杂度:
+            O(1)
+
+        使用示例::
+
+            tri = Triangle.from_sides(3.0, 4.0, 5.0)
+            G, O, H, I, R, r = tri.compute_all_centers()
+            # R = 2.5, r = 1.0
+        """
+        return (
+            self.centroid(),
+            self.circumcenter(),
+            self.orthocenter(),
+            self.incenter(),
+            self.circumradius(),
+            self.inradius(),
+        )
+
     def circumradius(self) -> float:
         """
         计算三角形的外接圆半径
@@ -489,13 +752,8 @@ class Triangle(Polygon):
 
                 R = \\frac{abc}{4A}
 
-            其中 :math:`A` 由海伦公式计算：
-
-            .. math::
-
-                s = \\frac{a + b + c}{2} \\quad (\\text{半周长})
-
-                A = \\sqrt{s(s-a)(s-b)(s-c)}
+            其中 :math:`A` 直接取 area() 的缓存值，即两条边向量叉积的一半（n = 3 的鞋带公式），
+            不经过海伦公式，也就没有针状三角形的相消误差。
 
         重要性质:
             - 外接圆是经过三角形三个顶点的唯一圆
@@ -526,14 +784,14 @@ class Triangle(Polygon):
             # R = a / sqrt(3) ≈ 0.577
             assert abs(R_eq - 1.0 / math.sqrt(3)) < 1e-9
         """
-        a, b, c = self.get_side_lengths()
-        s = (a + b + c) / 2.0
         area = self.area()
 
         if area < self.TOLERANCE:
             return float("inf")
 
-        return (a * b * c) / (4 * area)
+        a, b, c = self.get_side_lengths()
+        abc = a * b * c
+        return abc / (4 * area)
 
     def inradius(self) -> float:
         """
@@ -561,6 +819,9 @@ class Triangle(Polygon):
 
                 \\therefore r = \\frac{A}{s}
 
+            面积 A 与周长均直接取 area()、perimeter() 的缓存值：面积为两条边向量叉积的一半，
+            不经过海伦公式
+
         重要性质:
             - 内切圆是与三角形三条边都相切的最大圆
             - 内心到三条边的距离都等于 r
@@ -591,29 +852,37 @@ class Triangle(Polygon):
             # r = a / (2*sqrt(3)) ≈ 0.289
             assert abs(r_eq - 1.0 / (2 * math.sqrt(3))) < 1e-9
         """
-        a, b, c = self.get_side_lengths()
-        s = (a + b + c) / 2.0
-        area = self.area()
+        s = self.perimeter() * 0.5
 
         if s < self.TOLERANCE:
             return 0.0
 
-        return area / s
+        return self.area() / s
 
     def is_right_angled(self, tolerance: float = 1e-6) -> bool:
         """
         判断是否为直角三角形
 
+        说明:
+            - 勾股定理直接作用于缓存的边长平方，不开方
+            - 通过两次比较找出最长边，不对三个平方值排序
+
         Args:
-            tolerance: float - 容差
+            tolerance: float - 容差，作用于 :math:`|a^2 + b^2 - c^2|`，
+              即以长度平方为单位（c 为最长边）
 
         返回:
             bool: 是否为直角三角形
         """
-        a, b, c = self.get_side_lengths()
-        sides = sorted([a, b, c])
+        a2, b2, c2 = self.get_side_lengths_sq()
+        if a2 > b2 and a2 > c2:
+            residual = b2 + c2 - a2
+        elif b2 > c2:
+            residual = a2 + c2 - b2
+        else:
+            residual = a2 + b2 - c2
 
-        return abs(sides[0] * sides[0] + sides[1] * sides[1] - sides[2] * sides[2]) < tolerance
+        return abs(residual) < tolerance
 
     def is_equilateral(self, tolerance: float = 1e-6) -> bool:
         """
@@ -684,3 +953,155 @@ class Triangle(Polygon):
             # 输出: Triangle(Point2D(0.0, 0.0), Point2D(3.0, 0.0), Point2D(...))
         """
         return f"Triangle({self.vertices[0]}, {self.vertices[1]}, {self.vertices[2]})"
+
+
+def _signed_double_area(xy: Sequence[Tuple[float, float]]) -> float:
+    """
+    有向二倍面积内核（纯浮点运算）
+
+    说明:
+        - 两条边向量 P1P2、P1P3 的叉积，逆时针为正
+        - 即外心公式中的行列式 D，也是面积与内角公式中的 2S
+
+    Args:
+        xy: Sequence[Tuple[float, float]] - 三个顶点坐标
+
+    返回:
+        float: 有向二倍面积
+    """
+    (x1, y1), (x2, y2), (x3, y3) = xy
+    return (x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1)
+
+
+def _circumcenter_xy(
+    xy: Sequence[Tuple[float, float]], cross: float, tolerance: float
+) -> Optional[Tuple[float, float]]:
+    """
+    外心内核（纯浮点运算）
+
+    说明:
+        - 只操作顶点坐标元组，不访问 Point2D 对象，供 circumcenter() 与
+          circumcenters_of() 共用
+        - 行列式法，公式见 Triangle.circumcenter()；行列式直接取 2 倍的有向二倍面积，
+          由调用方传入（Triangle 上与 area()、get_angles() 共用同一次叉积）
+        - 先判退化，三点共线时不计算顶点模长平方
+
+    Args:
+        xy: Sequence[Tuple[float, float]] - 三个顶点坐标
+        cross: float - 有向二倍面积，见 _signed_double_area()
+        tolerance: float - 判定三点共线的容差
+
+    返回:
+        Optional[Tuple[float, float]]: 外心坐标；三点共线时返回 None
+    """
+    d = 2 * cross
+
+    if abs(d) < tolerance:
+        return None
+
+    (x1, y1), (x2, y2), (x3, y3) = xy
+    dy23 = y2 - y3
+    dy31 = y3 - y1
+    dy12 = y1 - y2
+
+    sq1 = x1 * x1 + y1 * y1
+    sq2 = x2 * x2 + y2 * y2
+    sq3 = x3 * x3 + y3 * y3
+
+    ux = (sq1 * dy23 + sq2 * dy31 + sq3 * dy12) / d
+    uy = (sq1 * (x3 - x2) + sq2 * (x1 - x3) + sq3 * (x2 - x1)) / d
+
+    return (ux, uy)
+
+
+def _kahan_triangle_area(a: float, b: float, c: float) -> float:
+    """
+    由三边长计算三角形面积（Kahan 数值稳定的海伦公式）
+
+    说明:
+        - 先用三次比较交换把三边排序为 a >= b >= c，再按括号顺序求值：
+
+        .. math::
+
+            A = \\frac{1}{4} \\sqrt{(a+(b+c))(c-(a-b))(c+(a-b))(a+(b-c))}
+
+        - 括号不可化简：正是这个求值顺序避免了针状三角形的相消误差
+        - 输入本身的舍入误差仍可能使被开方数略小于 0，此时按 0 处理
+
+    Args:
+        a: float - 边长
+        b: float - 边长
+        c: float - 边长
+
+    返回:
+        float: 三角形面积（非负）
+    """
+    if a < b:
+        a, b = b, a
+    if b < c:
+        b, c = c, b
+    if a < b:
+        a, b = b, a
+
+    radicand = (a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c))
+    return 0.25 * math.sqrt(max(radicand, 0.0))
+
+
+def _angles_xy(squares: Tuple[float, float, float], cross: float) -> Tuple[float, float, float]:
+    """
+    内角内核（纯浮点运算）
+
+    说明:
+        - 只操作边长平方与有向二倍面积，供 get_angles() 与 angles_of() 共用
+        - atan2 形式，公式见 Triangle.get_angles()；4 倍面积即 2|cross|
+
+    Args:
+        squares: Tuple[float, float, float] - 三边长平方 (a², b², c²)
+        cross: float - 有向二倍面积，见 _signed_double_area()
+
+    返回:
+        Tuple[float, float, float]: 三个内角，单位为度 (A, B, C)
+    """
+    a2, b2, c2 = squares
+    four_area = 2.0 * abs(cross)
+
+    atan2 = math.atan2
+    degrees = math.degrees
+    return (
+        degrees(atan2(four_area, b2 + c2 - a2)),
+        degrees(atan2(four_area, a2 + c2 - b2)),
+        degrees(atan2(four_area, a2 + b2 - c2)),
+    )
+
+
+def _incenter_xy(
+    sides: Tuple[float, float, float], xy: Sequence[Tuple[float, float]], tolerance: float
+) -> Optional[Tuple[float, float]]:
+    """
+    内心内核（纯浮点运算）
+
+    说明:
+        - 只操作边长与顶点坐标元组，公式见 Triangle.incenter()
+        - sides 与 get_side_lengths() 顺序一致，即 (|P1P2|, |P2P3|, |P3P1|)；
+          每个顶点的权重是其对边长度，故 P1、P2、P3 分别取 sides[1]、sides[2]、sides[0]
+
+    Args:
+        sides: Tuple[float, float, float] - 三边长 (|P1P2|, |P2P3|, |P3P1|)
+        xy: Sequence[Tuple[float, float]] - 三个顶点坐标
+        tolerance: float - 判定退化的周长容差
+
+    返回:
+        Optional[Tuple[float, float]]: 内心坐标；周长小于容差时返回 None
+    """
+    c, a, b = sides
+    perimeter = a + b + c
+
+    if perimeter < tolerance:
+        return None
+
+    (x1, y1), (x2, y2), (x3, y3) = xy
+
+    ux = (a * x1 + b * x2 + c * x3) / perimeter
+    uy = (a * y1 + b * y2 + c * y3) / perimeter
+
+    return (ux, uy)
@@ -135,23 +135,33 @@ def polygon_vertex_angles(polygon: "Polygon", tolerance: float = 1e-10) -> List[
         3. 计算有向角，然后取其补角得到内角
         4. 内角 = 360 - 有向角
     """
-    vertices = polygon.vertices
-    n = len(vertices)
+    xy = polygon._get_xy()
+    n = len(xy)
 
     if n < 3:
         return []
 
+    # 与 angle_between_three_points() 逐项相同的运算，直接在缓存的浮点坐标上完成，
+    # 不为每个顶点构造两个 Vector2D
+    two_pi = 2 * math.pi
     angles = []
-    for i in range(n):
-        prev_idx = (i - 1) % n
-        next_idx = (i + 1) % n
-
-        # 计算从 prev_idx 经过 i 到 next_idx 的有向角
-        # 由于多边形顶点通常逆时针排列，有向角是外角
-        # 内角 = 360 - 有向角
-        exterior_angle = angle_between_three_points(
-            vertices[prev_idx], vertices[i], vertices[next_idx], tolerance
-        )
+    px, py = xy[-1]
+    cx, cy = xy[0]
+    for nx, ny in xy[1:] + xy[:1]:
+        ux = px - cx
+        uy = py - cy
+        vx = nx - cx
+        vy = ny - cy
+        exterior_angle = 0.0
+        if math.sqrt(ux * ux + uy * uy) >= tolerance and math.sqrt(vx * vx + vy * vy) >= tolerance:
+            # 从 prev 经过当前顶点到 next 的有向角
+            # 由于多边形顶点通常逆时针排列，有向角是外角
+            exterior_angle = math.degrees(math.atan2(vy, vx) % two_pi - math.atan2(uy, ux) % two_pi)
+            # 范围化到 [0, 360)
+            while exterior_angle < 0:
+                exterior_angle += 360.0
+            while exterior_angle >= 360.0:
+                exterior_angle -= 360.0
 
         # 内角是补角
         interior_angle = 360.0 - exterior_angle
@@ -161,6 +171,8 @@ def polygon_vertex_angles(polygon: "Polygon", tolerance: float = 1e-10) -> List[
             interior_angle -= 360.0
 
         angles.append(interior_angle)
+        px, py = cx, cy
+        cx, cy = nx, ny
 
     return angles
 
@@ -173,6 +173,8 @@ def polygon_intersection_points(
         - 获取两个多边形的所有边
         - 对每对边进行交点检测
         - 收集并去重所有交点
+        - 每条边的 LineSegment 只构造一次；两边的缓存包围盒不重叠时直接跳过，
+          交点及其顺序与逐对检测一致
 
     Args:
         poly1: Polygon - 第一个多边形
@@ -182,16 +184,19 @@ def polygon_intersection_points(
     返回:
         List[Point2D]: 交点列表（可能为空）
     """
-    edges1 = poly1.get_edges()
-    edges2 = poly2.get_edges()
+    segments1 = [LineSegment(a, b) for a, b in poly1.get_edges()]
+    segments2 = [LineSegment(a, b) for a, b in poly2.get_edges()]
+    boxes2 = poly2._get_edge_boxes()
 
     intersections = []
 
-    for e1 in edges1:
-        for e2 in edges2:
-            point = line_segment_intersection(
-                LineSegment(e1[0], e1[1]), LineSegment(e2[0], e2[1])
-            )
+    for s1, (x_lo, x_hi, y_lo, y_hi) in zip(segments1, poly1._get_edge_boxes(), strict=True):
+        for s2, (other_x_lo, other_x_hi, other_y_lo, other_y_hi) in zip(
+            segments2, boxes2, strict=True
+        ):
+            if other_x_hi < x_lo or other_x_lo > x_hi or other_y_hi < y_lo or other_y_lo > y_hi:
+                continue
+            point = line_segment_intersection(s1, s2)
             if point is not None:
                 if not _point_in_list(point, intersections, tolerance):
                     intersections.append(point)
@@ -291,6 +296,8 @@ def point_to_polygon_distance(point: "Point2D", poly: "Polygon") -> float:
     说明:
         - 如果点在多边形内，距离为0
         - 如果点在多边形外，计算到最近边的距离
+        - 直接在多边形缓存的坐标上逐边求投影，不为每条边构造 LineSegment 与最近点，
+          只比较距离平方，最后开方一次
 
     Args:
         point: Point2D - 目标点
@@ -302,15 +309,31 @@ def point_to_polygon_distance(point: "Point2D", poly: "Polygon") -> float:
     if poly.contains_point(point):
         return 0.0
 
-    min_distance = float("inf")
-
-    for edge in poly.get_edges():
-        segment = LineSegment(edge[0], edge[1])
-        distance = point_to_segment_distance(point, segment)
-        if distance < min_distance:
-            min_distance = distance
-
-    return min_distance
+    x, y = point.x, point.y
+    xy = poly._get_xy()
+    min_sq = math.inf
+
+    x1, y1 = xy[-1]
+    for x2, y2 in xy:
+        dx = x2 - x1
+        dy = y2 - y1
+        len_sq = dx * dx + dy * dy
+
+        # 与 LineSegment.get_parameter 相同：退化边取起点，t 截断到 [0, 1]
+        t = 0.0
+        if len_sq >= 1e-15:
+            t = ((x - x1) * dx + (y - y1) * dy) / len_sq
+            t = max(0.0, min(1.0, t))
+
+        ex = x - (x1 + t * dx)
+        ey = y - (y1 + t * dy)
+        dist_sq = ex * ex + ey * ey
+        if dist_sq < min_sq:
+            min_sq = dist_sq
+
+        x1, y1 = x2, y2
+
+    return math.sqrt(min_sq)
 
 
 def angle_between(v1: "Vector2D", v2: "Vector2D") -> float:
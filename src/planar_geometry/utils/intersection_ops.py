@@ -313,11 +313,10 @@ def line_polygon_intersection_points(
     from planar_geometry.curve import LineSegment
     from planar_geometry.point import Point2D
 
-    edges = polygon.get_edges()
     intersections = []
     seen_points = set()
 
-    for edge in edges:
+    for edge in polygon.iter_edges():
         # 用已有的线段-直线交点函数
         # 需要将直线转换为参数形式与线段求交
         point = _line_segment_intersection(line, edge, tolerance)
@@ -519,8 +518,11 @@ def ellipse_circle_intersection(
 
     center_e = ellipse.center
     cx_e, cy_e = center_e.x, center_e.y
-    a = ellipse.semi_major_axis
-    b = ellipse.semi_minor_axis
+    # 椭圆缓存了 1/a²、1/b² 与旋转角的 cos/sin，采样循环内只做乘法
+    inv_a2 = ellipse._inv_a2
+    inv_b2 = ellipse._inv_b2
+    cos_r = ellipse._cos_r
+    sin_r = ellipse._sin_r
 
     center_c = circle.center
     xc, yc = center_c.x, center_c.y
@@ -528,14 +530,18 @@ def ellipse_circle_intersection(
 
     result = []
 
-    # 参数扫描（36 个采样点）
+    # 参数扫描（360 个采样点）
     for i in range(360):
         angle_rad = math.radians(i)
         x = xc + r * math.cos(angle_rad)
         y = yc + r * math.sin(angle_rad)
 
-        # 检查点是否在椭圆上（在容差范围内）
-        ellipse_eq = (x - cx_e) ** 2 / (a**2) + (y - cy_e) ** 2 / (b**2)
+        # 检查点是否在椭圆上（在容差范围内），先转到椭圆的局部坐标系
+        dx = x - cx_e
+        dy = y - cy_e
+        x_rot = dx * cos_r + dy * sin_r
+        y_rot = -dx * sin_r + dy * cos_r
+        ellipse_eq = (x_rot * x_rot) * inv_a2 + (y_rot * y_rot) * inv_b2
 
         if abs(ellipse_eq - 1) < tolerance:
             # 检查是否已添加过这个点
@@ -74,7 +74,6 @@ def nearest_point_on_geometry(
         >>> nearest, dist = nearest_point_on_geometry(point, circle)
         >>> print(f"最近点: {nearest}, 距离: {dist}")
     """
-    from planar_geometry.curve import Line, LineSegment
     from planar_geometry.surface import Circle, Polygon, Ellipse, Rectangle
 
     # 直线：返回投影点
@@ -101,15 +100,11 @@ def nearest_point_on_geometry(
 
         if dist_to_center < tolerance:
             # 点在圆心，返回圆周上任意一点
-            from planar_geometry.point import Point2D
-
             closest = Point2D(center.x + radius, center.y)
             return (closest, radius)
 
         # 圆周上的最近点
         factor = radius / dist_to_center
-        from planar_geometry.point import Point2D
-
         closest = Point2D(center.x + dx * factor, center.y + dy * factor)
         distance = point.distance_to(center) - radius
 
@@ -125,8 +120,6 @@ def nearest_point_on_geometry(
         closest_x = max(min_x, min(point.x, max_x))
         closest_y = max(min_y, min(point.y, max_y))
 
-        from planar_geometry.point import Point2D
-
         closest = Point2D(closest_x, closest_y)
         distance = point.distance_to(closest)
 
@@ -134,24 +127,11 @@ def nearest_point_on_geometry(
 
     # 多边形：遍历所有边找最近点
     elif isinstance(geometry, Polygon):
-        edges = geometry.get_edges()
-        min_distance = float("inf")
-        min_point = None
-
-        for edge in edges:
-            closest, distance = nearest_point_on_geometry(point, edge, tolerance)
-            if distance < min_distance:
-                min_distance = distance
-                min_point = closest
-
-        if min_point is None:
-            # 应该不会发生，但作为防御性编程
-            from planar_geometry.point import Point2D
-
-            min_point = Point2D(0, 0)
-            min_distance = 0
-
-        return (min_point, min_distance)
+        # 在缓存的浮点坐标上逐边投影，只为最终结果创建一个 Point2D
+        closest_x, closest_y, dist_sq = _nearest_on_boundary_xy(
+            point.x, point.y, geometry._get_xy()
+        )
+        return (Point2D(closest_x, closest_y), math.sqrt(dist_sq))
 
     # 椭圆：使用参数化方法找最近点
     elif isinstance(geometry, Ellipse):
@@ -191,39 +171,54 @@ def polygon_nearest_points(
         3. 检查 poly2 的顶点到 poly1 的边的距离
         4. 取最小值
     """
-    min_distance = float("inf")
-    min_point1 = None
-    min_point2 = None
-
     vertices1 = poly1.vertices
     vertices2 = poly2.vertices
+    xy1 = poly1._get_xy()
+    xy2 = poly2._get_xy()
+
+    # 全程在浮点坐标上比较距离平方；记录来源顶点的索引，
+    # 最近点若是投影点则只在最后创建一次 Point2D
+    min_sq = math.inf
+    best1 = best2 = 0
+    closest_xy = None
+    closest_on_first = False
 
     # 检查顶点-顶点距离
-    for v1 in vertices1:
-        for v2 in vertices2:
-            distance = v1.distance_to(v2)
-            if distance < min_distance:
-                min_distance = distance
-                min_point1 = v1
-                min_point2 = v2
+    for i, (x1, y1) in enumerate(xy1):
+        for j, (x2, y2) in enumerate(xy2):
+            dx = x2 - x1
+            dy = y2 - y1
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < min_sq:
+                min_sq = dist_sq
+                best1, best2 = i, j
 
     # 检查 poly1 顶点到 poly2 边的距离
-    for v1 in vertices1:
-        for edge2 in poly2.get_edges():
-            closest, distance = nearest_point_on_geometry(v1, edge2, tolerance)
-            if distance < min_distance:
-                min_distance = distance
-                min_point1 = v1
-                min_point2 = closest
+    for i, (x1, y1) in enumerate(xy1):
+        cx, cy, dist_sq = _nearest_on_boundary_xy(x1, y1, xy2)
+        if dist_sq < min_sq:
+            min_sq = dist_sq
+            best1 = i
+            closest_xy = (cx, cy)
+            closest_on_first = False
 
     # 检查 poly2 顶点到 poly1 边的距离
-    for v2 in vertices2:
-        for edge1 in poly1.get_edges():
-            closest, distance = nearest_point_on_geometry(v2, edge1, tolerance)
-            if distance < min_distance:
-                min_distance = distance
-                min_point1 = closest
-                min_point2 = v2
+    for j, (x2, y2) in enumerate(xy2):
+        cx, cy, dist_sq = _nearest_on_boundary_xy(x2, y2, xy1)
+        if dist_sq < min_sq:
+            min_sq = dist_sq
+            best2 = j
+            closest_xy = (cx, cy)
+            closest_on_first = True
+
+    min_point1 = vertices1[best1]
+    min_point2 = vertices2[best2]
+    if closest_xy is not None:
+        if closest_on_first:
+            min_point1 = Point2D(*closest_xy)
+        else:
+            min_point2 = Point2D(*closest_xy)
+    min_distance = math.sqrt(min_sq)
 
     return (min_point1, min_point2, min_distance)
 
@@ -259,8 +254,6 @@ def point_to_circle_nearest(
         >>> nearest, dist, angle = point_to_circle_nearest(point, circle)
         >>> print(f"最近点在 {angle}° 方向，距离 {dist}")
     """
-    from planar_geometry.point import Point2D
-
     center = circle.center
     radius = circle.radius
 
@@ -310,31 +303,86 @@ def _ellipse_nearest_point(
     返回:
         Tuple[Point2D, float]: (最近点, 距离)
     """
-    from planar_geometry.point import Point2D
-
     center = ellipse.center
-    a = ellipse.semi_major_axis
-    b = ellipse.semi_minor_axis
-    angle_rad = math.radians(ellipse.rotation_angle)
+    cx, cy = center.x, center.y
+    a = ellipse.semi_major
+    b = ellipse.semi_minor
+    # 旋转角的正余弦在椭圆上已缓存，扫描循环内只需计算参数角 t 的正余弦
+    cos_r = ellipse._cos_r
+    sin_r = ellipse._sin_r
+    a_cos, a_sin = a * cos_r, a * sin_r
+    b_cos, b_sin = b * cos_r, b * sin_r
+    px, py = point.x, point.y
 
     # 参数扫描法：椭圆上的点 = (cx + a*cos(t)*cos(θ) - b*sin(t)*sin(θ),
     #                            cy + a*cos(t)*sin(θ) + b*sin(t)*cos(θ))
+    cos, sin, hypot = math.cos, math.sin, math.hypot
+    step = math.pi / 180.0
     min_distance = float("inf")
-    best_point = None
+    best_x = best_y = 0.0
 
     for i in range(360):
-        t = math.radians(i)
-        cos_t = math.cos(t)
-        sin_t = math.sin(t)
+        t = i * step
+        cos_t = cos(t)
+        sin_t = sin(t)
 
-        x = center.x + a * cos_t * math.cos(angle_rad) - b * sin_t * math.sin(angle_rad)
-        y = center.y + a * cos_t * math.sin(angle_rad) + b * sin_t * math.cos(angle_rad)
-
-        ellipse_point = Point2D(x, y)
-        distance = point.distance_to(ellipse_point)
+        x = cx + a_cos * cos_t - b_sin * sin_t
+        y = cy + a_sin * cos_t + b_cos * sin_t
+        distance = hypot(px - x, py - y)
 
         if distance < min_distance:
             min_distance = distance
-            best_point = ellipse_point
+            best_x, best_y = x, y
+
+    return (Point2D(best_x, best_y), min_distance)
+
+
+def _nearest_on_boundary_xy(
+    px: float, py: float, xy: Tuple[Tuple[float, float], ...]
+) -> Tuple[float, float, float]:
+    """
+    私有函数：点到多边形边界（闭合折线）的最近点（纯浮点运算）
+
+    说明:
+        - 按 (P0, P1), (P1, P2), ..., (Pn-1, P0) 的顺序逐边投影，等距时保留先出现的边
+        - 投影参数与 LineSegment.get_parameter 相同：退化边取起点，t 截断到 [0, 1]
+        - 只比较距离平方，不创建任何 Point2D
+
+    Args:
+        px: float - 查询点 x 坐标
+        py: float - 查询点 y 坐标
+        xy: Tuple[Tuple[float, float], ...] - 多边形顶点坐标
+
+    返回:
+        Tuple[float, float, float]: (最近点 x, 最近点 y, 距离平方)
+    """
+    best_x = best_y = 0.0
+    min_sq = math.inf
+
+    x1, y1 = xy[0]
+    for x2, y2 in xy[1:] + xy[:1]:
+        dx = x2 - x1
+        dy = y2 - y1
+        len_sq = dx * dx + dy * dy
+
+        t = 0.0
+        if len_sq >= 1e-15:
+            t = ((px - x1) * dx + (py - y1) * dy) / len_sq
+            t = max(0.0, min(1.0, t))
+
+        cx = x1 + t * dx
+        cy = y1 + t * dy
+        ex = px - cx
+        ey = py - cy
+        dist_sq = ex * ex + ey * ey
+        if dist_sq < min_sq:
+            min_sq = dist_sq
+            best_x, best_y = cx, cy
+
+        x1, y1 = x2, y2
+
+    return (best_x, best_y, min_sq)
+
 
-    return (best_point, min_distance)
+from planar_geometry.point import Point2D
+from planar_geometry.curve import Line, LineSegment
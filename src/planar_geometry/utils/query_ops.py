@@ -34,7 +34,7 @@ if TYPE_CHECKING:
     from planar_geometry.curve import LineSegment
     from planar_geometry.surface import Circle, Polygon
 
-from .projection_ops import nearest_point_on_geometry
+from .projection_ops import nearest_point_on_geometry, _nearest_on_boundary_xy
 
 
 def point_side_of_segment(
@@ -133,13 +133,11 @@ def circle_polygon_intersect(
     if polygon.contains_point(circle.center):
         return True
 
-    # 检查圆与多边形各边的距离
-    for edge in polygon.get_edges():
-        closest, distance = nearest_point_on_geometry(circle.center, edge, tolerance)
-        if distance <= circle.radius + tolerance:
-            return True
-
-    return False
+    # 检查圆与多边形各边的距离（在缓存的浮点坐标上计算，不创建 Point2D）
+    center = circle.center
+    _, _, dist_sq = _nearest_on_boundary_xy(center.x, center.y, polygon._get_xy())
+    reach = circle.radius + tolerance
+    return dist_sq <= reach * reach
 
 
 def minimum_distance(geom1, geom2, tolerance: float = 1e-10) -> float:
@@ -23,6 +23,11 @@ from planar_geometry import (
     Rectangle,
     Circle,
     Polygon,
+    Ellipse,
+    nearest_point_on_geometry,
+    ellipse_circle_intersection,
+    polygon_nearest_points,
+    circle_polygon_intersect,
     line_segment_intersection,
     line_intersection,
     rectangle_intersection_points,
@@ -35,6 +40,7 @@ from planar_geometry import (
     point_to_polygon_distance,
     angle_between,
     angle_between_rad,
+    polygon_vertex_angles,
     are_perpendicular,
     are_parallel,
     segments_distance,
@@ -111,6 +117,15 @@ class TestPolygonIntersection(unittest.TestCase):
         points = polygon_intersection_points(tri1, tri2)
         self.assertTrue(len(points) > 0)
 
+    def test_overlapping_squares_points(self):
+        """测试错开的两个正方形恰有两个交点，且与顶点重新赋值后的结果一致"""
+        sq1 = Polygon([Point2D(0, 0), Point2D(2, 0), Point2D(2, 2), Point2D(0, 2)])
+        sq2 = Polygon([Point2D(1, 1), Point2D(3, 1), Point2D(3, 3), Point2D(1, 3)])
+        points = polygon_intersection_points(sq1, sq2)
+        self.assertEqual(sorted((p.x, p.y) for p in points), [(1.0, 2.0), (2.0, 1.0)])
+        sq2.vertices = [Point2D(5, 5), Point2D(6, 5), Point2D(6, 6), Point2D(5, 6)]
+        self.assertEqual(polygon_intersection_points(sq1, sq2), [])
+
 
 class TestPointToSegmentDistance(unittest.TestCase):
     """点到线段距离测试"""
@@ -191,6 +206,62 @@ class TestPointToPolygonDistance(unittest.TestCase):
         distance = point_to_polygon_distance(Point2D(5, 1), poly)
         self.assertEqual(distance, 1.0)
 
+    def test_outside_nearest_vertex(self):
+        """测试最近点为顶点时的距离"""
+        poly = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
+        distance = point_to_polygon_distance(Point2D(7, 7), poly)
+        self.assertAlmostEqual(distance, 5.0)
+
+
+class TestNearestPointOnEllipse(unittest.TestCase):
+    """点到椭圆最近点测试"""
+
+    def test_rotated_ellipse(self):
+        """测试旋转椭圆的最近点与距离"""
+        ellipse = Ellipse(Point2D(1, 1), 2, 1, 90)
+        nearest, distance = nearest_point_on_geometry(Point2D(1, 6), ellipse)
+        self.assertAlmostEqual(nearest.x, 1.0)
+        self.assertAlmostEqual(nearest.y, 3.0)
+        self.assertAlmostEqual(distance, 3.0)
+
+
+class TestNearestPointOnPolygon(unittest.TestCase):
+    """点/圆/多边形到多边形边界的最近点测试"""
+
+    def setUp(self):
+        self.rect = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
+
+    def test_point_to_polygon_boundary(self):
+        """测试点到多边形边界的最近点"""
+        nearest, distance = nearest_point_on_geometry(Point2D(6, 1), self.rect)
+        self.assertEqual((nearest.x, nearest.y), (4.0, 1.0))
+        self.assertEqual(distance, 2.0)
+
+    def test_polygon_nearest_points(self):
+        """测试两个多边形间的最近点对"""
+        other = Polygon([Point2D(6, 1), Point2D(8, 1), Point2D(7, 5)])
+        p1, p2, distance = polygon_nearest_points(self.rect, other)
+        self.assertEqual((p1.x, p1.y), (4.0, 1.0))
+        self.assertIs(p2, other.vertices[0])
+        self.assertEqual(distance, 2.0)
+
+    def test_circle_polygon_intersect(self):
+        """测试圆与多边形边界相交判定"""
+        self.assertTrue(circle_polygon_intersect(Circle(Point2D(6, 1), 2.0), self.rect))
+        self.assertFalse(circle_polygon_intersect(Circle(Point2D(6, 1), 1.9), self.rect))
+
+
+class TestEllipseCircleIntersection(unittest.TestCase):
+    """椭圆与圆交点测试"""
+
+    def test_rotated_ellipse_tangent_circle(self):
+        """测试旋转 90° 的椭圆与内切圆的切点"""
+        ellipse = Ellipse(Point2D(0, 0), 5.0, 3.0, 90.0)
+        points = ellipse_circle_intersection(ellipse, Circle(Point2D(0, 0), 3.0))
+        self.assertEqual(len(points), 2)
+        self.assertAlmostEqual(abs(points[0].x), 3.0)
+        self.assertAlmostEqual(points[0].y, 0.0)
+
 
 class TestAngleBetween(unittest.TestCase):
     """向量夹角测试"""
@@ -217,6 +288,29 @@ class TestAngleBetween(unittest.TestCase):
         self.assertAlmostEqual(angle, 45.0)
 
 
+class TestPolygonVertexAngles(unittest.TestCase):
+    """多边形顶点内角测试"""
+
+    def test_l_shape_angles(self):
+        """测试 L 形多边形按顶点顺序返回内角，凹顶点为 270 度"""
+        poly = Polygon(
+            [
+                Point2D(0, 0),
+                Point2D(4, 0),
+                Point2D(4, 2),
+                Point2D(2, 2),
+                Point2D(2, 4),
+                Point2D(0, 4),
+            ]
+        )
+        self.assertEqual(polygon_vertex_angles(poly), [90.0, 90.0, 90.0, 270.0, 90.0, 90.0])
+
+    def test_degenerate_vertex(self):
+        """测试重复顶点处的内角为 0"""
+        poly = Polygon([Point2D(0, 0), Point2D(0, 0), Point2D(0, 4)])
+        self.assertEqual(polygon_vertex_angles(poly), [0.0, 0.0, 0.0])
+
+
 class TestAngleBetweenRad(unittest.TestCase):
     """向量夹角弧度测试"""
 
@@ -8,6 +8,7 @@ Point2D 单元测试
 作者: wangheng <wangfaofao@gmail.com>
 """
 
+import math
 import unittest
 import sys
 import os
@@ -38,6 +39,13 @@ class TestPoint2DCreation(unittest.TestCase):
         self.assertEqual(p.x, -1.5)
         self.assertEqual(p.y, -2.5)
 
+    def test_slots_without_instance_dict(self):
+        """测试点只存坐标，不分配实例字典"""
+        p = Point2D(1.0, 2.0)
+        self.assertFalse(hasattr(p, "__dict__"))
+        with self.assertRaises(AttributeError):
+            p.z = 3.0
+
 
 class TestPoint2DLength(unittest.TestCase):
     """Point2D 长度测试"""
@@ -213,6 +221,23 @@ class TestPoint2DUtility(unittest.TestCase):
         self.assertEqual(origin.x, 0.0)
         self.assertEqual(origin.y, 0.0)
 
+    def test_intern(self):
+        """测试驻留点复用"""
+        p1 = Point2D.intern(1.5, 2.5)
+        p2 = Point2D.intern(1.5, 2.5)
+        self.assertIs(p1, p2)
+        self.assertIsNot(p1, Point2D.intern(1.5, 2.6))
+        self.assertIsNot(p1, Point2D(1.5, 2.5))
+
+    def test_intern_keeps_sign_and_type(self):
+        """测试驻留点区分 0.0 与 -0.0、1 与 1.0"""
+        neg = Point2D.intern(-0.0, 1)
+        pos = Point2D.intern(0.0, 1.0)
+        self.assertIsNot(neg, pos)
+        self.assertEqual(math.copysign(1.0, neg.x), -1.0)
+        self.assertIs(type(neg.y), int)
+        self.assertIs(type(pos.y), float)
+
     def test_hash(self):
         """测试哈希"""
         p1 = Point2D(1.0, 2.0)
@@ -26,6 +26,18 @@ class TestRectangleCreation(unittest.TestCase):
         rect = Rectangle.from_center_and_size(Point2D(0, 0), 2.0, Vector2D(1, 0))
         self.assertEqual(len(rect.vertices), 4)
 
+    def test_from_center_and_size_normalizes_direction(self):
+        """测试方向向量在内部归一化"""
+        rect = Rectangle.from_center_and_size(Point2D(1, 1), 2.0, Vector2D(3, 0))
+        self.assertEqual(rect.vertices[0], Point2D(0, 0))
+        self.assertEqual(rect.vertices[2], Point2D(2, 2))
+        self.assertAlmostEqual(rect.area(), 4.0)
+
+    def test_from_center_and_size_zero_direction(self):
+        """测试零方向向量异常"""
+        with self.assertRaises(ValueError):
+            Rectangle.from_center_and_size(Point2D(0, 0), 2.0, Vector2D(0, 0))
+
     def test_from_bounds(self):
         """测试从边界创建"""
         rect = Rectangle.from_bounds(0, 0, 4, 3)
@@ -36,6 +48,13 @@ class TestRectangleCreation(unittest.TestCase):
         with self.assertRaises(ValueError):
             Rectangle([Point2D(0, 0), Point2D(1, 0), Point2D(0, 1)])
 
+    def test_from_bounds_intern(self):
+        """测试相邻矩形共享驻留角点"""
+        left = Rectangle.from_bounds(0, 0, 1, 1, intern=True)
+        right = Rectangle.from_bounds(1, 0, 2, 1, intern=True)
+        self.assertIs(left.vertices[1], right.vertices[0])
+        self.assertIs(left.vertices[2], right.vertices[3])
+
 
 class TestRectangleArea(unittest.TestCase):
     """Rectangle 面积测试"""
@@ -52,6 +71,14 @@ class TestRectangleArea(unittest.TestCase):
         )
         self.assertAlmostEqual(rect.area(), 4.0)
 
+    def test_axis_aligned_clockwise_area(self):
+        """测试顺时针轴对齐矩形的面积、周长与点包含"""
+        rect = Rectangle([Point2D(4, 3), Point2D(0, 3), Point2D(0, 0), Point2D(4, 0)])
+        self.assertEqual(rect.area(), 12.0)
+        self.assertEqual(rect.perimeter(), 14.0)
+        self.assertTrue(rect.contains_point(Point2D(1, 1)))
+        self.assertFalse(rect.contains_point(Point2D(5, 1)))
+
 
 class TestRectanglePerimeter(unittest.TestCase):
     """Rectangle 周长测试"""
@@ -71,6 +98,20 @@ class TestRectangleBounds(unittest.TestCase):
         bounds = rect.get_bounds()
         self.assertEqual(bounds, (0, 0, 4, 3))
 
+    def test_bounds_refresh_on_reassign(self):
+        """测试重新赋值顶点后边界框刷新"""
+        rect = Rectangle.from_bounds(0, 0, 4, 3)
+        rect.vertices = Rectangle.from_bounds(1, 1, 2, 2).vertices
+        self.assertEqual(rect.get_bounds(), (1, 1, 2, 2))
+        self.assertFalse(rect.contains_point(Point2D(3, 3)))
+
+    def test_rotated_bounds(self):
+        """测试旋转矩形（各顶点顺序起点不同）的边界框"""
+        verts = [Point2D(2, 0), Point2D(4, 2), Point2D(2, 4), Point2D(0, 2)]
+        for shift in range(4):
+            rect = Rectangle(verts[shift:] + verts[:shift])
+            self.assertEqual(rect.get_bounds(), (0, 0, 4, 4))
+
 
 class TestRectangleCenter(unittest.TestCase):
     """Rectangle 中心测试"""
@@ -101,6 +142,26 @@ class TestRectangleContains(unittest.TestCase):
         rect = Rectangle.from_bounds(0, 0, 4, 4)
         self.assertFalse(rect.contains_point(Point2D(5, 2)))
 
+    def test_contains_rotated(self):
+        """测试旋转矩形不按外包框判定"""
+        rect = Rectangle.from_center_and_size(Point2D(0, 0), 2.0, Vector2D(1, 1))
+        self.assertTrue(rect.contains_point(Point2D(1.4, 0)))
+        self.assertFalse(rect.contains_point(Point2D(1.0, 1.0)))
+
+    def test_contains_points_batch(self):
+        """测试批量点包含与逐点结果一致"""
+        rect = Rectangle.from_center_and_size(Point2D(0, 0), 2.0, Vector2D(1, 1))
+        points = [Point2D(0, 0), Point2D(1.4, 0), Point2D(1.0, 1.0), Point2D(0, -1.5)]
+        expected = [rect.contains_point(p) for p in points]
+        self.assertEqual(rect.contains_points(points), expected)
+        self.assertEqual(expected, [True, True, False, False])
+
+    def test_contains_xy(self):
+        """测试浮点坐标版本与 contains_point 一致"""
+        rect = Rectangle.from_center_and_size(Point2D(0, 0), 2.0, Vector2D(1, 1))
+        for x, y in ((0, 0), (1.4, 0), (1.0, 1.0), (0, -1.5)):
+            self.assertEqual(rect.contains_xy(x, y), rect.contains_point(Point2D(x, y)))
+
 
 class TestRectangleIsSquare(unittest.TestCase):
     """Rectangle 正方形测试"""
@@ -115,6 +176,14 @@ class TestRectangleIsSquare(unittest.TestCase):
         rect = Rectangle.from_bounds(0, 0, 4, 2)
         self.assertFalse(rect.is_square())
 
+    def test_dimensions_refresh_on_reassign(self):
+        """测试重新赋值顶点后面积、周长与正方形判断刷新"""
+        rect = Rectangle.from_bounds(0, 0, 4, 2)
+        rect.vertices = Rectangle.from_bounds(0, 0, 3, 3).vertices
+        self.assertEqual(rect.area(), 9.0)
+        self.assertEqual(rect.perimeter(), 12.0)
+        self.assertTrue(rect.is_square())
+
 
 class TestCircleCreation(unittest.TestCase):
     """Circle 创建测试"""
@@ -137,6 +206,14 @@ class TestCircleCreation(unittest.TestCase):
         with self.assertRaises(ValueError):
             Circle(Point2D(0, 0), -1.0)
 
+    def test_negative_radius_assignment(self):
+        """测试重新赋值为负半径时抛出异常且原半径保持不变"""
+        circle = Circle(Point2D(0, 0), 1.0)
+        with self.assertRaises(ValueError):
+            circle.radius = -1.0
+        self.assertEqual(circle.radius, 1.0)
+        self.assertTrue(circle.contains_point(Point2D(0.5, 0)))
+
 
 class TestCircleArea(unittest.TestCase):
     """Circle 面积测试"""
@@ -180,6 +257,19 @@ class TestCircleContains(unittest.TestCase):
         circle = Circle(Point2D(0, 0), 5.0)
         self.assertFalse(circle.contains_point(Point2D(6, 0)))
 
+    def test_contains_refresh_on_radius_change(self):
+        """测试修改半径后点包含结果刷新"""
+        circle = Circle(Point2D(0, 0), 5.0)
+        circle.radius = 6.0
+        self.assertTrue(circle.contains_point(Point2D(6, 0)))
+        self.assertFalse(circle.contains_point(Point2D(6.1, 0)))
+
+    def test_contains_xy(self):
+        """测试浮点坐标版本与 contains_point 一致"""
+        circle = Circle(Point2D(1, 1), 2.0)
+        for x, y in ((1, 1), (3, 1), (3.1, 1), (2.5, 2.5)):
+            self.assertEqual(circle.contains_xy(x, y), circle.contains_point(Point2D(x, y)))
+
 
 class TestCircleEquals(unittest.TestCase):
     """Circle 相等测试"""
@@ -226,12 +316,58 @@ class TestPolygonCreation(unittest.TestCase):
         hex = Polygon.regular(6, Point2D(0, 0), 1.0)
         self.assertEqual(len(hex.vertices), 6)
 
+    def test_from_coords(self):
+        """测试从分量坐标创建多边形，结果与由 Point2D 列表构造一致"""
+        poly = Polygon.from_coords([0, 4, 4, 0], [0, 0, 3, 3])
+        rebuilt = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
+        self.assertEqual(poly, rebuilt)
+        self.assertEqual(poly.area(), 12.0)
+        self.assertEqual(poly.get_bounds(), rebuilt.get_bounds())
+        with self.assertRaises(ValueError):
+            Polygon.from_coords([0, 1, 2], [0, 1])
+
+    def test_from_coords_intern(self):
+        """测试相邻多边形共享驻留顶点"""
+        left = Polygon.from_coords([0.0, 1.0, 1.0, 0.0], [0.0, 0.0, 1.0, 1.0], intern=True)
+        right = Polygon.from_coords([1.0, 2.0, 2.0, 1.0], [0.0, 0.0, 1.0, 1.0], intern=True)
+        self.assertIs(left.vertices[1], right.vertices[0])
+        self.assertIs(left.vertices[2], right.vertices[3])
+        square = Polygon.regular(4, Point2D(0, 0), 1.0, intern=True)
+        self.assertIs(square.vertices[0], Point2D.intern(1.0, 0.0))
+
+    def test_regular_polygon_matches_vertex_list(self):
+        """测试正多边形预填的坐标缓存与由顶点列表构造的结果一致"""
+        hexagon = Polygon.regular(6, Point2D(1, 2), 3.0, 15.0)
+        rebuilt = Polygon(list(hexagon.vertices))
+        self.assertEqual(hexagon.area(), rebuilt.area())
+        self.assertEqual(hexagon.get_bounds(), rebuilt.get_bounds())
+        self.assertTrue(hexagon.contains_point(Point2D(1, 2)))
+
     def test_triangle_factory(self):
         """测试三角形工厂"""
         tri = Polygon.triangle(Point2D(0, 0), Point2D(3, 0), Point2D(0, 4))
         self.assertEqual(len(tri.vertices), 3)
 
 
+class TestPolygonEquals(unittest.TestCase):
+    """Polygon 相等性测试"""
+
+    def test_equals_within_tolerance(self):
+        """测试顶点在容差内相同的多边形相等"""
+        p1 = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(0, 3)])
+        p2 = Polygon([Point2D(0, 0), Point2D(4 + 1e-12, 0), Point2D(0, 3)])
+        self.assertEqual(p1, p2)
+        self.assertEqual(p1, Polygon(list(p1.vertices)))
+
+    def test_not_equals(self):
+        """测试顶点不同或顶点数不同的多边形不相等"""
+        p1 = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(0, 3)])
+        self.assertNotEqual(p1, Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(0, 3.1)]))
+        self.assertNotEqual(
+            p1, Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
+        )
+
+
 class TestPolygonArea(unittest.TestCase):
     """Polygon 面积测试"""
 
@@ -240,6 +376,57 @@ class TestPolygonArea(unittest.TestCase):
         tri = Polygon([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
         self.assertEqual(tri.area(), 6.0)
 
+    def test_area_far_from_origin(self):
+        """测试远离原点的细长多边形面积精度"""
+        base = 1e6
+        poly = Polygon(
+            [
+                Point2D(base, base),
+                Point2D(base + 1, base),
+                Point2D(base + 1, base + 1e-3),
+                Point2D(base, base + 1e-3),
+            ]
+        )
+        self.assertAlmostEqual(poly.area(), 1e-3, places=8)
+
+    def test_triangle_and_quad_area_match_general_formula(self):
+        """测试三角形与四边形闭式面积与五边形（通用循环）结果一致"""
+        tri = Polygon([Point2D(1, 1), Point2D(5, 2), Point2D(2, 6)])
+        self.assertAlmostEqual(tri.area(), 9.5)
+        quad = Polygon([Point2D(0, 0), Point2D(4, 1), Point2D(5, 5), Point2D(1, 4)])
+        pent = Polygon(
+            [Point2D(0, 0), Point2D(4, 1), Point2D(5, 5), Point2D(3, 4.5), Point2D(1, 4)]
+        )
+        self.assertAlmostEqual(quad.area(), 15.0)
+        self.assertAlmostEqual(pent.area(), 15.0)
+
+    def test_component_cache_before_and_after_pair_cache(self):
+        """测试先后构建分量缓存与点对缓存时结果一致"""
+        verts = [Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)]
+        first = Polygon(verts)
+        center = first.get_center()
+        self.assertEqual(first.get_bounds(), (0, 0, 4, 3))
+        second = Polygon(verts)
+        second.get_bounds()
+        self.assertTrue(second.get_center().equals(center))
+        self.assertEqual(first._get_xs_ys(), second._get_xs_ys())
+
+    def test_area_perimeter_refresh_on_reassign(self):
+        """测试重新赋值顶点后面积与周长刷新"""
+        poly = Polygon([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
+        self.assertEqual(poly.perimeter(), 12.0)
+        poly.vertices = [Point2D(0, 0), Point2D(2, 0), Point2D(2, 2), Point2D(0, 2)]
+        self.assertEqual(poly.area(), 4.0)
+        self.assertEqual(poly.perimeter(), 8.0)
+
+    def test_convex_refresh_on_reassign(self):
+        """测试凸性缓存在重新赋值顶点后刷新"""
+        poly = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 4), Point2D(0, 4)])
+        self.assertTrue(poly.is_convex())
+        poly.vertices = [Point2D(0, 0), Point2D(4, 0), Point2D(2, 1), Point2D(4, 4), Point2D(0, 4)]
+        self.assertFalse(poly.is_convex())
+        self.assertEqual(poly.area(), 12.0)
+
     def test_quadrilateral_area(self):
         """测试四边形面积"""
         quad = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
@@ -269,6 +456,15 @@ class TestPolygonBounds(unittest.TestCase):
         bounds = quad.get_bounds()
         self.assertEqual(bounds, (0, 0, 4, 3))
 
+    def test_bounds_and_simple_refresh_on_reassign(self):
+        """测试重新赋值顶点后边界框与简单性缓存刷新"""
+        quad = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
+        self.assertEqual(quad.get_bounds(), (0, 0, 4, 3))
+        self.assertTrue(quad.is_simple())
+        quad.vertices = [Point2D(0, 0), Point2D(2, 2), Point2D(2, -1), Point2D(0, 2)]
+        self.assertEqual(quad.get_bounds(), (0, -1, 2, 2))
+        self.assertFalse(quad.is_simple())
+
 
 class TestPolygonCenter(unittest.TestCase):
     """Polygon 中心测试"""
@@ -280,6 +476,17 @@ class TestPolygonCenter(unittest.TestCase):
         self.assertEqual(center.x, 2.0)
         self.assertEqual(center.y, 1.5)
 
+    def test_center_and_regular_refresh_on_reassign(self):
+        """测试中心与正则性缓存在重新赋值顶点后刷新，修改返回的中心点不影响缓存"""
+        poly = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 4), Point2D(0, 4)])
+        self.assertTrue(poly.is_regular())
+        center = poly.get_center()
+        center.x = 100.0
+        self.assertEqual(poly.get_center().x, 2.0)
+        poly.vertices = [Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)]
+        self.assertFalse(poly.is_regular())
+        self.assertEqual(poly.get_center().y, 1.5)
+
 
 class TestPolygonContains(unittest.TestCase):
     """Polygon 点包含测试"""
@@ -300,6 +507,180 @@ class TestPolygonContains(unittest.TestCase):
         quad = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
         self.assertTrue(quad.contains_point(Point2D(2, 0)))
 
+    def test_contains_points_batch(self):
+        """测试批量点包含与逐点结果一致"""
+        concave = Polygon(
+            [Point2D(0, 0), Point2D(4, 0), Point2D(2, 1), Point2D(4, 4), Point2D(0, 4)]
+        )
+        points = [Point2D(1, 1), Point2D(3, 1), Point2D(2, 0), Point2D(5, 5), Point2D(0, 2)]
+        expected = [concave.contains_point(p) for p in points]
+        self.assertEqual(concave.contains_points(points), expected)
+        self.assertEqual(expected, [True, False, True, False, True])
+
+    def test_contains_points_near_bounds(self):
+        """测试凹多边形批量判定在包围盒附近与逐点结果一致"""
+        concave = Polygon(
+            [Point2D(0, 0), Point2D(4, 0), Point2D(2, 1), Point2D(4, 4), Point2D(0, 4)]
+        )
+        points = [Point2D(-5e-7, 2), Point2D(-1e-3, 2), Point2D(2, 4 + 5e-7), Point2D(100, 100)]
+        expected = [concave.contains_point(p) for p in points]
+        self.assertEqual(concave.contains_points(points), expected)
+        self.assertEqual(expected, [True, False, True, False])
+
+    def test_concave_horizontal_edges_contains(self):
+        """测试射线与水平边共线、穿过顶点时的凹多边形点包含"""
+        stair = Polygon(
+            [
+                Point2D(0, 0),
+                Point2D(4, 0),
+                Point2D(4, 2),
+                Point2D(2, 2),
+                Point2D(2, 4),
+                Point2D(0, 4),
+            ]
+        )
+        self.assertTrue(stair.contains_point(Point2D(1, 2)))
+        self.assertTrue(stair.contains_point(Point2D(1, 3)))
+        self.assertFalse(stair.contains_point(Point2D(3, 3)))
+        self.assertFalse(stair.contains_point(Point2D(-1, 2)))
+
+    def test_comb_many_vertices_contains(self):
+        """测试顶点较多的梳形多边形（使用分带边索引）的点包含"""
+        points = [Point2D(0, 0), Point2D(40, 0)]
+        for i in range(20, 0, -1):
+            points += [
+                Point2D(2 * i, 10),
+                Point2D(2 * i - 1, 10),
+                Point2D(2 * i - 1, 1),
+                Point2D(2 * i - 2, 1),
+            ]
+        comb = Polygon(points)
+        self.assertGreaterEqual(len(comb.vertices), 32)
+        self.assertFalse(comb.is_convex())
+        queries = [
+            Point2D(1.5, 5),
+            Point2D(2.5, 5),
+            Point2D(2.5, 0.5),
+            Point2D(3, 5),
+            Point2D(41, 5),
+        ]
+        expected = [True, False, True, True, False]
+        self.assertEqual([comb.contains_point(q) for q in queries], expected)
+        self.assertEqual(comb.contains_points(queries), expected)
+        comb.vertices = points[:4]
+        self.assertFalse(comb.contains_point(Point2D(1.5, 5)))
+
+    def test_small_concave_contains(self):
+        """测试转向叉积低于容差的小尺度凹多边形不走凸多边形快速路径"""
+        l_shape = Polygon(
+            [
+                Point2D(0, 0),
+                Point2D(2e-3, 0),
+                Point2D(2e-3, 1e-3),
+                Point2D(1e-3, 1e-3),
+                Point2D(1e-3, 2e-3),
+                Point2D(0, 2e-3),
+            ]
+        )
+        queries = [Point2D(0.5e-3, 1.5e-3), Point2D(1.5e-3, 0.5e-3), Point2D(1.5e-3, 1.5e-3)]
+        expected = [True, True, False]
+        self.assertEqual([l_shape.contains_point(q) for q in queries], expected)
+        self.assertEqual(l_shape.contains_points(queries), expected)
+        self.assertEqual(Polygon.point_in_polygons([l_shape], queries[0]), [True])
+
+    def test_short_reflex_edge_contains(self):
+        """测试凹顶点两侧边很短的多边形点包含"""
+        notched = Polygon(
+            [
+                Point2D(0, 0),
+                Point2D(1, 0),
+                Point2D(0.5005, 0.4995),
+                Point2D(0.5, 0.4998),
+                Point2D(0.4995, 0.5005),
+                Point2D(0, 1),
+            ]
+        )
+        self.assertTrue(notched.contains_point(Point2D(0.7, 0.25)))
+        self.assertTrue(notched.contains_point(Point2D(0.25, 0.25)))
+        self.assertFalse(notched.contains_point(Point2D(0.7, 0.7)))
+        self.assertEqual(notched.contains_points([Point2D(0.7, 0.25)]), [True])
+
+    def test_point_in_polygons(self):
+        """测试同一点对多个（凸与凹）多边形的批量包含判断"""
+        stair = Polygon(
+            [
+                Point2D(0, 0),
+                Point2D(4, 0),
+                Point2D(4, 2),
+                Point2D(2, 2),
+                Point2D(2, 4),
+                Point2D(0, 4),
+            ]
+        )
+        polygons = [Polygon.regular(4, Point2D(i, 0), 1.0) for i in range(3)] + [stair]
+        point = Point2D(0.2, 0)
+        expected = [polygon.contains_point(point) for polygon in polygons]
+        self.assertEqual(Polygon.point_in_polygons(polygons, point), expected)
+        self.assertEqual(expected, [True, True, False, True])
+
+    def test_concave_boundary_inside_bounds(self):
+        """测试凹多边形包围盒内、凹口处边界与顶点附近的点"""
+        stair = Polygon(
+            [
+                Point2D(0, 0),
+                Point2D(4, 0),
+                Point2D(4, 2),
+                Point2D(2, 2),
+                Point2D(2, 4),
+                Point2D(0, 4),
+            ]
+        )
+        tol = stair.TOLERANCE
+        self.assertTrue(stair.contains_point(Point2D(3, 2 + tol / 2)))
+        self.assertTrue(stair.contains_point(Point2D(2 + tol / 2, 3)))
+        self.assertTrue(stair.contains_point(Point2D(2 + tol / 2, 2 + tol / 2)))
+        self.assertFalse(stair.contains_point(Point2D(2 + 1e-3, 2 + 1e-3)))
+
+    def test_concave_contains_at_bounds_tolerance(self):
+        """测试凹多边形在包围盒边缘容差内外的单点包含"""
+        stair = Polygon(
+            [
+                Point2D(0, 0),
+                Point2D(4, 0),
+                Point2D(4, 2),
+                Point2D(2, 2),
+                Point2D(2, 4),
+                Point2D(0, 4),
+            ]
+        )
+        tol = stair.TOLERANCE
+        self.assertTrue(stair.contains_point(Point2D(4 + tol / 2, 1)))
+        self.assertTrue(stair.contains_point(Point2D(1, -tol / 2)))
+        self.assertFalse(stair.contains_point(Point2D(4 + 1e-3, 1)))
+        self.assertFalse(stair.contains_point(Point2D(100, 100)))
+
+    def test_clockwise_convex_contains(self):
+        """测试顺时针凸多边形点包含"""
+        quad = Polygon([Point2D(0, 3), Point2D(4, 3), Point2D(4, 0), Point2D(0, 0)])
+        self.assertTrue(quad.contains_point(Point2D(2, 1.5)))
+        self.assertTrue(quad.contains_point(Point2D(4, 1)))
+        self.assertFalse(quad.contains_point(Point2D(4.1, 1)))
+
+    def test_star_contains(self):
+        """测试转向一致的自交五角星（中心区域在奇偶规则下为外部）"""
+        star = Polygon(
+            [Point2D(math.cos(i * 0.8 * math.pi), math.sin(i * 0.8 * math.pi)) for i in range(5)]
+        )
+        self.assertFalse(star.contains_point(Point2D(0, 0)))
+        self.assertTrue(star.contains_point(Point2D(0.7, 0)))
+
+    def test_contains_refresh_on_reassign(self):
+        """测试重新赋值顶点后点包含结果刷新"""
+        quad = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
+        self.assertTrue(quad.contains_point(Point2D(2, 1)))
+        quad.vertices = [Point2D(10, 10), Point2D(11, 10), Point2D(11, 11)]
+        self.assertFalse(quad.contains_point(Point2D(2, 1)))
+
 
 class TestPolygonConvex(unittest.TestCase):
     """Polygon 凸性测试"""
@@ -321,6 +702,19 @@ class TestPolygonConvex(unittest.TestCase):
         )
         self.assertFalse(concave.is_convex())
 
+    def test_convexity_shared_with_contains(self):
+        """测试点包含与凸性判断共用缓存后结果不受调用顺序影响"""
+        verts = [Point2D(0, 0), Point2D(4, 0), Point2D(2, 1), Point2D(4, 4), Point2D(0, 4)]
+        first = Polygon(verts)
+        self.assertFalse(first.contains_point(Point2D(3, 1)))
+        self.assertFalse(first.is_convex())
+        second = Polygon(verts)
+        self.assertFalse(second.is_convex())
+        self.assertTrue(second.contains_point(Point2D(1, 1)))
+        square = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 4), Point2D(0, 4)])
+        self.assertTrue(square.contains_point(Point2D(4, 2)))
+        self.assertTrue(square.is_convex())
+
 
 class TestPolygonSimple(unittest.TestCase):
     """Polygon 简单性测试"""
@@ -330,6 +724,32 @@ class TestPolygonSimple(unittest.TestCase):
         quad = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
         self.assertTrue(quad.is_simple())
 
+    def test_self_intersecting_polygon(self):
+        """测试自交多边形（蝴蝶形）"""
+        bowtie = Polygon([Point2D(0, 0), Point2D(2, 2), Point2D(2, 0), Point2D(0, 2)])
+        self.assertFalse(bowtie.is_simple())
+
+    def test_many_vertices_simple(self):
+        """测试多顶点星形多边形及交换两顶点造成自交"""
+        n = 60
+        points = [
+            Point2D(
+                math.cos(2 * math.pi * i / n) * (1 + 0.3 * (i % 2)),
+                math.sin(2 * math.pi * i / n) * (1 + 0.3 * (i % 2)),
+            )
+            for i in range(n)
+        ]
+        self.assertTrue(Polygon(points).is_simple())
+        points[10], points[40] = points[40], points[10]
+        self.assertFalse(Polygon(points).is_simple())
+
+    def test_vertex_touching_edge_not_simple(self):
+        """测试顶点落在非相邻边上（端点接触）视为自交"""
+        touching = Polygon(
+            [Point2D(0, 0), Point2D(4, 0), Point2D(4, 4), Point2D(2, 0), Point2D(0, 4)]
+        )
+        self.assertFalse(touching.is_simple())
+
 
 class TestPolygonRegular(unittest.TestCase):
     """Polygon 正则性测试"""
@@ -344,6 +764,17 @@ class TestPolygonRegular(unittest.TestCase):
         quad = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
         self.assertFalse(quad.is_regular())
 
+    def test_last_vertex_perturbed_not_regular(self):
+        """测试仅最后一个顶点偏离时（首尾相接处）判为非正多边形"""
+        points = Polygon.regular(5, Point2D(0, 0), 1.0).vertices
+        points[-1] = Point2D(points[-1].x * 1.01, points[-1].y * 1.01)
+        self.assertFalse(Polygon(points).is_regular())
+
+    def test_rhombus_not_regular(self):
+        """测试等边但内角不等的菱形"""
+        rhombus = Polygon([Point2D(0, 0), Point2D(2, -1), Point2D(4, 0), Point2D(2, 1)])
+        self.assertFalse(rhombus.is_regular())
+
 
 class TestPolygonVertexEdge(unittest.TestCase):
     """Polygon 顶点和边测试"""
@@ -374,6 +805,21 @@ class TestPolygonVertexEdge(unittest.TestCase):
         self.assertEqual(edge[0], Point2D(0, 0))
         self.assertEqual(edge[1], Point2D(3, 0))
 
+    def test_get_edge_wraps(self):
+        """测试最后一条边、负索引与越界索引的边回绕到首顶点"""
+        tri = Polygon([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
+        closing = (Point2D(0, 4), Point2D(0, 0))
+        self.assertEqual(tri.get_edge(2), closing)
+        self.assertEqual(tri.get_edge(-1), closing)
+        self.assertEqual(tri.get_edge(5), closing)
+        self.assertEqual(tri.get_edge(4), tri.get_edges()[1])
+
+    def test_iter_edges(self):
+        """测试边迭代器与 get_edges 顺序一致"""
+        quad = Polygon([Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)])
+        self.assertEqual(list(quad.iter_edges()), quad.get_edges())
+        self.assertEqual(quad.get_edges()[-1], (Point2D(0, 3), Point2D(0, 0)))
+
 
 class TestPolygonConvexHull(unittest.TestCase):
     """Polygon 凸包测试"""
@@ -385,6 +831,34 @@ class TestPolygonConvexHull(unittest.TestCase):
         hull = poly.get_convex_hull()
         self.assertEqual(hull.get_vertex_count(), 3)
 
+    def test_convex_hull_drops_interior_and_collinear(self):
+        """测试凸包去掉内部点与边上共线点，并按逆时针排列"""
+        poly = Polygon(
+            [
+                Point2D(0, 0),
+                Point2D(2, 0),
+                Point2D(4, 0),
+                Point2D(1, 1),
+                Point2D(4, 3),
+                Point2D(0, 3),
+            ]
+        )
+        hull = poly.get_convex_hull()
+        self.assertEqual(
+            hull.vertices, [Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)]
+        )
+        self.assertAlmostEqual(hull.area(), 12.0)
+
+    def test_convex_hull_many_points(self):
+        """测试大量内部点与边上点的凸包（触发内部点预过滤）"""
+        points = [Point2D(0.1 + 0.08 * i, 0.1 + 0.08 * j) for i in range(10) for j in range(10)]
+        points += [Point2D(i, 0) for i in range(5)] + [Point2D(4, j) for j in range(1, 4)]
+        points += [Point2D(0, 3), Point2D(2, 3), Point2D(0, 1)]
+        hull = Polygon(points).get_convex_hull()
+        self.assertEqual(
+            hull.vertices, [Point2D(0, 0), Point2D(4, 0), Point2D(4, 3), Point2D(0, 3)]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
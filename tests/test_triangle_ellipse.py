@@ -31,6 +31,14 @@ class TestTriangleCreation(unittest.TestCase):
         tri = Triangle.from_sides(3.0, 4.0, 5.0)
         self.assertIsNotNone(tri)
 
+    def test_from_sides_matches_given_sides(self):
+        """测试从边长创建的三角形边长与输入一致且为逆时针"""
+        for sides in [(3.0, 4.0, 5.0), (5.0, 3.0, 4.0), (2.0, 3.0, 4.0)]:
+            tri = Triangle.from_sides(*sides)
+            for got, expected in zip(tri.get_side_lengths(), sides, strict=True):
+                self.assertAlmostEqual(got, expected)
+            self.assertGreater(tri.vertices[2].y, 0)
+
     def test_invalid_sides(self):
         """测试无效边长"""
         with self.assertRaises(ValueError):
@@ -41,6 +49,12 @@ class TestTriangleCreation(unittest.TestCase):
         with self.assertRaises(ValueError):
             Triangle([Point2D(0, 0), Point2D(1, 0)])
 
+    def test_no_instance_dict(self):
+        """测试三角形实例使用 __slots__，不带 __dict__"""
+        tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
+        tri.compute_all_centers()
+        self.assertFalse(hasattr(tri, "__dict__"))
+
 
 class TestTriangleArea(unittest.TestCase):
     """Triangle 面积测试"""
@@ -50,11 +64,25 @@ class TestTriangleArea(unittest.TestCase):
         tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
         self.assertEqual(tri.area(), 6.0)
 
+    def test_clockwise_area_and_circumcenter(self):
+        """测试顺时针顶点的面积与外心和逆时针一致，且重新赋值后刷新"""
+        tri = Triangle([Point2D(0, 0), Point2D(0, 4), Point2D(3, 0)])
+        self.assertEqual(tri.area(), 6.0)
+        self.assertEqual(tri.circumcenter(), Point2D(1.5, 2))
+        tri.vertices = [Point2D(0, 0), Point2D(0, 2), Point2D(2, 0)]
+        self.assertEqual(tri.area(), 2.0)
+        self.assertEqual(tri.circumcenter(), Point2D(1, 1))
+
     def test_from_sides_area(self):
         """测试从边长创建的三角形面积"""
         tri = Triangle.from_sides(3.0, 4.0, 5.0)
         self.assertAlmostEqual(tri.area(), 6.0)
 
+    def test_from_sides_needle_area(self):
+        """测试针状三角形面积不受相消误差影响"""
+        tri = Triangle.from_sides(1e5, 1e5, 0.0013)
+        self.assertAlmostEqual(tri.area(), 65.0, places=9)
+
 
 class TestTriangleSideLengths(unittest.TestCase):
     """Triangle 边长测试"""
@@ -67,6 +95,41 @@ class TestTriangleSideLengths(unittest.TestCase):
         self.assertEqual(b, 5.0)
         self.assertEqual(c, 4.0)
 
+    def test_get_side_lengths_sq(self):
+        """测试边长平方与边长顺序一致"""
+        tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
+        self.assertEqual(tri.get_side_lengths_sq(), (9.0, 25.0, 16.0))
+
+    def test_side_lengths_refresh_on_reassign(self):
+        """测试重新赋值顶点后边长缓存失效"""
+        tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
+        tri.get_side_lengths()
+        tri.get_angles()
+        tri.vertices = [Point2D(0, 0), Point2D(1, 0), Point2D(0.5, math.sqrt(3) / 2)]
+        self.assertAlmostEqual(tri.get_side_lengths()[0], 1.0)
+        self.assertTrue(all(abs(angle - 60.0) < 1e-6 for angle in tri.get_angles()))
+
+    def test_perimeter_refresh_on_reassign(self):
+        """测试周长等于边长之和且重新赋值后刷新"""
+        tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
+        self.assertEqual(tri.perimeter(), 12.0)
+        tri.vertices = [Point2D(0, 0), Point2D(1, 0), Point2D(0, 1)]
+        self.assertAlmostEqual(tri.perimeter(), 2 + math.sqrt(2))
+
+    def test_centers_refresh_on_reassign(self):
+        """测试外心、内心、垂心与直角判断在重新赋值后刷新"""
+        tri = Triangle([Point2D(0, 0), Point2D(4, 0), Point2D(0, 4)])
+        self.assertEqual(tri.circumcenter(), Point2D(2, 2))
+        tri.orthocenter()
+        tri.incenter()
+        self.assertTrue(tri.is_right_angled())
+        tri.vertices = [Point2D(0, 0), Point2D(4, 0), Point2D(2, 6)]
+        self.assertFalse(tri.is_right_angled())
+        self.assertEqual(tri.circumcenter(), Point2D(2, 8 / 3))
+        fresh = Triangle([Point2D(0, 0), Point2D(4, 0), Point2D(2, 6)])
+        self.assertEqual(tri.orthocenter(), fresh.orthocenter())
+        self.assertEqual(tri.incenter(), fresh.incenter())
+
 
 class TestTriangleAngles(unittest.TestCase):
     """Triangle 角度测试"""
@@ -85,6 +148,26 @@ class TestTriangleAngles(unittest.TestCase):
         angles = tri.get_angles()
         self.assertAlmostEqual(sum(angles), 180.0)
 
+    def test_near_degenerate_angles(self):
+        """测试接近共线时的小角仍然准确"""
+        tri = Triangle([Point2D(0, 0), Point2D(1, 0), Point2D(0.5, 1e-9)])
+        A, B, C = tri.get_angles()
+        expected = math.degrees(math.atan(2e-9))
+        self.assertAlmostEqual(B / expected, 1.0, places=9)
+        self.assertAlmostEqual(C / expected, 1.0, places=9)
+        self.assertAlmostEqual(A + B + C, 180.0)
+
+    def test_angles_of(self):
+        """测试批量内角与逐个计算一致"""
+        tris = [
+            Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)]),
+            Triangle([Point2D(0, 0), Point2D(4, 0), Point2D(1, 3)]),
+        ]
+        batch = Triangle.angles_of(tris)
+        fresh = [Triangle(list(tri.vertices)).get_angles() for tri in tris]
+        self.assertEqual(batch, fresh)
+        self.assertEqual(batch, [tri.get_angles() for tri in tris])
+
 
 class TestTriangleCenters(unittest.TestCase):
     """Triangle 中心点测试"""
@@ -101,18 +184,74 @@ class TestTriangleCenters(unittest.TestCase):
         incenter = tri.incenter()
         self.assertIsInstance(incenter, Point2D)
 
+    def test_incenter_equidistant_from_sides(self):
+        """测试内心到三条边的距离都等于内切圆半径"""
+        tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
+        incenter = tri.incenter()
+        self.assertAlmostEqual(incenter.x, 1.0)
+        self.assertAlmostEqual(incenter.y, 1.0)
+        tri = Triangle([Point2D(2, 1), Point2D(7, 2), Point2D(3, 6)])
+        incenter = tri.incenter()
+        r = tri.inradius()
+        for p, q in tri.iter_edges():
+            cross = (q.x - p.x) * (incenter.y - p.y) - (q.y - p.y) * (incenter.x - p.x)
+            self.assertAlmostEqual(abs(cross) / p.distance_to(q), r)
+
     def test_orthocenter(self):
         """测试垂心"""
         tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
         ortho = tri.orthocenter()
         self.assertIsInstance(ortho, Point2D)
 
+    def test_orthocenter_at_right_angle_vertex(self):
+        """测试直角三角形垂心位于直角顶点、钝角三角形垂心在外部"""
+        tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
+        ortho = tri.orthocenter()
+        self.assertAlmostEqual(ortho.x, 0.0)
+        self.assertAlmostEqual(ortho.y, 0.0)
+        tri = Triangle([Point2D(0, 0), Point2D(4, 0), Point2D(1, 1)])
+        ortho = tri.orthocenter()
+        self.assertAlmostEqual(ortho.x, 1.0)
+        self.assertAlmostEqual(ortho.y, 3.0)
+
+    def test_compute_all_centers(self):
+        """测试一次获取全部中心与半径"""
+        tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
+        G, O, H, I, R, r = tri.compute_all_centers()
+        self.assertEqual(G, tri.centroid())
+        self.assertEqual(O, Point2D(1.5, 2))
+        self.assertEqual(H, tri.orthocenter())
+        self.assertEqual(I, tri.incenter())
+        self.assertAlmostEqual(R, 2.5)
+        self.assertEqual(r, 1.0)
+
     def test_centroid(self):
         """测试重心"""
         tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
         centroid = tri.centroid()
         self.assertIsInstance(centroid, Point2D)
 
+    def test_circumcenters_of(self):
+        """测试批量外心与逐个计算一致（含共线退化）"""
+        tris = [
+            Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)]),
+            Triangle([Point2D(0, 0), Point2D(1, 1), Point2D(2, 2)]),
+        ]
+        centers = Triangle.circumcenters_of(tris)
+        self.assertEqual(len(centers), 2)
+        self.assertEqual(centers[0], Point2D(1.5, 2))
+        for tri, center in zip(tris, centers, strict=True):
+            self.assertEqual(center, tri.circumcenter())
+
+    def test_circumcenters_from_coords(self):
+        """测试直接从坐标批量计算外心（含共线退化）"""
+        mesh = [((0, 0), (3, 0), (0, 4)), ((0, 0), (1, 1), (2, 2))]
+        centers = Triangle.circumcenters_from_coords(mesh)
+        self.assertEqual(centers[0], (1.5, 2.0))
+        for xy, (x, y) in zip(mesh, centers, strict=True):
+            tri = Triangle([Point2D(px, py) for px, py in xy])
+            self.assertEqual(Point2D(x, y), tri.circumcenter())
+
 
 class TestTriangleRadius(unittest.TestCase):
     """Triangle 半径测试"""
@@ -127,6 +266,15 @@ class TestTriangleRadius(unittest.TestCase):
         tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
         self.assertEqual(tri.inradius(), 1.0)
 
+    def test_radii_refresh_on_reassign(self):
+        """测试外接圆、内切圆半径复用面积与周长缓存，重新赋值后刷新"""
+        tri = Triangle([Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)])
+        self.assertEqual(tri.inradius(), 1.0)
+        tri.circumradius()
+        tri.vertices = [Point2D(0, 0), Point2D(6, 0), Point2D(0, 8)]
+        self.assertEqual(tri.inradius(), 2.0)
+        self.assertAlmostEqual(tri.circumradius(), 5.0)
+
 
 class TestTriangleType(unittest.TestCase):
     """Triangle 类型判断测试"""
@@ -141,6 +289,13 @@ class TestTriangleType(unittest.TestCase):
         tri = Triangle([Point2D(0, 0), Point2D(4, 0), Point2D(1, 3)])
         self.assertFalse(tri.is_right_angled())
 
+    def test_right_angled_any_hypotenuse_position(self):
+        """测试斜边位于任意一条边时都能识别直角"""
+        pts = [Point2D(0, 0), Point2D(3, 0), Point2D(0, 4)]
+        for k in range(3):
+            tri = Triangle(pts[k:] + pts[:k])
+            self.assertTrue(tri.is_right_angled())
+
     def test_equilateral(self):
         """测试等边三角形"""
         tri = Triangle([Point2D(0, 0), Point2D(1, 0), Point2D(0.5, math.sqrt(3) / 2)])
@@ -180,6 +335,11 @@ class TestEllipseCreation(unittest.TestCase):
         self.assertEqual(ellipse.semi_major, 5.0)
         self.assertEqual(ellipse.semi_minor, 3.0)
 
+    def test_tiny_axes(self):
+        """测试半轴平方下溢为 0 时仍可创建"""
+        ellipse = Ellipse(Point2D(0, 0), 1e-170, 1e-170)
+        self.assertEqual(ellipse.area(), 0.0)
+
     def test_from_center_and_axes(self):
         """测试工厂方法"""
         ellipse = Ellipse.from_center_and_axes(Point2D(0, 0), 10.0, 6.0)
@@ -193,6 +353,16 @@ class TestEllipseCreation(unittest.TestCase):
         )
         self.assertIsNotNone(ellipse)
 
+    def test_from_foci_rotated(self):
+        """测试从倾斜焦点创建后旋转角与焦点一致"""
+        ellipse = Ellipse.from_foci_and_point(Point2D(0, 0), Point2D(3, 4), Point2D(-1, 0))
+        self.assertAlmostEqual(ellipse.rotation, math.degrees(math.atan2(4, 3)))
+        f1, f2 = ellipse.foci()
+        self.assertAlmostEqual(f1.x, 0.0)
+        self.assertAlmostEqual(f1.y, 0.0)
+        self.assertAlmostEqual(f2.x, 3.0)
+        self.assertAlmostEqual(f2.y, 4.0)
+
     def test_invalid_semi_axis(self):
         """测试无效半轴"""
         with self.assertRaises(ValueError):
@@ -217,6 +387,13 @@ class TestEllipseArea(unittest.TestCase):
         circle = Ellipse(Point2D(0, 0), 5.0, 5.0)
         self.assertAlmostEqual(circle.area(), 25 * math.pi)
 
+    def test_area_refresh_on_reassign(self):
+        """测试轴长重新赋值后面积缓存刷新"""
+        ellipse = Ellipse(Point2D(0, 0), 5.0, 3.0)
+        self.assertAlmostEqual(ellipse.area(), 15 * math.pi)
+        ellipse.semi_minor = 1.0
+        self.assertAlmostEqual(ellipse.area(), 5 * math.pi)
+
 
 class TestEllipsePerimeter(unittest.TestCase):
     """Ellipse 周长测试"""
@@ -228,6 +405,15 @@ class TestEllipsePerimeter(unittest.TestCase):
         self.assertGreater(perimeter, 0)
         self.assertLess(perimeter, 2 * math.pi * 5)
 
+    def test_perimeters_batch(self):
+        """测试批量周长与逐个计算一致"""
+        axes = [(5.0, 3.0), (2.0, 2.0), (0.0, 0.0)]
+        expected = [Ellipse(Point2D(0, 0), a, b).perimeter() for a, b in axes]
+        result = Ellipse.perimeters([a for a, _ in axes], [b for _, b in axes])
+        self.assertEqual(result, expected)
+        self.assertAlmostEqual(result[1], 4 * math.pi)
+        self.assertEqual(result[2], 0.0)
+
 
 class TestEllipseEccentricity(unittest.TestCase):
     """Ellipse 离心率测试"""
@@ -263,6 +449,14 @@ class TestEllipseFocal(unittest.TestCase):
         self.assertAlmostEqual(f2.x, 4.0)
         self.assertAlmostEqual(f2.y, 0.0)
 
+    def test_focal_refresh_on_axis_change(self):
+        """测试修改轴长后焦距与离心率刷新"""
+        ellipse = Ellipse(Point2D(0, 0), 5.0, 3.0)
+        self.assertAlmostEqual(ellipse.eccentricity(), 0.8)
+        ellipse.semi_minor = 4.0
+        self.assertAlmostEqual(ellipse.focal_distance(), 3.0)
+        self.assertAlmostEqual(ellipse.eccentricity(), 0.6)
+
 
 class TestEllipseBounds(unittest.TestCase):
     """Ellipse 边界测试"""
@@ -276,6 +470,47 @@ class TestEllipseBounds(unittest.TestCase):
         self.assertEqual(bounds[2], 5.0)
         self.assertEqual(bounds[3], 3.0)
 
+    def test_get_bounds_rotated_tight(self):
+        """测试旋转椭圆的紧致边界框"""
+        ellipse = Ellipse(Point2D(1, 2), 5.0, 3.0, 90.0)
+        bounds = ellipse.get_bounds()
+        self.assertAlmostEqual(bounds[0], -2.0)
+        self.assertAlmostEqual(bounds[1], -3.0)
+        self.assertAlmostEqual(bounds[2], 4.0)
+        self.assertAlmostEqual(bounds[3], 7.0)
+
+        ellipse = Ellipse(Point2D(0, 0), 5.0, 3.0, 45.0)
+        half = math.sqrt((25.0 + 9.0) / 2.0)
+        self.assertAlmostEqual(ellipse.get_bounds()[2], half)
+        self.assertAlmostEqual(ellipse.get_bounds()[3], half)
+
+    def test_get_bounds_half_turns(self):
+        """测试 180° 整数倍旋转走轴对齐路径"""
+        for rotation in (180.0, -180.0, 360.0):
+            ellipse = Ellipse(Point2D(0, 0), 5.0, 3.0, rotation)
+            self.assertEqual(ellipse.get_bounds(), (-5.0, -3.0, 5.0, 3.0))
+
+    def test_get_bounds_quarter_turns(self):
+        """测试 90°、270° 旋转时长短轴互换且端点坐标精确"""
+        for rotation in (90.0, 270.0, -90.0):
+            ellipse = Ellipse(Point2D(0, 0), 5.0, 3.0, rotation)
+            self.assertEqual(ellipse.get_bounds(), (-3.0, -5.0, 3.0, 5.0))
+        ellipse = Ellipse(Point2D(0, 0), 5.0, 3.0, 89.99999999)
+        for got, expected in zip(ellipse.get_bounds(), (-3.0, -5.0, 3.0, 5.0), strict=True):
+            self.assertAlmostEqual(got, expected)
+
+    def test_get_bounds_near_axis_contains_ellipse(self):
+        """测试接近轴对齐的细长椭圆包围盒仍包含长轴端点"""
+        for rotation in (5e-5, 90.0 + 5e-5):
+            ellipse = Ellipse(Point2D(0, 0), 1e6, 0.0, rotation)
+            x_min, y_min, x_max, y_max = ellipse.get_bounds()
+            x1, y1, x2, y2 = ellipse.major_axis_xy()
+            for x, y in ((x1, y1), (x2, y2)):
+                self.assertTrue(x_min <= x <= x_max)
+                self.assertTrue(y_min <= y <= y_max)
+        ellipse = Ellipse(Point2D(1, 2), 5.0, 3.0, 90.0)
+        self.assertEqual(ellipse.major_axis_xy(), (1.0, -3.0, 1.0, 7.0))
+
 
 class TestEllipseContains(unittest.TestCase):
     """Ellipse 点包含测试"""
@@ -300,6 +535,36 @@ class TestEllipseContains(unittest.TestCase):
         ellipse = Ellipse(Point2D(0, 0), 5.0, 3.0)
         self.assertFalse(ellipse.contains_point(Point2D(6, 0)))
 
+    def test_contains_points_batch(self):
+        """测试批量点包含与逐点结果一致"""
+        ellipse = Ellipse(Point2D(1, 1), 5.0, 3.0, 30.0)
+        points = [Point2D(1, 1), Point2D(5, 3), Point2D(1, 4.5), Point2D(-3, -1), Point2D(7, 1)]
+        expected = [ellipse.contains_point(p) for p in points]
+        self.assertEqual(ellipse.contains_points(points), expected)
+        self.assertEqual(expected, [True, True, False, True, False])
+
+    def test_contains_xy(self):
+        """测试浮点坐标版本与 contains_point 一致"""
+        ellipse = Ellipse(Point2D(1, 1), 5.0, 3.0, 30.0)
+        for x, y in ((1, 1), (5, 3), (1, 4.5), (7, 1)):
+            self.assertEqual(ellipse.contains_xy(x, y), ellipse.contains_point(Point2D(x, y)))
+
+    def test_contains_within_tolerance_past_extent(self):
+        """测试略超出包围盒但在容差内的点不被快速排除"""
+        ellipse = Ellipse(Point2D(1, 1), 5.0, 3.0, 90.0)
+        self.assertTrue(ellipse.contains_point(Point2D(1, 1 + 5.0 * (1 + 1e-7))))
+        self.assertFalse(ellipse.contains_point(Point2D(1, 1 + 5.0 * (1 + 1e-5))))
+        self.assertFalse(ellipse.contains_xy(100.0, 1.0))
+
+    def test_contains_refresh_on_reassign(self):
+        """测试修改旋转角与轴长后点包含结果刷新"""
+        ellipse = Ellipse(Point2D(0, 0), 5.0, 3.0)
+        self.assertFalse(ellipse.contains_point(Point2D(0, 4)))
+        ellipse.rotation = 90.0
+        self.assertTrue(ellipse.contains_point(Point2D(0, 4)))
+        ellipse.semi_major = 3.5
+        self.assertFalse(ellipse.contains_point(Point2D(0, 4)))
+
 
 class TestEllipseAxes(unittest.TestCase):
     """Ellipse 轴端点测试"""
@@ -318,6 +583,26 @@ class TestEllipseAxes(unittest.TestCase):
         self.assertAlmostEqual(end1.y, -3.0)
         self.assertAlmostEqual(end2.y, 3.0)
 
+    def test_axis_xy_matches_points(self):
+        """测试坐标版本与 Point2D 版本一致"""
+        ellipse = Ellipse(Point2D(1, 2), 5.0, 3.0, 30.0)
+        for xy, points in (
+            (ellipse.foci_xy(), ellipse.foci()),
+            (ellipse.major_axis_xy(), ellipse.get_major_axis_endpoints()),
+            (ellipse.minor_axis_xy(), ellipse.get_minor_axis_endpoints()),
+        ):
+            self.assertEqual(xy, points[0].to_tuple() + points[1].to_tuple())
+
+    def test_foci_array(self):
+        """测试批量焦点与逐个计算一致"""
+        ellipses = [Ellipse(Point2D(1, 2), 5.0, 3.0, 30.0), Ellipse(Point2D(0, 0), 2.0, 2.0)]
+        params = [
+            (e.center.x, e.center.y, e.focal_distance(), math.radians(e.rotation)) for e in ellipses
+        ]
+        for row, ellipse in zip(Ellipse.foci_array(params), ellipses, strict=True):
+            for got, want in zip(row, ellipse.foci_xy(), strict=True):
+                self.assertAlmostEqual(got, want)
+
 
 class TestEllipseEquals(unittest.TestCase):
     """Ellipse 相等测试"""
@@ -334,6 +619,19 @@ class TestEllipseEquals(unittest.TestCase):
         e2 = Ellipse(Point2D(1, 0), 5.0, 3.0)
         self.assertNotEqual(e1, e2)
 
+    def test_equals_batch(self):
+        """测试批量相等判断与逐个结果一致"""
+        e1 = Ellipse(Point2D(0, 0), 5.0, 3.0)
+        others = [
+            Ellipse(Point2D(0, 0), 5.0, 3.0),
+            Ellipse(Point2D(0, 0), 5.0, 3.0, 10.0),
+            Ellipse(Point2D(0, 0), 4.0, 3.0),
+            "not an ellipse",
+        ]
+        expected = [e1.equals(o) for o in others]
+        self.assertEqual(e1.equals_batch(others), expected)
+        self.assertEqual(expected, [True, False, False, False])
+
 
 class TestEllipseRotation(unittest.TestCase):
     """Ellipse 旋转测试"""